@@ -0,0 +1,174 @@
+"""
+Artefakt-Cache: Von ffmpeg/ffprobe erzeugte Dateien, adressiert nach Quelle + Parametern.
+
+Schlüssel ist ein Hash aus Datei-Identität der Quelle (absoluter Pfad, mtime,
+Größe), Art des Artefakts und den ffmpeg-Parametern (Stream-Index, Zeitpunkt,
+Optionen). Liegt ein passendes Artefakt im Cache, wird es an den Zielort
+kopiert statt ffmpeg zu starten. Der Cache liegt in .config/artifact_cache/
+und wird auf ARTIFACT_CACHE_MAX_MB begrenzt (zuletzt benutzte Einträge bleiben).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+from app.config import ARTIFACT_CACHE_MAX_MB
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = REPO_ROOT / ".config/artifact_cache"
+
+_cache_lock = threading.Lock()
+
+
+def artifact_key(source_path: str, kind: str, params: Iterable = ()) -> Optional[str]:
+    """
+    Bildet den Cache-Schlüssel für ein Artefakt.
+
+    Args:
+        source_path: Quelldatei (Video)
+        kind: Art des Artefakts (z.B. "srt", "thumbnail", "probe")
+        params: Parameter, die das Ergebnis beeinflussen (Stream-Index, Zeitpunkt, ffmpeg-Optionen)
+
+    Returns:
+        Hex-Schlüssel oder None, wenn die Quelle nicht lesbar ist
+    """
+    try:
+        stat = os.stat(source_path)
+    except OSError:
+        return None
+
+    parts = [os.path.abspath(source_path), str(stat.st_mtime_ns), str(stat.st_size), kind]
+    parts.extend(str(param) for param in params)
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _entry_path(key: str, suffix: str) -> Path:
+    return CACHE_DIR / key[:2] / f"{key}{suffix}"
+
+
+def lookup(key: Optional[str], suffix: str) -> Optional[Path]:
+    """
+    Sucht ein Artefakt im Cache und markiert es als benutzt.
+
+    Returns:
+        Pfad im Cache oder None
+    """
+    if key is None:
+        return None
+
+    path = _entry_path(key, suffix)
+    try:
+        if path.stat().st_size <= 0:
+            return None
+        os.utime(path)  # LRU: Zugriffszeitpunkt über mtime
+    except OSError:
+        return None
+    return path
+
+
+def restore(key: Optional[str], suffix: str, output_path: str) -> bool:
+    """
+    Kopiert ein gecachtes Artefakt an den Zielort (ohne Kopie, falls dort bereits identisch).
+
+    Returns:
+        True wenn das Artefakt aus dem Cache stammt
+    """
+    cached = lookup(key, suffix)
+    if cached is None:
+        return False
+
+    try:
+        output = Path(output_path)
+        if not (output.exists() and output.stat().st_size == cached.stat().st_size):
+            tmp_path = output.with_name(output.name + ".tmp")
+            shutil.copyfile(cached, tmp_path)
+            tmp_path.replace(output)
+        return True
+    except OSError as e:
+        print(f"⚠ Artefakt-Cache: Kopieren nach {output_path} fehlgeschlagen: {e}")
+        return False
+
+
+def store(key: Optional[str], suffix: str, produced_path: str):
+    """Legt ein frisch erzeugtes Artefakt im Cache ab (Fehler werden nur protokolliert)."""
+    if key is None:
+        return
+
+    path = _entry_path(key, suffix)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+        shutil.copyfile(produced_path, tmp_path)
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"⚠ Artefakt-Cache: Speichern fehlgeschlagen: {e}")
+        return
+
+    evict()
+
+
+def store_bytes(key: Optional[str], suffix: str, data: bytes):
+    """Legt Daten (z.B. ffprobe-JSON) direkt im Cache ab."""
+    if key is None:
+        return
+
+    path = _entry_path(key, suffix)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+    except OSError as e:
+        print(f"⚠ Artefakt-Cache: Speichern fehlgeschlagen: {e}")
+        return
+
+    evict()
+
+
+def evict(max_bytes: Optional[int] = None):
+    """Löscht die am längsten nicht benutzten Einträge, bis der Cache unter der Grenze liegt."""
+    if max_bytes is None:
+        max_bytes = int(ARTIFACT_CACHE_MAX_MB * 1024 * 1024)
+
+    with _cache_lock:
+        entries = []
+        total = 0
+        try:
+            for bucket in os.scandir(CACHE_DIR):
+                if not bucket.is_dir():
+                    continue
+                for entry in os.scandir(bucket.path):
+                    if entry.name.endswith(".tmp"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= max_bytes:
+            return
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            if total <= max_bytes:
+                break
+
+
+def clear_artifact_cache():
+    """Löscht den gesamten Artefakt-Cache."""
+    with _cache_lock:
+        shutil.rmtree(CACHE_DIR, ignore_errors=True)
@@ -6,23 +6,39 @@ from __future__ import annotations
 
 import threading
 import os
+import time
 import webbrowser
-from io import BytesIO
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 
 import requests
 import tkinter as tk
 from tkinter import filedialog, messagebox
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk
 from pathlib import Path
 
-from app.youtube_assets import fetch_uploaded_videos, update_video_metadata, upload_video_thumbnail, replace_video_file, delete_video
+from app.youtube_assets import (
+    fetch_uploaded_videos,
+    cached_uploaded_videos,
+    update_video_metadata,
+    upload_video_thumbnail,
+    replace_video_file,
+    delete_video,
+    update_videos_metadata_batch,
+    update_videos_status_flags_batch,
+    delete_videos_batch
+)
 from app.uploader import UploadError
 from app.config import CHANNEL_PUBLIC_URL, CHANNEL_STUDIO_URL
 from app.source_map import get_source_folder
-from app.svg_icons import load_upload_icon
+from app.svg_icons import overlay_layer, apply_overlay
+from app.virtual_list import VirtualList
+from app.image_cache import ImageCache, image_nbytes
+from app.remote_thumbnails import RemoteThumbnailCache
+
+# Größe der Link-/Upload-Icons auf Thumbnails (Pixel)
+THUMBNAIL_ICON_SIZE = 28
 
 
 class AssetManagerWindow(tk.Toplevel):
@@ -37,8 +53,11 @@ class AssetManagerWindow(tk.Toplevel):
         self.minsize(700, 550)
         self.protocol("WM_DELETE_WINDOW", self._on_close)
 
-        self.thumbnail_cache: Dict[str, ImageTk.PhotoImage] = {}
+        self.thumbnail_cache = ImageCache()  # PhotoImage mit Icons, nach URL
+        self.thumbnail_store = RemoteThumbnailCache()  # Plattencache + Download-Pool
+        self._thumbnails_valid_after = 0.0  # Früher geprüfte Thumbnails werden revalidiert
         self.accordion_items: List[Dict[str, Any]] = []
+        self._asset_groups: List[Tuple[str, List[Dict[str, Any]]]] = []
 
         self._build_ui()
         self._load_assets()
@@ -61,7 +80,7 @@ class AssetManagerWindow(tk.Toplevel):
             toolbar,
             text="Aktualisieren",
             bootstyle=PRIMARY,
-            command=self._load_assets
+            command=self._reload_assets
         ).pack(side=LEFT, padx=10)
 
         ttk.Button(
@@ -94,29 +113,14 @@ class AssetManagerWindow(tk.Toplevel):
         container.columnconfigure(0, weight=1)
         container.rowconfigure(0, weight=1)
 
-        self.canvas = tk.Canvas(container, highlightthickness=0)
-        self.scrollbar = ttk.Scrollbar(container, orient=VERTICAL, command=self.canvas.yview)
-        self.canvas.configure(yscrollcommand=self.scrollbar.set)
-
-        self.scroll_frame = tk.Frame(self.canvas, bg="#f4f4f4")
-        self.scroll_frame.columnconfigure(0, weight=1)
-
-        self.canvas_window = self.canvas.create_window((0, 0), window=self.scroll_frame, anchor="nw")
-
-        # Scrollregion und Canvas-Breite synchronisieren
-        self.scroll_frame.bind("<Configure>", self._on_frame_configure)
-        self.canvas.bind("<Configure>", self._on_canvas_configure)
-
-        self.canvas.grid(row=0, column=0, sticky="nsew")
-        self.scrollbar.grid(row=0, column=1, sticky="ns")
-
-    def _on_frame_configure(self, event=None):
-        """Aktualisiert Scrollregion wenn sich Frame-Inhalt ändert."""
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-
-    def _on_canvas_configure(self, event):
-        """Passt scroll_frame-Breite an Canvas-Breite an."""
-        self.canvas.itemconfig(self.canvas_window, width=event.width)
+        # Virtualisierte Liste: Einträge nur für den sichtbaren Bereich (+ Puffer)
+        self.asset_list = VirtualList(
+            container,
+            create_row=self._create_asset_row,
+            estimated_row_height=150,
+            bg="#f4f4f4"
+        )
+        self.asset_list.grid(row=0, column=0, sticky="nsew")
 
     def _open_channel(self):
         """Öffnet öffentlichen Kanal im Browser."""
@@ -132,10 +136,10 @@ class AssetManagerWindow(tk.Toplevel):
 
         def worker():
             try:
-                videos = fetch_uploaded_videos(max_results=50)
+                videos = fetch_uploaded_videos()
                 self.after(0, lambda: self._generate_markdown_file(videos))
             except Exception as e:
-                self.after(0, lambda: self.status_label.config(text=f"Fehler: {e}"))
+                self.after(0, lambda msg=f"Fehler: {e}": self.status_label.config(text=msg))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -208,38 +212,79 @@ class AssetManagerWindow(tk.Toplevel):
             messagebox.showerror("Fehler", f"Export fehlgeschlagen:\n{e}")
             self.status_label.config(text="Export fehlgeschlagen")
 
-    def _load_assets(self):
-        """Startet Thread zum Abruf der YouTube-Daten."""
-        self.status_label.config(text="Lade Daten...")
-        self.thumbnail_cache.clear()
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-        threading.Thread(target=self._load_assets_worker, daemon=True).start()
+    def _load_assets(self, refresh_existing: bool = True):
+        """
+        Zeigt die Videos aus dem lokalen Inventar sofort an und synchronisiert im Hintergrund.
 
-    def _load_assets_worker(self):
+        Args:
+            refresh_existing: False = nur neue und geänderte Videos nachladen
+                              (nach eigenen Änderungen), True = vollständiger ETag-Abgleich
+        """
+        cached = cached_uploaded_videos()
+        self._clear_assets()
+        if cached:
+            self._render_assets(cached)
+            self.status_label.config(text=f"{len(cached)} Videos (Cache) – synchronisiere...")
+        else:
+            self.status_label.config(text="Lade Daten...")
+
+        cached_etags = [video.get("etag") for video in cached]
+        threading.Thread(
+            target=self._load_assets_worker,
+            args=(refresh_existing, cached_etags),
+            daemon=True
+        ).start()
+
+    def _reload_assets(self):
+        """Vollständiger Abgleich ("Aktualisieren"); Thumbnails werden dabei revalidiert."""
+        self._thumbnails_valid_after = time.time()
+        self._load_assets()
+
+    def _refresh_assets(self):
+        """Aktualisiert die Liste nach eigenen Änderungen (nur geänderte Videos neu laden)."""
+        self._load_assets(refresh_existing=False)
+
+    def _load_assets_worker(self, refresh_existing: bool, cached_etags: List[Optional[str]]):
         try:
-            videos = fetch_uploaded_videos(max_results=25)
-            self.after(0, lambda: self._render_assets(videos))
-            self.after(0, lambda: self.status_label.config(text=f"{len(videos)} Videos geladen"))
+            videos = fetch_uploaded_videos(refresh_existing=refresh_existing)
+            changed = [video.get("etag") for video in videos] != cached_etags
+            self.after(0, lambda: self._apply_synced_assets(videos, changed))
         except UploadError as e:
-            self.after(0, lambda: self.status_label.config(text=f"Fehler: {e}"))
+            self.after(0, lambda msg=f"Fehler: {e}": self.status_label.config(text=msg))
         except Exception as e:
-            self.after(0, lambda: self.status_label.config(text=f"Fehler: {e}"))
+            self.after(0, lambda msg=f"Fehler: {e}": self.status_label.config(text=msg))
+
+    def _apply_synced_assets(self, videos: List[Dict[str, Any]], changed: bool):
+        """Übernimmt das Sync-Ergebnis; neu gezeichnet wird nur bei Änderungen."""
+        if changed:
+            self._clear_assets()
+            self._render_assets(videos)
+        self.status_label.config(text=f"{len(videos)} Videos geladen")
+
+    def _clear_assets(self):
+        self._asset_groups = []
+        self.asset_list.set_count(0)
 
     def _render_assets(self, videos: List[Dict[str, Any]]):
-        """Erstellt Accordion-Einträge für jedes Video oder gruppiert nach Titel."""
+        """Legt Accordion-Einträge für jedes Video oder gruppiert nach Titel an (erzeugt werden nur sichtbare)."""
         # Gruppiere Videos nach Titel-Anfang
         groups = self._group_videos_by_title(videos)
-
-        idx = 0
-        for group_title, group_videos in groups.items():
-            if len(group_videos) == 1:
-                # Einzelnes Video → normale Darstellung
-                self._create_accordion_item(idx, group_videos[0])
-            else:
-                # Mehrere Videos → gruppierte Darstellung
-                self._create_grouped_accordion_item(idx, group_title, group_videos)
-            idx += 1
+        self._asset_groups = list(groups.items())
+        self.asset_list.set_count(len(self._asset_groups))
+
+    def _create_asset_row(self, parent, index: int) -> tk.Frame:
+        """Erzeugt einen Accordion-Eintrag (Callback der VirtualList)."""
+        group_title, group_videos = self._asset_groups[index]
+
+        item_frame = tk.Frame(parent, bg="#f4f4f4")
+        item_frame.columnconfigure(0, weight=1)
+        if len(group_videos) == 1:
+            # Einzelnes Video → normale Darstellung
+            self._create_accordion_item(item_frame, index, group_videos[0])
+        else:
+            # Mehrere Videos → gruppierte Darstellung
+            self._create_grouped_accordion_item(item_frame, index, group_title, group_videos)
+        return item_frame
 
     def _group_videos_by_title(self, videos: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
         """Gruppiert Videos nach Titel-Anfang (erste ~50 Zeichen)."""
@@ -270,7 +315,7 @@ class AssetManagerWindow(tk.Toplevel):
         else:
             return "unknown"
 
-    def _create_grouped_accordion_item(self, index: int, group_title: str, videos: List[Dict[str, Any]]):
+    def _create_grouped_accordion_item(self, parent: tk.Frame, index: int, group_title: str, videos: List[Dict[str, Any]]):
         """Erzeugt gruppierten Entry für Multi-Profil-Videos."""
         # Sortiere Videos nach Profil-Priorität: neutral_embed, public_youtube, social_subtitled
         profile_order = {"neutral_embed": 0, "public_youtube": 1, "social_subtitled": 2, "unknown": 3}
@@ -282,12 +327,10 @@ class AssetManagerWindow(tk.Toplevel):
         stats = main_video.get("statistics", {})
         status = main_video.get("status", {})
 
-        header_frame = tk.Frame(self.scroll_frame, bg="white", padx=8, pady=8)
-        header_frame.grid(row=index * 2, column=0, sticky="ew")
+        header_frame = tk.Frame(parent, bg="white", padx=8, pady=8)
+        header_frame.grid(row=0, column=0, sticky="ew")
         header_frame.columnconfigure(2, weight=1)
 
-        thumb_url = self._get_thumbnail_url(snippet.get("thumbnails"))
-
         # Container für Thumbnail + Buttons (Link + Upload)
         thumb_container = tk.Frame(header_frame, bg="white")
         thumb_container.grid(row=0, column=0, rowspan=3, padx=5, pady=5)
@@ -296,7 +339,8 @@ class AssetManagerWindow(tk.Toplevel):
         thumb_label.pack()
         # Bei gruppierten Videos: Alle Video-IDs für Thumbnail-Upload sammeln
         all_video_ids = [v["id"] for v in sorted_videos]
-        self._load_thumbnail_async(thumb_url, thumb_label, all_video_ids, add_link_button=True)
+        preview_url = self._get_thumbnail_url(snippet.get("thumbnails"), preview=True)
+        self._load_thumbnail_async(preview_url, thumb_label, all_video_ids, add_link_button=True)
 
         title = snippet.get("title", "Ohne Titel")
         published = snippet.get("publishedAt", "")[:10]
@@ -384,32 +428,32 @@ class AssetManagerWindow(tk.Toplevel):
         delete_btn.pack(side=RIGHT, padx=5)
 
         def toggle_detail(event=None):
-            self._toggle_detail(detail_frame)
+            self._toggle_detail(
+                index, detail_frame, lambda: self._populate_grouped_detail(detail_frame, sorted_videos)
+            )
 
         for widget in (title_row, title_label, status_row, info_label):
             widget.bind("<Button-1>", toggle_detail)
             widget.configure(cursor="hand2")
 
-        # Detail-Frame für alle Videos
-        detail_frame = tk.Frame(self.scroll_frame, padx=10, pady=10, bg="white")
-        detail_frame.grid(row=index * 2 + 1, column=0, sticky="ew", padx=(30, 0))
+        # Detail-Frame für alle Videos (Inhalt erst beim ersten Aufklappen)
+        detail_frame = tk.Frame(parent, padx=10, pady=10, bg="white")
+        detail_frame.grid(row=1, column=0, sticky="ew", padx=(30, 0))
         detail_frame.columnconfigure(1, weight=1)
-
-        self._populate_grouped_detail(detail_frame, sorted_videos)
         detail_frame.grid_remove()
 
         # Schwarze Trennlinie
-        separator_frame = tk.Frame(self.scroll_frame, height=2, bg="#000000")
-        separator_frame.grid(row=index * 2 + 2, column=0, sticky="ew", pady=(10, 10), padx=15)
+        separator_frame = tk.Frame(parent, height=2, bg="#000000")
+        separator_frame.grid(row=2, column=0, sticky="ew", pady=(10, 10), padx=15)
 
-    def _create_accordion_item(self, index: int, video: Dict[str, Any]):
+    def _create_accordion_item(self, parent: tk.Frame, index: int, video: Dict[str, Any]):
         """Erzeugt Entry mit Header + Detailansicht."""
         snippet = video.get("snippet", {})
         stats = video.get("statistics", {})
         status = video.get("status", {})
 
-        header_frame = tk.Frame(self.scroll_frame, bg="white", padx=8, pady=8)
-        header_frame.grid(row=index * 2, column=0, sticky="ew")
+        header_frame = tk.Frame(parent, bg="white", padx=8, pady=8)
+        header_frame.grid(row=0, column=0, sticky="ew")
         header_frame.columnconfigure(2, weight=1)
 
         thumb_url = self._get_thumbnail_url(snippet.get("thumbnails"))
@@ -420,7 +464,8 @@ class AssetManagerWindow(tk.Toplevel):
 
         thumb_label = tk.Label(thumb_container, cursor="hand2", bg="white")
         thumb_label.pack()
-        self._load_thumbnail_async(thumb_url, thumb_label, video["id"], add_link_button=False)
+        preview_url = self._get_thumbnail_url(snippet.get("thumbnails"), preview=True)
+        self._load_thumbnail_async(preview_url, thumb_label, video["id"], add_link_button=False)
 
         title = snippet.get("title", "Ohne Titel")
         video_id = video.get("id", "")
@@ -512,22 +557,23 @@ class AssetManagerWindow(tk.Toplevel):
         delete_btn.pack(side=RIGHT, padx=5)
 
         def toggle_detail(event=None):
-            self._toggle_detail(detail_frame)
+            self._toggle_detail(
+                index, detail_frame, lambda: self._populate_detail(detail_frame, video, thumb_url)
+            )
 
         for widget in (title_row, title_label, status_row, info_label):
             widget.bind("<Button-1>", toggle_detail)
             widget.configure(cursor="hand2")
 
-        detail_frame = tk.Frame(self.scroll_frame, padx=10, pady=10, bg="white")
-        detail_frame.grid(row=index * 2 + 1, column=0, sticky="ew", padx=(30, 0))
+        # Detail-Frame (Inhalt erst beim ersten Aufklappen)
+        detail_frame = tk.Frame(parent, padx=10, pady=10, bg="white")
+        detail_frame.grid(row=1, column=0, sticky="ew", padx=(30, 0))
         detail_frame.columnconfigure(1, weight=1)
-
-        self._populate_detail(detail_frame, video, thumb_url)
         detail_frame.grid_remove()
 
         # Schwarze Trennlinie
-        separator_frame = tk.Frame(self.scroll_frame, height=2, bg="#000000")
-        separator_frame.grid(row=index * 2 + 2, column=0, sticky="ew", pady=(10, 10), padx=15)
+        separator_frame = tk.Frame(parent, height=2, bg="#000000")
+        separator_frame.grid(row=2, column=0, sticky="ew", pady=(10, 10), padx=15)
 
     def _populate_grouped_detail(self, parent: ttk.Frame, videos: List[Dict[str, Any]]):
         """Befüllt Detailabschnitt für gruppierte Videos."""
@@ -758,15 +804,24 @@ class AssetManagerWindow(tk.Toplevel):
         self.clipboard_append(text)
         self.status_label.config(text="Link kopiert.")
 
-    def _toggle_detail(self, frame: ttk.Frame):
-        """Zeigt/verbirgt Detail-Frame."""
-        if frame.winfo_ismapped():
+    def _toggle_detail(self, index: int, frame: tk.Frame, populate):
+        """
+        Zeigt/verbirgt Detail-Frame; befüllt ihn beim ersten Aufklappen.
+
+        Aufgeklappte Einträge bleiben beim Scrollen erhalten (angeheftet),
+        damit ungespeicherte Eingaben nicht verloren gehen.
+        """
+        if frame.winfo_manager():
             frame.grid_remove()
+            self.asset_list.pin(index, False)
         else:
+            if not frame.winfo_children():
+                populate()
             frame.grid()
+            self.asset_list.pin(index, True)
 
     def _load_thumbnail_async(self, url: str, label: tk.Label, video_id, add_link_button: bool = False):
-        """Lädt Thumbnail-Bild in separatem Thread und fügt Icons hinzu.
+        """Lädt Thumbnail-Bild über Plattencache bzw. Download-Pool und fügt Icons hinzu.
 
         Args:
             video_id: Kann eine einzelne Video-ID (str) oder eine Liste von IDs sein (für gruppierte Videos)
@@ -776,138 +831,58 @@ class AssetManagerWindow(tk.Toplevel):
             return
 
         cache_key = f"{url}_with_icon{'_link' if add_link_button else ''}"
-        if cache_key in self.thumbnail_cache:
-            label.config(image=self.thumbnail_cache[cache_key])
-            label.image = self.thumbnail_cache[cache_key]
-            if add_link_button:
-                # Bei gruppierten Videos: Klick-Position bestimmt Funktion
-                embed_id = video_id[0] if isinstance(video_id, list) else video_id
-                label.bind("<Button-1>", lambda e: self._handle_grouped_thumbnail_click(e, embed_id, video_id))
-            else:
-                label.bind("<Button-1>", lambda e: self._upload_thumbnail(video_id))
-            return
+        shown = self.thumbnail_cache.get(cache_key) is not None
+        if shown:
+            self._apply_thumbnail(label, cache_key, video_id, add_link_button)
+            if not self.thumbnail_store.needs_revalidation(url, self._thumbnails_valid_after):
+                return
 
-        def worker():
+        def on_done(path, changed):
+            # Läuft im Download-Worker; Tk-Objekte entstehen erst im GUI-Thread
+            if path is None:
+                if not shown:
+                    self.after(0, lambda: label.winfo_exists() and label.config(text="[Thumb Fehler]"))
+                return
+            if shown and not changed:
+                return
             try:
-                response = requests.get(url, timeout=10)
-                response.raise_for_status()
-                img = Image.open(BytesIO(response.content))
-                img.thumbnail((160, 90), Image.Resampling.LANCZOS)
-
-                # Icons hinzufügen
-                img_with_icons = self._add_thumbnail_icons(img, add_link_button)
-
-                photo = ImageTk.PhotoImage(img_with_icons)
-                self.thumbnail_cache[cache_key] = photo
-                self.after(0, lambda: self._apply_thumbnail(label, cache_key, video_id, add_link_button))
+                with Image.open(path) as img:
+                    img.draft("RGB", (160, 90))  # JPEG: verkleinert dekodieren
+                    img.thumbnail((160, 90), Image.Resampling.LANCZOS)
+                    # Icons hinzufügen
+                    img_with_icons = self._add_thumbnail_icons(img, add_link_button)
             except Exception:
-                self.after(0, lambda: label.config(text="[Thumb Fehler]"))
-
-        threading.Thread(target=worker, daemon=True).start()
+                self.after(0, lambda: label.winfo_exists() and label.config(text="[Thumb Fehler]"))
+                return
+            self.after(0, lambda: self._show_thumbnail(label, cache_key, img_with_icons, video_id, add_link_button))
 
-    def _add_thumbnail_icons(self, img: Image.Image, add_link_button: bool) -> Image.Image:
-        """Fügt Icons zum Thumbnail hinzu: Link-Button (oben rechts) + Upload-Icon (unten rechts)."""
-        img = img.copy()
+        self.thumbnail_store.fetch(
+            url,
+            on_done,
+            valid_after=self._thumbnails_valid_after,
+            key=(url, str(label))
+        )
 
-        icon_size = 28
-        padding = 4
+    def _show_thumbnail(self, label: tk.Label, cache_key: str, img: Image.Image, video_id, add_link_button: bool):
+        """Legt das fertige Thumbnail im Speicher-Cache ab und zeigt es an (GUI-Thread)."""
+        photo = ImageTk.PhotoImage(img)
+        self.thumbnail_cache.put(cache_key, photo, image_nbytes(photo.width(), photo.height()))
+        self._apply_thumbnail(label, cache_key, video_id, add_link_button)
 
-        # Konvertiere zu RGBA
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
+    def _add_thumbnail_icons(self, img: Image.Image, add_link_button: bool) -> Image.Image:
+        """Fügt Icons zum Thumbnail hinzu: Link-Button (oben rechts) + Upload-Icon (unten rechts).
 
-        # Link-Button oben rechts (🔗)
+        Die Icons liegen als vorkomponierte Ebene pro Thumbnail-Größe vor
+        (svg_icons.overlay_layer) und werden mit einem Paste aufgelegt.
+        """
+        placements = [("upload", THUMBNAIL_ICON_SIZE, "bottom-right")]  # schreibszene.ch orange
         if add_link_button:
-            link_icon = self._create_link_icon(icon_size)
-            x = img.width - icon_size - padding
-            y = padding
-            if link_icon.mode == 'RGBA':
-                img.paste(link_icon, (x, y), link_icon)
-            else:
-                img.paste(link_icon, (x, y))
-
-        # Upload-Icon unten rechts (📤) - schreibszene.ch orange
-        upload_icon = load_upload_icon(size=icon_size, bg_color='#f7b33b')
-        x = img.width - icon_size - padding
-        y = img.height - icon_size - padding
-        if upload_icon.mode == 'RGBA':
-            img.paste(upload_icon, (x, y), upload_icon)
-        else:
-            img.paste(upload_icon, (x, y))
-
-        # Zurück zu RGB
-        if img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            img = background
-
-        return img
-
-    def _create_link_icon(self, size: int) -> Image.Image:
-        """Erstellt ein Material Design Link-Icon mit blauem Hintergrund."""
-        icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        draw = ImageDraw.Draw(icon)
-
-        # Blauer Kreis als Hintergrund (schreibszene.ch brightblue)
-        draw.ellipse([0, 0, size, size], fill='#0eb1d2')
-
-        # Weißes Material Design Link-Symbol (Kettenglied)
-        link_color = (255, 255, 255, 255)
-        margin = size // 5
-        thickness = 2
-
-        # Material Design Link: Zwei abgerundete Kettenglied-Formen
-        # Linkes Glied (schräg links-oben)
-        left_x1 = margin
-        left_y1 = margin + 2
-        left_x2 = size // 2 - 1
-        left_y2 = margin + 2 + thickness
-        draw.rectangle([left_x1, left_y1, left_x2, left_y2], fill=link_color)
-
-        # Rechtes Glied (schräg rechts-unten)
-        right_x1 = size // 2 + 1
-        right_y1 = size - margin - thickness - 2
-        right_x2 = size - margin
-        right_y2 = size - margin - 2
-        draw.rectangle([right_x1, right_y1, right_x2, right_y2], fill=link_color)
-
-        # Verbindungslinien vertikal
-        draw.rectangle([margin, left_y1, margin + thickness, size // 2], fill=link_color)
-        draw.rectangle([size - margin - thickness, size // 2, size - margin, right_y2], fill=link_color)
-
-        return icon
+            placements.insert(0, ("link", THUMBNAIL_ICON_SIZE, "top-right"))  # schreibszene.ch brightblue
+        return apply_overlay(img, overlay_layer(img.width, img.height, tuple(placements)))
 
     def _add_upload_icon(self, img: Image.Image) -> Image.Image:
-        """Fügt Upload-Icon aus SVG unten rechts im Thumbnail ein."""
-        # Erstelle eine Kopie
-        img = img.copy()
-
-        # Lade Upload-Icon (weiß auf schreibszene.ch orange)
-        icon_size = 28
-        upload_icon = load_upload_icon(size=icon_size, bg_color='#f7b33b')
-
-        # Icon-Position: unten rechts
-        padding = 4
-        x = img.width - icon_size - padding
-        y = img.height - icon_size - padding
-
-        # Konvertiere Basis-Bild zu RGBA falls nötig
-        if img.mode != 'RGBA':
-            img = img.convert('RGBA')
-
-        # Füge Upload-Icon hinzu
-        if upload_icon.mode == 'RGBA':
-            img.paste(upload_icon, (x, y), upload_icon)
-        else:
-            img.paste(upload_icon, (x, y))
-
-        # Zurück zu RGB konvertieren
-        if img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            img = background
-
-        return img
+        """Fügt Upload-Icon unten rechts im Thumbnail ein."""
+        return self._add_thumbnail_icons(img, add_link_button=False)
 
     def _apply_thumbnail(self, label: tk.Label, cache_key: str, video_id, add_link_button: bool = False):
         """Setzt zwischengespeichertes Thumbnail auf Label.
@@ -916,7 +891,7 @@ class AssetManagerWindow(tk.Toplevel):
             video_id: Kann eine einzelne Video-ID (str) oder eine Liste von IDs sein (für gruppierte Videos)
         """
         photo = self.thumbnail_cache.get(cache_key)
-        if photo:
+        if photo and label.winfo_exists():  # Eintrag evtl. inzwischen weggescrollt
             label.config(image=photo)
             label.image = photo
             if add_link_button:
@@ -935,7 +910,7 @@ class AssetManagerWindow(tk.Toplevel):
             all_video_ids: Liste aller Video-IDs für Thumbnail-Upload
         """
         # Icon-Dimensionen (müssen mit _add_thumbnail_icons übereinstimmen)
-        icon_size = 28
+        icon_size = THUMBNAIL_ICON_SIZE
         padding = 4
 
         # Label-Größe ermitteln
@@ -996,6 +971,7 @@ class AssetManagerWindow(tk.Toplevel):
         """Stellt sicher, dass Owner-Referenz zurückgesetzt wird."""
         if hasattr(self.owner, "asset_window"):
             self.owner.asset_window = None
+        self.thumbnail_store.shutdown()
         self.destroy()
 
     def _format_privacy(self, privacy: str) -> str:
@@ -1017,11 +993,15 @@ class AssetManagerWindow(tk.Toplevel):
             ("No Subs", none)
         ]
 
-    def _get_thumbnail_url(self, thumbnails: Dict[str, Any]) -> str:
-        """Wählt bestes Thumbnail aus Snippet."""
+    def _get_thumbnail_url(self, thumbnails: Dict[str, Any], preview: bool = False) -> str:
+        """Wählt bestes Thumbnail aus Snippet (preview: kleinstes, das für 160x90 reicht)."""
         if not thumbnails:
             return ""
-        for key in ("maxres", "standard", "high", "medium", "default"):
+        if preview:
+            sizes = ("medium", "high", "standard", "maxres", "default")
+        else:
+            sizes = ("maxres", "standard", "high", "medium", "default")
+        for key in sizes:
             data = thumbnails.get(key)
             if data and data.get("url"):
                 return data["url"]
@@ -1087,7 +1067,6 @@ class AssetManagerWindow(tk.Toplevel):
                 return
 
         self.status_label.config(text="Thumbnail-Upload gestartet...")
-        self.thumbnail_cache.clear()
 
         # Upload für alle Video-IDs
         success_count = 0
@@ -1107,7 +1086,9 @@ class AssetManagerWindow(tk.Toplevel):
         else:
             self.status_label.config(text=f"{success_count} erfolgreich, {error_count} Fehler")
 
-        self._load_assets()
+        # Neue Thumbnails: gecachte Bilder beim nächsten Anzeigen revalidieren
+        self._thumbnails_valid_after = time.time()
+        self._refresh_assets()
 
     def _save_metadata(self, video_id: str, title: str, description: str, privacy: str, publish_at: str, tags: str):
         """Speichert geänderte Metadaten via YouTube API."""
@@ -1126,49 +1107,53 @@ class AssetManagerWindow(tk.Toplevel):
                 publish_at=publish_value
             )
             self.status_label.config(text="Änderungen gespeichert")
-            self._load_assets()
+            self._refresh_assets()
         except UploadError as e:
             messagebox.showerror("YouTube-Fehler", str(e))
         except Exception as e:
             messagebox.showerror("Fehler", str(e))
 
     def _save_grouped_metadata(self, videos: List[Dict[str, Any]], title: str, description: str, tags: str):
-        """Speichert gemeinsame Metadaten für alle Videos in einer Gruppe."""
+        """Speichert gemeinsame Metadaten für alle Videos in einer Gruppe (ein Batch-Request)."""
         if not videos:
             return
 
         tags_list = [t.strip() for t in tags.split(",") if t.strip()]
-
-        # Aktualisiere alle Videos in der Gruppe
-        success_count = 0
-        error_count = 0
+        updates = [
+            {
+                "video_id": video.get("id"),
+                "title": title.strip(),
+                "description": description,
+                "privacy_status": video.get("status", {}).get("privacyStatus", "unlisted"),  # Privacy bleibt individuell
+                "tags": tags_list,
+                "publish_at": None
+            }
+            for video in videos
+        ]
 
         self.status_label.config(text=f"Aktualisiere {len(videos)} Videos...")
 
-        for video in videos:
-            video_id = video.get("id")
-            current_privacy = video.get("status", {}).get("privacyStatus", "unlisted")
-
+        def worker():
             try:
-                update_video_metadata(
-                    video_id=video_id,
-                    title=title.strip(),
-                    description=description,
-                    privacy_status=current_privacy,  # Privacy bleibt individuell
-                    tags=tags_list,
-                    publish_at=None
-                )
-                success_count += 1
+                results = update_videos_metadata_batch(updates)
             except Exception as e:
-                error_count += 1
-                print(f"Fehler beim Aktualisieren von {video_id}: {e}")
+                self.after(0, lambda msg=f"Fehler: {e}": self.status_label.config(text=msg))
+                return
 
-        if error_count == 0:
-            self.status_label.config(text=f"Alle {success_count} Videos aktualisiert")
-        else:
-            self.status_label.config(text=f"{success_count} erfolgreich, {error_count} Fehler")
+            success_count = sum(1 for r in results if r.ok)
+            error_count = len(results) - success_count
+            for r in results:
+                if not r.ok:
+                    print(f"Fehler beim Aktualisieren von {r.video_id}: {r.error}")
 
-        self._load_assets()
+            if error_count == 0:
+                self.after(0, lambda: self.status_label.config(text=f"Alle {success_count} Videos aktualisiert"))
+            else:
+                self.after(0, lambda: self.status_label.config(text=f"{success_count} erfolgreich, {error_count} Fehler"))
+
+            self.after(0, self._refresh_assets)
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def _replace_video(self, video_id: str):
         """Ersetzt die Video-Datei eines bestehenden Videos."""
@@ -1212,12 +1197,12 @@ class AssetManagerWindow(tk.Toplevel):
 
                 replace_video_file(video_id, file_path, progress_callback=progress_cb)
                 self.after(0, lambda: self.status_label.config(text="Video erfolgreich ersetzt – Aktualisiere Liste..."))
-                self.after(0, self._load_assets)
+                self.after(0, self._refresh_assets)
             except UploadError as e:
-                self.after(0, lambda: messagebox.showerror("YouTube-Fehler", str(e)))
+                self.after(0, lambda msg=str(e): messagebox.showerror("YouTube-Fehler", msg))
                 self.after(0, lambda: self.status_label.config(text="Fehler beim Video-Ersatz"))
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Fehler", str(e)))
+                self.after(0, lambda msg=str(e): messagebox.showerror("Fehler", msg))
                 self.after(0, lambda: self.status_label.config(text="Fehler beim Video-Ersatz"))
 
         threading.Thread(target=worker, daemon=True).start()
@@ -1235,38 +1220,33 @@ class AssetManagerWindow(tk.Toplevel):
                 update_video_status_flags(video_id, made_for_kids, embeddable)
                 self.after(0, lambda: self.status_label.config(text="Video-Einstellungen aktualisiert"))
             except Exception as e:
-                self.after(0, lambda: self.status_label.config(text=f"Fehler: {e}"))
+                self.after(0, lambda msg=f"Fehler: {e}": self.status_label.config(text=msg))
 
         threading.Thread(target=worker, daemon=True).start()
 
     def _update_grouped_video_flags(self, videos: List[Dict[str, Any]], made_for_kids: bool, embeddable: bool):
-        """Aktualisiert ForKids und Embeddable Flags für alle Videos in einer Gruppe."""
+        """Aktualisiert ForKids und Embeddable Flags für alle Videos in einer Gruppe (ein Batch-Request)."""
         if not videos:
             return
 
         self.status_label.config(text=f"Aktualisiere {len(videos)} Videos...")
+        video_ids = [video.get("id") for video in videos]
 
         def worker():
-            success_count = 0
-            error_count = 0
-
             try:
-                from app.youtube_assets import update_video_status_flags
-                for video in videos:
-                    video_id = video.get("id")
-                    try:
-                        update_video_status_flags(video_id, made_for_kids, embeddable)
-                        success_count += 1
-                    except Exception as e:
-                        error_count += 1
-                        print(f"Fehler bei {video_id}: {e}")
+                results = update_videos_status_flags_batch(video_ids, made_for_kids, embeddable)
+                success_count = sum(1 for r in results if r.ok)
+                error_count = len(results) - success_count
+                for r in results:
+                    if not r.ok:
+                        print(f"Fehler bei {r.video_id}: {r.error}")
 
                 if error_count == 0:
                     self.after(0, lambda: self.status_label.config(text=f"Alle {success_count} Videos aktualisiert"))
                 else:
                     self.after(0, lambda: self.status_label.config(text=f"{success_count} OK, {error_count} Fehler"))
             except Exception as e:
-                self.after(0, lambda: self.status_label.config(text=f"Fehler: {e}"))
+                self.after(0, lambda msg=f"Fehler: {e}": self.status_label.config(text=msg))
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1311,17 +1291,15 @@ class AssetManagerWindow(tk.Toplevel):
         self.status_label.config(text=f"Lösche {video_count} Videos...")
 
         def worker():
-            deleted = 0
-            errors = []
-            for vid in video_ids:
-                try:
-                    delete_video(vid)
-                    deleted += 1
-                    self.after(0, lambda d=deleted: self.status_label.config(
-                        text=f"Gelöscht: {d}/{video_count}..."
-                    ))
-                except Exception as e:
-                    errors.append(f"{vid}: {e}")
+            try:
+                results = delete_videos_batch(video_ids)
+            except Exception as e:
+                self.after(0, lambda msg=str(e): messagebox.showerror("YouTube-Fehler", msg))
+                self.after(0, lambda: self.status_label.config(text="Fehler beim Löschen"))
+                return
+
+            deleted = sum(1 for r in results if r.ok)
+            errors = [f"{r.video_id}: {r.error}" for r in results if not r.ok]
 
             if errors:
                 error_text = "\n".join(errors)
@@ -1334,7 +1312,7 @@ class AssetManagerWindow(tk.Toplevel):
                     text=f"Alle {video_count} Videos erfolgreich gelöscht"
                 ))
 
-            self.after(0, self._load_assets)
+            self.after(0, self._refresh_assets)
 
         threading.Thread(target=worker, daemon=True).start()
 
@@ -1370,12 +1348,12 @@ class AssetManagerWindow(tk.Toplevel):
             try:
                 delete_video(video_id)
                 self.after(0, lambda: self.status_label.config(text="Video erfolgreich gelöscht – Aktualisiere Liste..."))
-                self.after(0, self._load_assets)
+                self.after(0, self._refresh_assets)
             except UploadError as e:
-                self.after(0, lambda: messagebox.showerror("YouTube-Fehler", str(e)))
+                self.after(0, lambda msg=str(e): messagebox.showerror("YouTube-Fehler", msg))
                 self.after(0, lambda: self.status_label.config(text="Fehler beim Löschen"))
             except Exception as e:
-                self.after(0, lambda: messagebox.showerror("Fehler", str(e)))
+                self.after(0, lambda msg=str(e): messagebox.showerror("Fehler", msg))
                 self.after(0, lambda: self.status_label.config(text="Fehler beim Löschen"))
 
         threading.Thread(target=worker, daemon=True).start()
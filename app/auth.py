@@ -7,9 +7,11 @@ import os
 import pickle
 import shutil
 import socket
+import threading
 import webbrowser
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Dict, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -24,6 +26,9 @@ SCOPES = [
     'https://www.googleapis.com/auth/youtube.force-ssl'
 ]
 
+# Token wird so viele Sekunden vor Ablauf proaktiv erneuert
+TOKEN_REFRESH_MARGIN_SECONDS = 300
+
 
 class AuthError(Exception):
     """Fehler bei der Authentifizierung."""
@@ -83,14 +88,14 @@ class YouTubeAuth:
                 print(f"⚠ Warnung: Token konnte nicht geladen werden: {e}")
                 self.credentials = None
 
-        # Prüfe, ob Token valide ist
-        if self.credentials and self.credentials.valid:
+        # Prüfe, ob Token valide ist (und nicht demnächst abläuft)
+        if self.credentials and self.credentials.valid and not self._expires_soon():
             return self.credentials
 
-        # Token erneuern, falls abgelaufen
-        if self.credentials and self.credentials.expired and self.credentials.refresh_token:
+        # Token erneuern, falls abgelaufen oder kurz vor Ablauf
+        if self.credentials and self.credentials.refresh_token:
             try:
-                print("🔄 Token ist abgelaufen, erneuere...")
+                print("🔄 Token ist (fast) abgelaufen, erneuere...")
                 self.credentials.refresh(Request())
                 self._save_token()
                 print("✓ Token erfolgreich erneuert")
@@ -102,6 +107,32 @@ class YouTubeAuth:
         # Starte OAuth2-Flow (Browser öffnet sich)
         return self._run_oauth_flow()
 
+    def ensure_valid_credentials(self) -> Credentials:
+        """
+        Liefert gültige Credentials ohne erneutes Laden, solange der Token
+        nicht abgelaufen ist oder in Kürze abläuft.
+
+        Returns:
+            Google OAuth2 Credentials
+
+        Raises:
+            AuthError: Bei Authentifizierungsfehlern
+        """
+        if self.credentials and self.credentials.valid and not self._expires_soon():
+            return self.credentials
+
+        return self.authenticate()
+
+    def _expires_soon(self) -> bool:
+        """Prüft, ob der Token innerhalb von TOKEN_REFRESH_MARGIN_SECONDS abläuft."""
+        expiry = getattr(self.credentials, "expiry", None)
+        if not expiry:
+            return False
+
+        # google-auth speichert expiry als naive UTC-Zeit
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        return expiry - now < timedelta(seconds=TOKEN_REFRESH_MARGIN_SECONDS)
+
     def _find_free_port(self, start_port: int = 8081, max_attempts: int = 10) -> int:
         """
         Findet einen freien Port für den OAuth-Callback-Server.
@@ -244,13 +275,28 @@ class YouTubeAuth:
             raise AuthError(f"YouTube-Client konnte nicht erstellt werden: {str(e)}")
 
 
+# ====================
+# Prozessweiter Client-Cache
+# ====================
+# Credentials werden einmal pro Prozess geladen und geteilt. Der API-Client
+# (httplib2 ist nicht thread-safe) wird pro Thread einmal gebaut und referenziert
+# dasselbe Credentials-Objekt, sodass ein Token-Refresh für alle Threads gilt.
+_cache_lock = threading.RLock()
+_shared_auth: Dict[Tuple[str, str], YouTubeAuth] = {}
+_cache_generation = 0
+_thread_clients = threading.local()
+
+
 def create_youtube_client(
     client_secrets_path: str,
     token_path: str,
     auth_prompt_callback: Optional[Callable[[str], None]] = None
 ):
     """
-    Hilfsfunktion zum Erstellen eines authentifizierten YouTube-Clients.
+    Liefert einen authentifizierten YouTube-Client aus dem prozessweiten Cache.
+
+    Der Token wird nur beim ersten Aufruf geladen und proaktiv vor Ablauf
+    erneuert. Der Discovery-basierte Client wird pro Thread einmal gebaut.
 
     Args:
         client_secrets_path: Pfad zur client_secrets.json
@@ -263,9 +309,40 @@ def create_youtube_client(
     Raises:
         AuthError: Bei Authentifizierungsfehlern
     """
-    auth = YouTubeAuth(
-        client_secrets_path,
-        token_path,
-        auth_prompt_callback=auth_prompt_callback
-    )
-    return auth.get_youtube_client()
+    key = (str(client_secrets_path), str(token_path))
+
+    with _cache_lock:
+        auth = _shared_auth.get(key)
+        if auth is None:
+            auth = YouTubeAuth(
+                client_secrets_path,
+                token_path,
+                auth_prompt_callback=auth_prompt_callback
+            )
+            _shared_auth[key] = auth
+        elif auth_prompt_callback:
+            auth.auth_prompt_callback = auth_prompt_callback
+
+        credentials = auth.ensure_valid_credentials()
+        generation = _cache_generation
+
+    clients = getattr(_thread_clients, "clients", None)
+    if clients is None:
+        clients = {}
+        _thread_clients.clients = clients
+
+    cached = clients.get(key)
+    if cached and cached[0] == generation and cached[1] is credentials:
+        return cached[2]
+
+    youtube = auth.get_youtube_client()
+    clients[key] = (generation, credentials, youtube)
+    return youtube
+
+
+def reset_youtube_client_cache():
+    """Verwirft alle gecachten Credentials und Clients (z.B. nach Konto-Wechsel)."""
+    global _cache_generation
+    with _cache_lock:
+        _shared_auth.clear()
+        _cache_generation += 1
@@ -0,0 +1,226 @@
+"""
+Bandbreiten-Begrenzung für Video-Uploads (Token-Bucket).
+
+Ein globaler Bucket begrenzt alle parallelen Uploads gemeinsam, ein Bucket pro
+Upload zusätzlich jeden einzelnen. Die globale Grenze kann zur Laufzeit (GUI)
+überschrieben werden oder über Zeitfenster (z.B. tagsüber gedrosselt) gelten.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+import weakref
+from datetime import datetime, time as dtime
+from typing import List, Optional, Tuple
+
+from app.config import (
+    UPLOAD_BANDWIDTH_LIMIT_MBIT,
+    UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT,
+    UPLOAD_BANDWIDTH_WINDOWS
+)
+
+# Intervall, in dem die Zeitfenster neu ausgewertet werden (Sekunden)
+SCHEDULE_CHECK_INTERVAL = 30.0
+
+
+def mbit_to_bytes(mbit: Optional[float]) -> Optional[float]:
+    """Mbit/s → Bytes/s (None oder <= 0 = unbegrenzt)."""
+    if not mbit or mbit <= 0:
+        return None
+    return mbit * 1_000_000 / 8
+
+
+class TokenBucket:
+    """
+    Thread-sicherer Token-Bucket in Bytes/Sekunde.
+
+    consume() darf den Bucket überziehen und schläft dann die Schuld ab;
+    so funktionieren auch Reads größer als die Burst-Kapazität.
+    """
+
+    def __init__(self, rate: Optional[float] = None, burst_seconds: float = 1.0):
+        self._lock = threading.Lock()
+        self.burst_seconds = burst_seconds
+        self.rate: Optional[float] = None
+        self._tokens = 0.0
+        self._updated = time.monotonic()
+        self.set_rate(rate)
+
+    def set_rate(self, rate: Optional[float]):
+        """Setzt die Rate in Bytes/s (None = unbegrenzt)."""
+        with self._lock:
+            if rate == self.rate:
+                return
+            self.rate = rate if rate and rate > 0 else None
+            self._tokens = self.rate * self.burst_seconds if self.rate else 0.0
+            self._updated = time.monotonic()
+
+    def consume(self, amount: int):
+        """Entnimmt amount Bytes und blockiert, bis sie gedeckt sind."""
+        with self._lock:
+            if not self.rate or amount <= 0:
+                return
+            now = time.monotonic()
+            capacity = self.rate * self.burst_seconds
+            self._tokens = min(capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= amount
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+def parse_windows(spec: str) -> List[Tuple[dtime, dtime, float]]:
+    """
+    Parst Zeitfenster im Format "08:00-18:00=20;18:00-08:00=0".
+
+    Der Wert ist die globale Grenze in Mbit/s (0 = unbegrenzt). Fenster über
+    Mitternacht sind erlaubt. Ungültige Einträge werden mit Warnung ignoriert.
+    """
+    windows = []
+    for part in (spec or "").replace(",", ";").split(";"):
+        part = part.strip()
+        if not part:
+            continue
+        try:
+            span, limit = part.split("=")
+            start, end = span.split("-")
+            windows.append((
+                datetime.strptime(start.strip(), "%H:%M").time(),
+                datetime.strptime(end.strip(), "%H:%M").time(),
+                float(limit)
+            ))
+        except ValueError:
+            print(f"⚠ Ungültiges Bandbreiten-Zeitfenster ignoriert: {part}")
+    return windows
+
+
+def _window_limit(windows: List[Tuple[dtime, dtime, float]], now: dtime) -> Optional[float]:
+    """Grenze des ersten passenden Zeitfensters in Mbit/s (None = kein Fenster aktiv)."""
+    for start, end, limit in windows:
+        if start <= end:
+            active = start <= now < end
+        else:
+            active = now >= start or now < end
+        if active:
+            return limit
+    return None
+
+
+class BandwidthManager:
+    """Verwaltet globale und Pro-Upload-Grenzen für alle laufenden Uploads."""
+
+    def __init__(
+        self,
+        default_mbit: float = UPLOAD_BANDWIDTH_LIMIT_MBIT,
+        per_upload_mbit: float = UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT,
+        windows: str = UPLOAD_BANDWIDTH_WINDOWS
+    ):
+        self._lock = threading.Lock()
+        self.default_mbit = default_mbit
+        self.per_upload_mbit = per_upload_mbit
+        self.windows = parse_windows(windows)
+        self.override_mbit: Optional[float] = None  # Laufzeit-Override (GUI), 0 = unbegrenzt
+
+        self.global_bucket = TokenBucket()
+        self._upload_buckets: "weakref.WeakSet[TokenBucket]" = weakref.WeakSet()
+        self._last_schedule_check = 0.0
+        self.refresh()
+
+    def current_global_mbit(self) -> float:
+        """Aktuell gültige globale Grenze in Mbit/s (0 = unbegrenzt)."""
+        if self.override_mbit is not None:
+            return self.override_mbit
+        window_limit = _window_limit(self.windows, datetime.now().time())
+        if window_limit is not None:
+            return window_limit
+        return self.default_mbit
+
+    def refresh(self):
+        """Wertet Override und Zeitfenster neu aus."""
+        self._last_schedule_check = time.monotonic()
+        self.global_bucket.set_rate(mbit_to_bytes(self.current_global_mbit()))
+
+    def set_global_limit(self, mbit: Optional[float]):
+        """
+        Setzt die globale Grenze zur Laufzeit.
+
+        Args:
+            mbit: Mbit/s, 0 = unbegrenzt, None = wieder .env/Zeitfenster verwenden
+        """
+        self.override_mbit = mbit
+        self.refresh()
+
+    def set_per_upload_limit(self, mbit: Optional[float]):
+        """
+        Setzt die Grenze pro Upload (wirkt auch auf laufende Uploads).
+
+        Args:
+            mbit: Mbit/s, 0 = unbegrenzt, None = wieder UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT aus .env
+        """
+        if mbit is None:
+            mbit = UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT
+        with self._lock:
+            self.per_upload_mbit = mbit
+            buckets = list(self._upload_buckets)
+        for bucket in buckets:
+            bucket.set_rate(mbit_to_bytes(mbit))
+
+    def consume(self, amount: int, upload_bucket: Optional[TokenBucket] = None):
+        """Blockiert, bis amount Bytes in beiden Buckets gedeckt sind."""
+        if time.monotonic() - self._last_schedule_check > SCHEDULE_CHECK_INTERVAL:
+            self.refresh()
+        if upload_bucket is not None:
+            upload_bucket.consume(amount)
+        self.global_bucket.consume(amount)
+
+    def wrap(self, stream) -> "ThrottledReader":
+        """Umhüllt einen Upload-Stream mit eigenem Pro-Upload-Bucket."""
+        bucket = TokenBucket(mbit_to_bytes(self.per_upload_mbit))
+        with self._lock:
+            self._upload_buckets.add(bucket)
+        return ThrottledReader(stream, self, bucket)
+
+
+class ThrottledReader:
+    """
+    Stream-Wrapper, der Reads über den BandwidthManager drosselt.
+
+    http.client liest den Request-Body blockweise (8 KiB), dadurch wird die
+    Sendegeschwindigkeit gleichmäßig begrenzt und nicht nur pro Chunk.
+    """
+
+    def __init__(self, stream, manager: BandwidthManager, bucket: TokenBucket):
+        self._stream = stream
+        self._manager = manager
+        self._bucket = bucket
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self._manager.consume(len(data), self._bucket)
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def close(self):
+        self._stream.close()
+
+
+_manager: Optional[BandwidthManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_bandwidth_manager() -> BandwidthManager:
+    """Liefert den prozessweiten BandwidthManager."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = BandwidthManager()
+        return _manager
@@ -0,0 +1,612 @@
+"""
+Gemeinsame Batch-Upload-Logik für GUI und CLI.
+
+Enthält alles, was ohne Tk auskommt: Videos samt Companion-Dateien laden,
+Container-SRT/Thumbnails erzeugen, Profil-Requirements prüfen und ein
+(Video, Profil)-Paar hochladen.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import SUPPORTED_VIDEO_EXTS, SUPPORTED_SUB_EXTS, SUPPORTED_THUMB_EXTS
+from app.companion import (
+    find_subtitle_streams,
+    extract_subtitle_stream,
+    extract_subtitle_and_thumbnail,
+    generate_thumbnail,
+    get_video_companion_files
+)
+from app.matching import (
+    _extract_base_name,
+    get_directory_index,
+    get_file_prefix,
+    find_all_matching_files,
+    find_sample_thumbnail,
+    find_specialized_video_files,
+    find_yt_profile_json
+)
+
+if TYPE_CHECKING:
+    from app.uploader import UploadResult
+
+_log_lock = threading.Lock()
+
+
+def init_profile_selection(profiles: dict, video_item: 'VideoItem') -> Dict[str, bool]:
+    """
+    Initialisiert Profil-Auswahl basierend auf default_selected und Requirements.
+
+    Args:
+        profiles: Dict mit allen Profilen
+        video_item: VideoItem mit Companion-Status
+
+    Returns:
+        Dict[profile_name, is_selected]
+    """
+    selection = {}
+
+    for profile_name, profile_data in profiles.items():
+        # Defaults aus Profil
+        default_selected = profile_data.get('default_selected', False)
+
+        # Setze Selection (nur wenn Requirements erfüllt UND default_selected)
+        selection[profile_name] = default_selected and profile_skip_reason(video_item, profile_data) is None
+
+    return selection
+
+
+@dataclass
+class VideoItem:
+    """Repräsentiert ein Video mit zugehörigen Dateien."""
+    video_path: str
+    srt_path: Optional[str] = None
+    json_path: Optional[str] = None
+    factsheet_data: Optional[Dict[str, Any]] = None
+    thumbnail_path: Optional[str] = None
+    status: str = "Bereit"  # Bereit, Läuft, Fertig, Fehler
+    error_msg: str = ""
+
+    # Neue: Spezialisierte Video-Varianten
+    softsubs_path: Optional[str] = None  # Video mit Container-SRT
+    hardsubs_path: Optional[str] = None  # Video mit eingebrannten Untertiteln
+
+    # Companion-Status
+    companion: Dict[str, bool] = None
+
+    # Profil-Auswahl pro Video
+    selected_profiles: Dict[str, bool] = None
+
+    # Notizen (z.B. "SRT auto-extrahiert")
+    notes: str = ""
+
+    # Kandidaten der Thumbnail-Auswahl (ThumbnailCandidate, nach Zeit)
+    thumbnail_candidates: List[Any] = None
+
+    def __post_init__(self):
+        """Initialisiert Defaults für mutable Felder."""
+        if self.companion is None:
+            self.companion = {
+                "json": False,
+                "srt_external": False,
+                "srt_container": False,
+                "thumbnail_sample": False,    # sample_*.png vorhanden
+                "thumbnail_generated": False  # Aus Video generiert
+            }
+        if self.selected_profiles is None:
+            self.selected_profiles = {}
+        if self.thumbnail_candidates is None:
+            self.thumbnail_candidates = []
+
+    @property
+    def video_name(self) -> str:
+        return Path(self.video_path).name
+
+    @property
+    def has_srt(self) -> bool:
+        return self.srt_path is not None
+
+    @property
+    def has_json(self) -> bool:
+        return self.json_path is not None and self.factsheet_data is not None
+
+    @property
+    def is_ready(self) -> bool:
+        """Video ist bereit wenn JSON vorhanden und mind. 1 Profil aktiv."""
+        return self.has_json and any(self.selected_profiles.values())
+
+
+def find_videos_in_directory(directory: str, recursive: bool = False) -> List[str]:
+    """
+    Findet alle Videos eines Ordners, ein Eintrag pro Basis-Video.
+
+    Varianten (*_softsubs, *_hardsubs, *_podcast, Zeitstempel) werden zum
+    Basis-Namen zusammengefasst; get_video_companion_files() findet sie wieder.
+    Bevorzugt wird die Datei ohne Varianten-Suffix, sonst die neueste.
+
+    Args:
+        directory: Ordner
+        recursive: Auch Unterordner durchsuchen
+
+    Returns:
+        Sortierte Liste von Video-Pfaden
+    """
+    dir_path = Path(directory)
+    if recursive:
+        directories = [Path(root) for root, _dirs, _files in os.walk(dir_path)]
+    else:
+        directories = [dir_path]
+
+    videos = []
+    for current_dir in directories:
+        # Derselbe Index dient danach der Companion-Suche der gefundenen Videos
+        index = get_directory_index(current_dir)
+
+        groups: Dict[str, List[Path]] = {}
+        for path in index.glob("*"):
+            if path.suffix.lower() not in SUPPORTED_VIDEO_EXTS:
+                continue
+            groups.setdefault(_extract_base_name(path.stem), []).append(path)
+
+        for base_name, candidates in groups.items():
+            exact = [p for p in candidates if p.stem == base_name]
+            chosen = exact[0] if exact else index.newest(candidates)
+            videos.append(str(chosen))
+
+    return sorted(videos)
+
+
+def load_video_item(video_path: str) -> Tuple[VideoItem, Optional[str]]:
+    """
+    Erstellt ein VideoItem inkl. Companion-Dateien und validiertem Factsheet.
+
+    Args:
+        video_path: Pfad zur Video-Datei
+
+    Returns:
+        Tuple (VideoItem, json_error). Bei ungültigem JSON ist json_path None
+        und json_error enthält die Fehlermeldung.
+    """
+    from app.factsheet_schema import load_and_validate_factsheet
+
+    companions = get_video_companion_files(video_path)
+
+    json_path = companions.get("json_file")
+    factsheet_data = None
+    json_error = None
+    if json_path:
+        is_valid, data, error_msg = load_and_validate_factsheet(json_path)
+        if is_valid:
+            factsheet_data = data
+        else:
+            json_error = f"{Path(json_path).name}:\n{error_msg}"
+            json_path = None
+
+    srt_path = companions.get("srt_file")
+    thumbnail_path = companions.get("thumbnail_file")
+
+    video_item = VideoItem(
+        video_path=video_path,
+        srt_path=srt_path,
+        json_path=json_path,
+        factsheet_data=factsheet_data,
+        softsubs_path=companions.get("softsubs_file"),
+        hardsubs_path=companions.get("hardsubs_file"),
+        thumbnail_path=thumbnail_path
+    )
+
+    video_item.companion["json"] = factsheet_data is not None
+    video_item.companion["srt_external"] = srt_path is not None
+    video_item.companion["thumbnail_sample"] = thumbnail_path is not None
+
+    return video_item, json_error
+
+
+def process_companions(video: VideoItem) -> List[str]:
+    """
+    Ergänzt fehlende Companion-Dateien per ffmpeg (Container-SRT, Thumbnail).
+    Bevorzugt das softsubs-Video als Quelle. Das Thumbnail wird mit NumPy aus
+    mehreren Kandidaten gewählt (app/thumbnail_picker.py). Ohne NumPy erzeugt,
+    wenn SRT und Thumbnail beide benötigt werden, ein einziger ffmpeg-Aufruf
+    beides (Frame bei t=3s); schlägt er fehl, folgen die getrennten Aufrufe.
+
+    Args:
+        video: VideoItem (wird direkt aktualisiert)
+
+    Returns:
+        Liste von Notizen für die Anzeige
+    """
+    notes = []
+    source_video = video.softsubs_path if video.softsubs_path else video.video_path
+
+    # 1. Prüfe Container-SRT (nur wenn kein externes SRT vorhanden)
+    stream_index = None
+    if not video.has_srt:
+        success, stream_indices, error = find_subtitle_streams(source_video)
+        if success and stream_indices:
+            stream_index = stream_indices[0]  # Nutze ersten Stream
+
+    need_thumbnail = not video.companion.get("thumbnail_sample")
+
+    from app.thumbnail_picker import NUMPY_AVAILABLE, select_thumbnail
+
+    # 2. Ohne NumPy und beides nötig: ein ffmpeg-Aufruf (Container nur einmal lesen)
+    if stream_index is not None and need_thumbnail and not NUMPY_AVAILABLE:
+        success, srt_path, thumb_path, _error = extract_subtitle_and_thumbnail(
+            source_video,
+            stream_index,
+            time_seconds=3
+        )
+        if success:
+            _apply_extracted_srt(video, srt_path, notes)
+            _apply_generated_thumbnail(video, thumb_path, notes)
+            stream_index = None
+            need_thumbnail = False
+        # Sonst Fallback auf getrennte Aufrufe
+
+    # 3. Einzeln: SRT extrahieren
+    if stream_index is not None:
+        success, output_path, error = extract_subtitle_stream(source_video, stream_index)
+
+        if success:
+            _apply_extracted_srt(video, output_path, notes)
+        else:
+            notes.append(f"SRT-Extraktion fehlgeschlagen: {error}")
+
+    # 4. Bestes Frame aus mehreren Kandidaten (nur Keyframes, ein ffmpeg-Aufruf)
+    if need_thumbnail and NUMPY_AVAILABLE:
+        success, output_path, candidates, _error = select_thumbnail(source_video)
+        if success:
+            best = max(candidates, key=lambda c: c.score)
+            video.thumbnail_path = output_path
+            video.thumbnail_candidates = candidates
+            video.companion["thumbnail_generated"] = True
+            notes.append(f"Thumbnail gewählt (t={best.time_seconds:.0f}s, {len(candidates)} Kandidaten)")
+            need_thumbnail = False
+        # Sonst Fallback auf festes Frame
+
+    # 5. Einzeln: Thumbnail generieren (falls kein sample vorhanden)
+    if need_thumbnail:
+        success, output_path, error = generate_thumbnail(source_video, time_seconds=3)
+
+        if success:
+            _apply_generated_thumbnail(video, output_path, notes)
+        else:
+            notes.append(f"Thumbnail-Generierung fehlgeschlagen: {error}")
+
+    if notes:
+        if video.notes:
+            video.notes += "; " + "; ".join(notes)
+        else:
+            video.notes = "; ".join(notes)
+
+    return notes
+
+
+def _apply_extracted_srt(video: VideoItem, srt_path: str, notes: List[str]):
+    video.srt_path = srt_path
+    video.companion["srt_container"] = True
+    if video.softsubs_path:
+        notes.append("SRT aus softsubs-Video extrahiert")
+    else:
+        notes.append("SRT aus Container extrahiert")
+
+
+def _apply_generated_thumbnail(video: VideoItem, thumb_path: str, notes: List[str]):
+    video.thumbnail_path = thumb_path
+    video.companion["thumbnail_generated"] = True
+    notes.append("Thumbnail generiert (t=3s)")
+
+
+def companion_kinds(video: VideoItem, file_names: Iterable[str]) -> Set[str]:
+    """
+    Ordnet geänderte Dateinamen eines Ordners den Companion-Arten eines Videos zu.
+
+    Returns:
+        Teilmenge von {"json", "srt", "variants", "thumbnail"}
+    """
+    base_name = _extract_base_name(Path(video.video_path).stem)
+    srt_prefix = get_file_prefix(video.video_path, 12)
+    kinds = set()
+
+    for name in file_names:
+        path = Path(name)
+        suffix = path.suffix.lower()
+        if name.endswith("_yt_profile.json"):
+            kinds.add("json")
+        elif suffix in SUPPORTED_SUB_EXTS and name.startswith(srt_prefix):
+            kinds.add("srt")
+        elif name.endswith(("_softsubs.mp4", "_hardsubs.mp4")) and name.startswith(base_name):
+            kinds.add("variants")
+        elif suffix in SUPPORTED_THUMB_EXTS and (
+            name.startswith("sample_")
+            or (name.startswith(base_name) and path.stem.endswith(("_thumbnail", "_thumb")))
+        ):
+            kinds.add("thumbnail")
+
+    return kinds
+
+
+def refresh_companions(video: VideoItem, file_names: Iterable[str]) -> Tuple[List[str], Optional[str]]:
+    """
+    Aktualisiert nur die Companion-Felder, die von geänderten Dateien betroffen sind.
+
+    Günstiger als load_video_item() + process_companions(): kein ffmpeg, nur
+    Abfragen gegen den Ordner-Index. Der Index muss vorher verworfen worden
+    sein (FolderWatcher erledigt das).
+
+    Args:
+        video: VideoItem (wird direkt aktualisiert)
+        file_names: Geänderte, neue oder gelöschte Dateinamen im Video-Ordner
+
+    Returns:
+        Tuple (geänderte Arten, json_error). Geänderte Arten aus
+        {"json", "srt", "variants", "thumbnail"}; json_error bei ungültigem JSON.
+    """
+    file_names = set(file_names)
+    kinds = companion_kinds(video, file_names)
+    updated = []
+    json_error = None
+
+    if "json" in kinds:
+        from app.factsheet_schema import load_and_validate_factsheet
+
+        json_path = find_yt_profile_json(video.video_path)
+        factsheet_data = None
+        if json_path:
+            is_valid, data, error_msg = load_and_validate_factsheet(json_path)
+            if is_valid:
+                factsheet_data = data
+            else:
+                json_error = f"{Path(json_path).name}:\n{error_msg}"
+                json_path = None
+        if json_path != video.json_path or factsheet_data != video.factsheet_data:
+            video.json_path = json_path
+            video.factsheet_data = factsheet_data
+            video.companion["json"] = factsheet_data is not None
+            updated.append("json")
+
+    if "srt" in kinds:
+        srt_files = find_all_matching_files(video.video_path, SUPPORTED_SUB_EXTS, prefix_len=12)
+        srt_path = srt_files[0] if srt_files else None
+        if srt_path and srt_path != video.srt_path:
+            video.srt_path = srt_path
+            video.companion["srt_external"] = True
+            video.companion["srt_container"] = False
+            updated.append("srt")
+        elif srt_path is None and video.srt_path and not Path(video.srt_path).exists():
+            video.srt_path = None
+            video.companion["srt_external"] = False
+            video.companion["srt_container"] = False
+            updated.append("srt")
+        elif video.srt_path and Path(video.srt_path).name in file_names:
+            updated.append("srt")
+
+    if "variants" in kinds:
+        variants = find_specialized_video_files(video.video_path)
+        softsubs_path = variants.get("softsubs_file")
+        hardsubs_path = variants.get("hardsubs_file")
+        if (softsubs_path, hardsubs_path) != (video.softsubs_path, video.hardsubs_path):
+            video.softsubs_path = softsubs_path
+            video.hardsubs_path = hardsubs_path
+            updated.append("variants")
+
+    if "thumbnail" in kinds:
+        thumbnail_path = find_sample_thumbnail(video.video_path)
+        if thumbnail_path and thumbnail_path != video.thumbnail_path:
+            video.thumbnail_path = thumbnail_path
+            video.companion["thumbnail_sample"] = True
+            video.companion["thumbnail_generated"] = False
+            updated.append("thumbnail")
+        elif thumbnail_path is None and video.thumbnail_path and not Path(video.thumbnail_path).exists():
+            video.thumbnail_path = None
+            video.companion["thumbnail_sample"] = False
+            video.companion["thumbnail_generated"] = False
+            updated.append("thumbnail")
+        elif video.thumbnail_path and Path(video.thumbnail_path).name in file_names:
+            updated.append("thumbnail")
+
+    return updated, json_error
+
+
+def profile_skip_reason(video: VideoItem, profile_data: Dict[str, Any]) -> Optional[str]:
+    """
+    Prüft die Requirements eines Profils.
+
+    Returns:
+        None wenn erfüllt, sonst kurzer Grund ("JSON fehlt", "SRT fehlt")
+    """
+    if profile_data.get('requires_json', True) and not video.has_json:
+        return "JSON fehlt"
+    if profile_data.get('requires_srt', False) and not video.has_srt:
+        return "SRT fehlt"
+    return None
+
+
+def select_upload_video_path(video: VideoItem, profile_name: str) -> str:
+    """
+    Wählt die Video-Variante für ein Profil.
+    social_subtitled → hardsubs, andere → softsubs oder Basis-Video.
+    """
+    if profile_name == "social_subtitled" and video.hardsubs_path:
+        return video.hardsubs_path
+    if video.softsubs_path:
+        return video.softsubs_path
+    return video.video_path
+
+
+def factsheet_with_thumbnail(video: VideoItem) -> Dict[str, Any]:
+    """Kopie des Factsheets, bei der ein gefundenes Thumbnail leere Angaben ersetzt."""
+    factsheet = video.factsheet_data.copy()
+    if video.thumbnail_path:
+        # Überschreibe thumbnail wenn vorhanden (auch wenn bereits als dict mit file:null gesetzt)
+        existing_thumb = factsheet.get('thumbnail')
+        if existing_thumb is None:
+            factsheet['thumbnail'] = video.thumbnail_path
+        elif isinstance(existing_thumb, dict) and not existing_thumb.get('file'):
+            # thumbnail.file ist null/leer → ersetze mit gefundenem Thumbnail
+            factsheet['thumbnail'] = video.thumbnail_path
+        elif isinstance(existing_thumb, str) and not existing_thumb:
+            # Leerer String → ersetze
+            factsheet['thumbnail'] = video.thumbnail_path
+    return factsheet
+
+
+def upload_video_profile(
+    video: VideoItem,
+    profile_name: str,
+    profile_data: Dict[str, Any],
+    duplicate_index=None,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    status_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> UploadResult:
+    """
+    Lädt ein (Video, Profil)-Paar hoch.
+
+    Args:
+        video: VideoItem mit gültigem Factsheet
+        profile_name: Name des Profils
+        profile_data: Profil-Daten
+        duplicate_index: Optionaler DuplicateIndex des Batches (Titel-Prüfung)
+        progress_callback: Fortschritt 0.0-1.0
+        status_callback: Status-Events von upload()
+
+    Returns:
+        UploadResult
+
+    Raises:
+        Exception: Bei Duplikaten oder Upload-Fehlern
+    """
+    from app.uploader import upload
+
+    upload_video_path = select_upload_video_path(video, profile_name)
+    factsheet = factsheet_with_thumbnail(video)
+
+    # Prüfe ob Video mit gleichem Titel bereits existiert (lokaler Titel-Index)
+    title = factsheet.get("snippet", {}).get("title", "")
+    prevent_duplicates = profile_data.get("prevent_duplicates", True)
+    reserved = False
+    if title and prevent_duplicates and duplicate_index is not None:
+        existing_id = duplicate_index.reserve(title)
+        if existing_id == duplicate_index.PENDING:
+            raise Exception("Video mit gleichem Titel wird bereits in diesem Batch hochgeladen.")
+        if existing_id:
+            raise Exception(
+                f"Video existiert bereits (ID: {existing_id[:8]}...). "
+                f"Bitte erst im Asset-Manager löschen, dann neu hochladen."
+            )
+        reserved = True
+
+    try:
+        result = upload(
+            video_path=upload_video_path,
+            srt_path=video.srt_path,
+            factsheet_data=factsheet,
+            profile_data=profile_data,
+            progress_callback=progress_callback,
+            status_callback=status_callback
+        )
+    except Exception:
+        if reserved:
+            duplicate_index.release(title)
+        raise
+
+    if duplicate_index is not None:
+        duplicate_index.confirm(title, result.video_id)
+    return result
+
+
+def format_upload_status(profile_name: str, event: str, payload: Dict[str, Any]) -> Optional[str]:
+    """Erzeugt lesbaren Status-Text für Upload-Events."""
+    prefix = f"↻ {profile_name}: "
+
+    if event == "auth_start":
+        return prefix + "Authentifiziere..."
+    if event == "auth_success":
+        return prefix + "Authentifizierung OK"
+    if event == "metadata_ready":
+        status = payload.get("status") or "n/a"
+        return prefix + f"Metadaten bereit ({status})"
+    if event == "upload_start":
+        filename = payload.get('filename', '')
+        return prefix + f"Lade Video hoch: {filename}"
+    if event == "upload_resume":
+        offset_mb = payload.get('offset', 0) // (1024 * 1024)
+        return prefix + f"Setze Upload fort (ab ca. {offset_mb} MB)"
+    if event == "retry":
+        attempt = payload.get("attempt", 0)
+        max_retries = max(1, payload.get("max_attempts", 1) - 1)
+        delay = payload.get("delay", 0)
+        reason = payload.get("reason", "")
+        return prefix + f"Wiederholung {attempt}/{max_retries} in {delay:.0f}s ({reason[:30]})"
+    if event == "upload_success":
+        video_id = payload.get('video_id', 'n/a')
+        return prefix + f"Video-Upload erfolgreich! (ID: {video_id[:8]}...)"
+    if event == "captions_start":
+        filename = payload.get('filename', '')
+        return prefix + f"Lade Untertitel hoch: {filename}"
+    if event == "captions_success":
+        lang = payload.get("language", "de")
+        return prefix + f"Untertitel-Upload erfolgreich ({lang})"
+    if event == "captions_error":
+        message = payload.get("message", "Fehler")
+        return prefix + f"Untertitel-Fehler: {message[:40]}..."
+    if event == "thumbnail_start":
+        filename = payload.get('filename', '')
+        return prefix + f"Lade Thumbnail hoch: {filename}"
+    if event == "thumbnail_success":
+        return prefix + "Thumbnail-Upload erfolgreich"
+    if event == "thumbnail_error":
+        message = payload.get("message", "Fehler")
+        return prefix + f"Thumbnail-Fehler: {message[:40]}..."
+
+    return None
+
+
+def write_upload_log(
+    video: VideoItem,
+    profile_name: str,
+    success: bool,
+    result: UploadResult = None,
+    error_message: str = ""
+):
+    """Schreibt Upload-Ergebnis in yt_upload.log im Video-Verzeichnis."""
+    try:
+        log_dir = Path(video.video_path).parent
+        log_dir.mkdir(parents=True, exist_ok=True)
+        log_file = log_dir / "yt_upload.log"
+
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        video_name = Path(video.video_path).name
+
+        if success and result:
+            lines = [
+                f"[{timestamp}] {video_name} [{profile_name}]",
+                "STATUS: SUCCESS",
+                f"WATCH: {result.watch_url}",
+                f"EMBED: {result.embed_url}",
+                f"VIDEO_ID: {result.video_id}",
+                ""
+            ]
+        else:
+            error_preview = (error_message or "Unbekannter Fehler").strip()
+            lines = [
+                f"[{timestamp}] {video_name} [{profile_name}]",
+                "STATUS: ERROR",
+                f"MESSAGE: {error_preview}",
+                ""
+            ]
+
+        # Parallele Uploads schreiben ggf. in dieselbe Log-Datei
+        with _log_lock:
+            with log_file.open("a", encoding="utf-8") as f:
+                f.write("\n".join(lines))
+
+    except Exception as log_error:
+        print(f"⚠ Konnte Upload-Log nicht schreiben ({video.video_name}): {log_error}")
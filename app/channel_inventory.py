@@ -0,0 +1,413 @@
+"""
+Lokales Inventar aller Uploads des Kanals (Cache für Asset-Manager und Duplikat-Prüfung).
+
+Die Liste der Video-IDs wird seitenweise über die Uploads-Playlist gelesen, die
+Video-Details pro 50er-Block mit ETag abgefragt. Spätere Syncs laden nur neue
+Videos vollständig nach; unveränderte Blöcke antworten mit 304 Not Modified.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from app.retry import execute_with_retry
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+INVENTORY_FILE = REPO_ROOT / ".config/channel_inventory.json"
+
+# Maximale Anzahl IDs pro playlistItems/videos-Request (API-Limit)
+PAGE_SIZE = 50
+VIDEO_PARTS = "snippet,statistics,status,contentDetails"
+
+
+class ChannelInventory:
+    """Persistenter, inkrementell synchronisierter Video-Bestand des Kanals."""
+
+    def __init__(self, store_path: Path = INVENTORY_FILE):
+        self.store_path = Path(store_path)
+        self._lock = threading.RLock()
+        self._sync_lock = threading.Lock()
+
+        self.uploads_playlist: Optional[str] = None
+        self.synced_at: Optional[str] = None
+        self._order: List[str] = []  # Video-IDs, neueste zuerst
+        self._videos: Dict[str, Dict[str, Any]] = {}
+        self._chunk_etags: Dict[str, str] = {}
+        self._dirty: set = set()
+
+        self._load()
+
+    # ====================
+    # Lesen
+    # ====================
+    def has_cache(self) -> bool:
+        """True, wenn bereits ein Sync stattgefunden hat."""
+        with self._lock:
+            return self.synced_at is not None
+
+    def cached_videos(self, max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Liefert gecachte Videos (neueste zuerst) ohne API-Aufruf.
+
+        Args:
+            max_results: Optionale Obergrenze (None = alle)
+        """
+        with self._lock:
+            ids = self._order if max_results is None else self._order[:max_results]
+            return [self._videos[vid] for vid in ids if vid in self._videos]
+
+    def get_video(self, video_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self._videos.get(video_id)
+
+    # ====================
+    # Lokale Änderungen
+    # ====================
+    def invalidate(self, video_ids: Iterable[str]):
+        """Markiert Videos als geändert; der nächste Sync lädt sie neu."""
+        with self._lock:
+            self._dirty.update(vid for vid in video_ids if vid)
+
+    def add_uploaded(self, video: Dict[str, Any]):
+        """
+        Nimmt ein gerade hochgeladenes Video sofort ins Inventar auf.
+
+        Die Uploads-Playlist zeigt neue Videos oft erst nach einigen Minuten;
+        bis dahin hält das Inventar den Eintrag aus der Insert-Response.
+
+        Args:
+            video: Response von videos().insert (mit id, snippet, status)
+        """
+        video_id = video.get("id")
+        if not video_id:
+            return
+        with self._lock:
+            self._videos[video_id] = video
+            if video_id not in self._order:
+                self._order.insert(0, video_id)
+            self._dirty.add(video_id)
+            self._save()
+
+    def remove(self, video_ids: Iterable[str]):
+        """Entfernt Videos aus dem Inventar (z.B. nach dem Löschen)."""
+        removed = set(video_ids)
+        if not removed:
+            return
+        with self._lock:
+            self._order = [vid for vid in self._order if vid not in removed]
+            for vid in removed:
+                self._videos.pop(vid, None)
+            self._dirty.difference_update(removed)
+            self._save()
+
+    # ====================
+    # Sync
+    # ====================
+    def sync(self, youtube, refresh_existing: bool = True) -> List[Dict[str, Any]]:
+        """
+        Gleicht das Inventar mit YouTube ab.
+
+        Args:
+            youtube: YouTube API-Client
+            refresh_existing: True = bekannte Videos per ETag auf Änderungen prüfen,
+                              False = nur neue und als geändert markierte Videos laden
+
+        Returns:
+            Alle Videos (neueste zuerst)
+
+        Raises:
+            HttpError: Bei API-Fehlern
+        """
+        # Nur ein Sync gleichzeitig; Leser bleiben währenddessen unblockiert
+        with self._sync_lock:
+            if not self.uploads_playlist:
+                self.uploads_playlist = self._fetch_uploads_playlist(youtube)
+                if not self.uploads_playlist:
+                    return []
+
+            order = self._list_video_ids(youtube)
+
+            listed = set(order)
+            with self._lock:
+                known = set(self._videos)
+                dirty = set(self._dirty)
+                # Lokal hinzugefügte Uploads, die noch nicht in der Playlist stehen
+                unlisted = [vid for vid in self._order if vid in dirty and vid not in listed]
+            new_ids = [vid for vid in order if vid not in known]
+
+            changed: Dict[str, Dict[str, Any]] = {}
+            missing: set = set()
+            if refresh_existing:
+                changed, missing = self._refresh_known(youtube, [vid for vid in order if vid in known])
+
+            # Neue Videos und lokal geänderte, die der Refresh nicht schon geliefert hat
+            dirty_known = [
+                vid for vid in order
+                if vid in dirty and vid in known and vid not in changed and vid not in missing
+            ]
+            fetched = self._fetch_details(youtube, new_ids + dirty_known + unlisted)
+            fetched.update(changed)
+            order = [vid for vid in unlisted if vid in fetched] + order
+
+            with self._lock:
+                self._videos.update(fetched)
+                # Lokale Uploads (auch während des Syncs per add_uploaded() hinzugekommene),
+                # die YouTube noch nicht liefert, bleiben erhalten
+                listed_now = set(order)
+                pending = [
+                    vid for vid in self._order
+                    if vid in self._dirty and vid in self._videos
+                    and vid not in fetched and vid not in missing and vid not in listed_now
+                ]
+                self._order = pending + [vid for vid in order if vid in self._videos and vid not in missing]
+                for vid in set(self._videos) - set(self._order):
+                    self._videos.pop(vid, None)
+                self._dirty.difference_update(fetched)
+                self._dirty.difference_update(missing)
+                self.synced_at = datetime.now().isoformat(timespec="seconds")
+                self._save()
+
+            print(f"✓ Kanal-Inventar: {len(self._order)} Videos ({len(new_ids)} neu, {len(fetched)} geladen)")
+            return self.cached_videos()
+
+    def _fetch_uploads_playlist(self, youtube) -> Optional[str]:
+        channels_response = execute_with_retry(youtube.channels().list(
+            part="contentDetails",
+            mine=True
+        ))
+
+        items = channels_response.get("items", [])
+        if not items:
+            return None
+        return items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+
+    def _list_video_ids(self, youtube) -> List[str]:
+        """
+        Liest die Video-IDs der Uploads-Playlist seitenweise (neueste zuerst).
+
+        Sobald eine Seite nur bekannte IDs enthält und die Gesamtzahl zum Cache
+        passt, wird abgebrochen und der Rest der Reihenfolge aus dem Cache übernommen.
+        """
+        with self._lock:
+            known = set(self._videos)
+            cached_order = list(self._order)
+
+        collected: List[str] = []
+        total = None
+        page_token = None
+
+        while True:
+            response = execute_with_retry(youtube.playlistItems().list(
+                part="contentDetails",
+                playlistId=self.uploads_playlist,
+                maxResults=PAGE_SIZE,
+                pageToken=page_token
+            ))
+
+            if total is None:
+                total = response.get("pageInfo", {}).get("totalResults")
+
+            page_ids = [
+                entry["contentDetails"]["videoId"]
+                for entry in response.get("items", [])
+            ]
+            collected.extend(page_ids)
+
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
+
+            if known and page_ids and all(vid in known for vid in page_ids) and total is not None:
+                new_count = sum(1 for vid in collected if vid not in known)
+                if new_count + len(known) == total:
+                    seen = set(collected)
+                    collected.extend(vid for vid in cached_order if vid not in seen)
+                    break
+
+        return collected
+
+    def _fetch_details(self, youtube, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Lädt vollständige Video-Ressourcen für die angegebenen IDs."""
+        result: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(video_ids), PAGE_SIZE):
+            chunk = video_ids[start:start + PAGE_SIZE]
+            response = execute_with_retry(youtube.videos().list(
+                part=VIDEO_PARTS,
+                id=",".join(chunk),
+                maxResults=PAGE_SIZE
+            ))
+            for item in response.get("items", []):
+                result[item["id"]] = item
+        return result
+
+    def _refresh_known(self, youtube, video_ids: List[str]):
+        """
+        Prüft bekannte Videos blockweise mit If-None-Match auf Änderungen.
+
+        Blöcke werden vom ältesten Video aus gebildet, damit neue Uploads die
+        Blockgrenzen (und damit die gespeicherten ETags) nicht verschieben.
+
+        Returns:
+            (geänderte Videos, IDs die auf YouTube nicht mehr existieren)
+        """
+        from googleapiclient.errors import HttpError
+
+        changed: Dict[str, Dict[str, Any]] = {}
+        missing: set = set()
+        oldest_first = list(reversed(video_ids))
+
+        for start in range(0, len(oldest_first), PAGE_SIZE):
+            chunk = oldest_first[start:start + PAGE_SIZE]
+            chunk_key = ",".join(chunk)
+
+            request = youtube.videos().list(
+                part=VIDEO_PARTS,
+                id=chunk_key,
+                maxResults=PAGE_SIZE
+            )
+            with self._lock:
+                etag = self._chunk_etags.get(chunk_key)
+            if etag:
+                request.headers["If-None-Match"] = etag
+
+            try:
+                response = execute_with_retry(request)
+            except HttpError as e:
+                if getattr(e, "resp", None) is not None and e.resp.status == 304:
+                    continue  # Block unverändert
+                raise
+
+            with self._lock:
+                if response.get("etag"):
+                    self._chunk_etags[chunk_key] = response["etag"]
+                for item in response.get("items", []):
+                    cached = self._videos.get(item["id"])
+                    if not cached or cached.get("etag") != item.get("etag"):
+                        changed[item["id"]] = item
+
+            returned = {item["id"] for item in response.get("items", [])}
+            missing.update(vid for vid in chunk if vid not in returned)
+
+        # Veraltete Block-ETags verwerfen
+        with self._lock:
+            valid_keys = {
+                ",".join(oldest_first[i:i + PAGE_SIZE])
+                for i in range(0, len(oldest_first), PAGE_SIZE)
+            }
+            self._chunk_etags = {k: v for k, v in self._chunk_etags.items() if k in valid_keys}
+
+        return changed, missing
+
+    # ====================
+    # Persistenz
+    # ====================
+    def _load(self):
+        if not self.store_path.exists():
+            return
+        try:
+            with self.store_path.open("r", encoding="utf-8") as infile:
+                data = json.load(infile)
+        except Exception as e:
+            print(f"⚠ Kanal-Inventar konnte nicht geladen werden: {e}")
+            return
+
+        self.uploads_playlist = data.get("uploads_playlist")
+        self.synced_at = data.get("synced_at")
+        self._videos = data.get("videos") or {}
+        self._order = [vid for vid in data.get("order") or [] if vid in self._videos]
+        self._chunk_etags = data.get("chunk_etags") or {}
+
+    def _save(self):
+        data = {
+            "uploads_playlist": self.uploads_playlist,
+            "synced_at": self.synced_at,
+            "order": self._order,
+            "videos": self._videos,
+            "chunk_etags": self._chunk_etags
+        }
+        try:
+            self.store_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.store_path.with_suffix(".tmp")
+            with tmp_path.open("w", encoding="utf-8") as outfile:
+                json.dump(data, outfile, ensure_ascii=False)
+            tmp_path.replace(self.store_path)
+        except Exception as e:
+            print(f"⚠ Kanal-Inventar konnte nicht gespeichert werden: {e}")
+
+
+class DuplicateIndex:
+    """
+    Titel-Index des Kanals für die Duplikat-Prüfung beim Upload.
+
+    Wird einmal pro Batch aus dem Inventar aufgebaut; Lookups sind O(1).
+    Titel, die im selben Batch gerade hochgeladen werden, sind reserviert,
+    damit parallele Uploads desselben Titels sich gegenseitig erkennen.
+    """
+
+    PENDING = "pending"  # Platzhalter-ID für laufende Uploads im selben Batch
+
+    def __init__(self, videos: Iterable[Dict[str, Any]]):
+        self._lock = threading.Lock()
+        self._by_title: Dict[str, str] = {}
+        self._reserved: Dict[str, int] = {}
+
+        # Älteste zuerst eintragen, damit bei gleichen Titeln das neueste Video gewinnt
+        for video in reversed(list(videos)):
+            title = video.get("snippet", {}).get("title", "")
+            if title:
+                self._by_title[title] = video.get("id", "")
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._by_title)
+
+    def find(self, title: str) -> Optional[str]:
+        """Video-ID eines vorhandenen Videos mit exakt diesem Titel (oder None)."""
+        with self._lock:
+            return self._by_title.get(title)
+
+    def reserve(self, title: str) -> Optional[str]:
+        """
+        Prüft einen Titel und reserviert ihn für einen Upload.
+
+        Returns:
+            None wenn reserviert, sonst Video-ID des Duplikats
+            (DuplicateIndex.PENDING, falls derselbe Titel gerade hochgeladen wird)
+        """
+        with self._lock:
+            existing = self._by_title.get(title)
+            if existing:
+                return existing
+            if self._reserved.get(title):
+                return self.PENDING
+            self._reserved[title] = 1
+            return None
+
+    def release(self, title: str):
+        """Gibt eine Reservierung frei (Upload fehlgeschlagen)."""
+        with self._lock:
+            self._reserved.pop(title, None)
+
+    def confirm(self, title: str, video_id: str):
+        """Trägt ein erfolgreich hochgeladenes Video ein."""
+        with self._lock:
+            self._reserved.pop(title, None)
+            if title and video_id:
+                self._by_title[title] = video_id
+
+
+_inventory: Optional[ChannelInventory] = None
+_inventory_lock = threading.Lock()
+
+
+def get_channel_inventory() -> ChannelInventory:
+    """Liefert die prozessweite Inventar-Instanz."""
+    global _inventory
+    with _inventory_lock:
+        if _inventory is None:
+            _inventory = ChannelInventory()
+        return _inventory
@@ -0,0 +1,102 @@
+"""
+Adaptive Chunk-Größe für Resumable-Uploads.
+
+Startet mit kleinen Chunks und wächst anhand des gemessenen Durchsatzes bis zu
+einer konfigurierbaren Obergrenze. Nach Fehlern wird die Chunk-Größe halbiert.
+Alle Größen sind Vielfache von 256 KiB (Vorgabe der YouTube-Upload-API).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from googleapiclient.http import MediaIoBaseUpload
+
+from app.config import UPLOAD_CHUNK_MIN_MB, UPLOAD_CHUNK_MAX_MB, UPLOAD_CHUNK_TARGET_SECONDS
+
+CHUNK_ALIGNMENT = 256 * 1024
+MB = 1024 * 1024
+
+# Erfolgreiche Chunks nach einem Fehler, bevor wieder vergrößert wird
+GROWTH_COOLDOWN_CHUNKS = 3
+
+
+def align_chunk_size(size: float) -> int:
+    """Rundet auf ein Vielfaches von 256 KiB ab (mindestens 256 KiB)."""
+    return max(CHUNK_ALIGNMENT, int(size) // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT)
+
+
+class AdaptiveChunkSizer:
+    """
+    Bestimmt die Chunk-Größe für den nächsten Upload-Request.
+
+    Ziel: Jeder Chunk dauert etwa target_seconds. Bei schneller Leitung wächst die
+    Größe (höchstens Verdopplung pro Chunk), nach Fehlern wird sie halbiert und
+    wächst erst nach einigen erfolgreichen Chunks wieder.
+    """
+
+    def __init__(
+        self,
+        min_bytes: int = UPLOAD_CHUNK_MIN_MB * MB,
+        max_bytes: int = UPLOAD_CHUNK_MAX_MB * MB,
+        target_seconds: float = UPLOAD_CHUNK_TARGET_SECONDS
+    ):
+        self.min_bytes = align_chunk_size(min_bytes)
+        self.max_bytes = max(self.min_bytes, align_chunk_size(max_bytes))
+        self.target_seconds = max(0.5, float(target_seconds))
+
+        self.current = self.min_bytes
+        self.throughput: Optional[float] = None  # Bytes/Sekunde (gleitender Mittelwert)
+        self.errors = 0
+        self._cooldown = 0
+
+    @classmethod
+    def for_profile(cls, profile_data: Optional[Dict[str, Any]] = None) -> "AdaptiveChunkSizer":
+        """
+        Erstellt einen Sizer mit optionalen Profil-Overrides.
+
+        Profil-Schlüssel (alle optional):
+            upload:
+              chunk_min_mb: 1
+              chunk_max_mb: 128
+              chunk_target_seconds: 8
+        """
+        settings = (profile_data or {}).get("upload") or {}
+        return cls(
+            min_bytes=int(float(settings.get("chunk_min_mb", UPLOAD_CHUNK_MIN_MB)) * MB),
+            max_bytes=int(float(settings.get("chunk_max_mb", UPLOAD_CHUNK_MAX_MB)) * MB),
+            target_seconds=float(settings.get("chunk_target_seconds", UPLOAD_CHUNK_TARGET_SECONDS))
+        )
+
+    def record_success(self, sent_bytes: int, seconds: float):
+        """Verarbeitet einen erfolgreich übertragenen Chunk und passt die Größe an."""
+        if sent_bytes <= 0 or seconds <= 0:
+            return
+
+        rate = sent_bytes / seconds
+        self.throughput = rate if self.throughput is None else 0.7 * self.throughput + 0.3 * rate
+
+        if self._cooldown > 0:
+            self._cooldown -= 1
+            return
+
+        wanted = self.throughput * self.target_seconds
+        wanted = min(wanted, self.current * 2)
+        self.current = min(self.max_bytes, max(self.min_bytes, align_chunk_size(wanted)))
+
+    def record_failure(self):
+        """Halbiert die Chunk-Größe nach einem fehlgeschlagenen Chunk."""
+        self.errors += 1
+        self._cooldown = GROWTH_COOLDOWN_CHUNKS
+        self.current = max(self.min_bytes, align_chunk_size(self.current / 2))
+
+
+class AdaptiveMediaUpload(MediaIoBaseUpload):
+    """MediaIoBaseUpload, dessen Chunk-Größe vom AdaptiveChunkSizer kommt."""
+
+    def __init__(self, fd, mimetype: str, sizer: AdaptiveChunkSizer):
+        super().__init__(fd, mimetype, chunksize=sizer.current, resumable=True)
+        self.sizer = sizer
+
+    def chunksize(self) -> int:
+        return self.sizer.current
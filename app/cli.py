@@ -0,0 +1,488 @@
+"""
+Kommandozeilen-Interface für Batch-Uploads ohne GUI (Server, Cron, Render-Farm).
+
+Beispiele:
+    python -m app.cli upload /renders/heute --profiles neutral_embed,public_youtube --jobs 4
+    python -m app.cli watch /renders/podcast --stable-seconds 60
+
+Fortschritt wird als Textzeilen oder mit --json als JSON-Lines auf stdout
+ausgegeben (übrige Meldungen gehen dann nach stderr).
+
+Exit-Codes: 0 = alles hochgeladen, 1 = mind. ein Upload fehlgeschlagen,
+2 = Aufruf-/Konfigurationsfehler (Profile, Ordner, Authentifizierung),
+130 = mit Ctrl+C abgebrochen.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+EXIT_OK = 0
+EXIT_UPLOAD_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+class ProgressPrinter:
+    """Gibt Batch-Ereignisse als Text- oder JSON-Zeilen aus (thread-sicher)."""
+
+    def __init__(self, stream: TextIO, as_json: bool = False):
+        self.stream = stream
+        self.as_json = as_json
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields: Any):
+        if self.as_json:
+            line = json.dumps({"ts": round(time.time(), 3), "event": event, **fields}, ensure_ascii=False)
+        else:
+            line = self._format_text(event, fields)
+            if line is None:
+                return
+        with self._lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    @staticmethod
+    def _format_text(event: str, fields: Dict[str, Any]) -> Optional[str]:
+        label = f"[{fields.get('video', '')} | {fields.get('profile', '')}]"
+
+        if event == "watch_start":
+            return (
+                f"👁 Überwache {len(fields['directories'])} Ordner "
+                f"(fertig nach {fields['stable_seconds']:.0f}s ohne Änderung, benötigt: {', '.join(fields['require'])})"
+            )
+        if event == "set_incomplete":
+            return f"… [{fields.get('video', '')}] wartet auf: {', '.join(fields.get('missing', []))}"
+        if event == "set_ready":
+            return f"● [{fields.get('video', '')}] vollständig und stabil, wird hochgeladen"
+        if event == "batch_start":
+            return f"▶ {fields['jobs']} Upload(s) für {fields['videos']} Video(s), {fields['workers']} parallel"
+        if event == "skipped":
+            return f"○ {label} übersprungen: {fields.get('reason', '')}"
+        if event == "job_start":
+            return f"↻ {label} startet"
+        if event == "progress":
+            return f"↻ {label} {fields['percent']}%"
+        if event == "status":
+            # Text aus format_upload_status() beginnt bereits mit "↻ <Profil>: "
+            return f"{fields.get('status')} [{fields.get('video', '')}]"
+        if event == "companion":
+            return f"  [{fields.get('video', '')}] {fields.get('note', '')}"
+        if event == "planned":
+            return f"  geplant: {label}"
+        if event == "auth_required":
+            return f"🔐 YouTube-Login erforderlich: {fields.get('url', '')}"
+        if event == "error":
+            return f"❌ {fields.get('message', '')}"
+        if event == "job_done":
+            return f"✓ {label} {fields['watch_url']}"
+        if event == "job_failed":
+            return f"✗ {label} {fields.get('error', '')}"
+        if event == "batch_done":
+            return (
+                f"■ Fertig: {fields['success']} erfolgreich, {fields['failed']} Fehler, "
+                f"{fields['skipped']} übersprungen ({fields['seconds']:.0f}s)"
+            )
+        return f"{event} {fields}"
+
+
+def collect_videos(paths: List[str], recursive: bool = False) -> List[str]:
+    """
+    Sammelt Video-Dateien aus Datei- und Ordner-Argumenten (ohne Duplikate).
+
+    Raises:
+        FileNotFoundError: Wenn ein Pfad nicht existiert
+    """
+    from app.batch_upload import find_videos_in_directory
+
+    videos: List[str] = []
+    for raw_path in paths:
+        path = Path(raw_path).expanduser().resolve()
+        if not path.exists():
+            raise FileNotFoundError(f"Pfad nicht gefunden: {raw_path}")
+        found = find_videos_in_directory(str(path), recursive) if path.is_dir() else [str(path)]
+        for video_path in found:
+            if video_path not in videos:
+                videos.append(video_path)
+    return videos
+
+
+def run_batch_upload(
+    video_paths: List[str],
+    profile_names: Optional[List[str]],
+    printer: ProgressPrinter,
+    jobs: Optional[int] = None,
+    dry_run: bool = False
+) -> int:
+    """
+    Lädt alle (Video, Profil)-Paare hoch, wie der Batch-Modus der GUI.
+
+    Args:
+        video_paths: Video-Dateien
+        profile_names: Profile für alle Videos (None = gespeicherte Auswahl aus der GUI,
+            sonst default_selected-Profile, deren Requirements erfüllt sind)
+        printer: Ausgabe für Fortschritts-Ereignisse
+        jobs: Anzahl paralleler Uploads (None = UPLOAD_CONCURRENCY)
+        dry_run: Nur geplante Uploads ausgeben
+
+    Returns:
+        Exit-Code
+    """
+    from app.config import UPLOAD_CONCURRENCY
+    from app.companion import check_ffmpeg_available
+    from app.matching import validate_video_file
+    from app.profiles import load_profiles, get_profile, ProfileError
+    from app.favorites import load_profile_preferences, find_profile_preference
+    from app.batch_upload import (
+        init_profile_selection,
+        load_video_item,
+        process_companions,
+        profile_skip_reason,
+        upload_video_profile,
+        format_upload_status,
+        write_upload_log
+    )
+    from app.upload_scheduler import UploadScheduler, UploadJob, JOB_DONE
+
+    try:
+        profiles = load_profiles()
+        if profile_names:
+            for name in profile_names:
+                get_profile(name, profiles)
+    except ProfileError as e:
+        printer.emit("error", message=str(e))
+        return EXIT_USAGE
+
+    profile_prefs = {} if profile_names else load_profile_preferences()
+
+    ffmpeg_available, ffmpeg_error = check_ffmpeg_available()
+    if not ffmpeg_available:
+        print(f"⚠ ffmpeg nicht verfügbar: {ffmpeg_error}", file=sys.stderr)
+
+    # Videos laden und (Video, Profil)-Paare bilden
+    upload_jobs: List[UploadJob] = []
+    videos_with_jobs = set()
+    skipped = 0
+
+    for video_path in video_paths:
+        video_name = Path(video_path).name
+        is_valid, error_msg = validate_video_file(video_path)
+        if not is_valid:
+            printer.emit("skipped", video=video_name, profile="*", reason=error_msg)
+            skipped += 1
+            continue
+
+        video, json_error = load_video_item(video_path)
+        if json_error:
+            printer.emit("skipped", video=video_name, profile="*", reason=f"Ungültiges JSON: {json_error}")
+            skipped += 1
+            continue
+
+        if ffmpeg_available:
+            for note in process_companions(video):
+                printer.emit("companion", video=video_name, note=note)
+
+        if profile_names:
+            selected = profile_names
+        else:
+            selection = find_profile_preference(profile_prefs, video_path)
+            if selection is None:
+                selection = init_profile_selection(profiles, video)
+            selected = [name for name, is_selected in selection.items() if is_selected and name in profiles]
+            if not selected:
+                printer.emit("skipped", video=video_name, profile="*", reason="Kein Default-Profil erfüllt die Requirements")
+                skipped += 1
+                continue
+
+        for profile_name in selected:
+            reason = profile_skip_reason(video, profiles[profile_name])
+            if reason:
+                printer.emit("skipped", video=video_name, profile=profile_name, reason=reason)
+                skipped += 1
+                continue
+            upload_jobs.append(UploadJob(group=video.video_path, profile_name=profile_name, payload=video))
+            videos_with_jobs.add(video.video_path)
+
+    workers = max(1, jobs or UPLOAD_CONCURRENCY)
+    printer.emit(
+        "batch_start",
+        jobs=len(upload_jobs),
+        videos=len(videos_with_jobs),
+        workers=min(workers, max(1, len(upload_jobs)))
+    )
+
+    if dry_run:
+        for job in upload_jobs:
+            printer.emit("planned", video=job.payload.video_name, profile=job.profile_name)
+        return EXIT_OK
+
+    if not upload_jobs:
+        printer.emit("batch_done", success=0, failed=0, skipped=skipped, seconds=0.0)
+        return EXIT_OK
+
+    # Authentifizierung vorab (auf Servern muss token.pickle bereits vorhanden sein)
+    from app.auth import AuthError, create_youtube_client
+    from app.config import CLIENT_SECRETS_PATH, TOKEN_PATH
+
+    try:
+        create_youtube_client(
+            CLIENT_SECRETS_PATH,
+            TOKEN_PATH,
+            auth_prompt_callback=lambda url: printer.emit("auth_required", url=url)
+        )
+    except AuthError as e:
+        printer.emit("error", message=str(e))
+        return EXIT_USAGE
+
+    # Titel-Index einmal pro Batch laden (wie in der GUI)
+    duplicate_index = None
+    if any(profiles[job.profile_name].get("prevent_duplicates", True) for job in upload_jobs):
+        from app.youtube_assets import load_duplicate_index
+        try:
+            duplicate_index = load_duplicate_index()
+        except Exception as e:
+            # Netzwerkfehler fängt load_duplicate_index() selbst ab (Cache); hier nur z.B. unlesbares Inventar
+            printer.emit("error", message=f"Duplikat-Index konnte nicht geladen werden: {e}")
+            return EXIT_UPLOAD_FAILED
+
+    def run_job(job: UploadJob):
+        video = job.payload
+        fields = {"video": video.video_name, "profile": job.profile_name}
+        last_bucket = {"value": -1}
+
+        def progress_cb(progress: float):
+            percent = int(progress * 100)
+            bucket = percent // 10
+            if bucket != last_bucket["value"]:
+                last_bucket["value"] = bucket
+                printer.emit("progress", percent=percent, **fields)
+
+        def status_cb(event: str, payload: Dict[str, Any]):
+            payload = payload or {}
+            if printer.as_json:
+                printer.emit("status", status=event, data=payload, **fields)
+            else:
+                message = format_upload_status(job.profile_name, event, payload)
+                if message:
+                    printer.emit("status", status=message, **fields)
+
+        return upload_video_profile(
+            video,
+            job.profile_name,
+            get_profile(job.profile_name, profiles),
+            duplicate_index=duplicate_index,
+            progress_callback=progress_cb,
+            status_callback=status_cb
+        )
+
+    def on_job_start(job: UploadJob):
+        printer.emit("job_start", video=job.payload.video_name, profile=job.profile_name)
+
+    def on_job_finished(job: UploadJob):
+        video = job.payload
+        if job.state == JOB_DONE:
+            write_upload_log(video, job.profile_name, success=True, result=job.result)
+            printer.emit(
+                "job_done",
+                video=video.video_name,
+                profile=job.profile_name,
+                video_id=job.result.video_id,
+                watch_url=job.result.watch_url,
+                seconds=round(job.duration or 0, 1)
+            )
+        else:
+            write_upload_log(video, job.profile_name, success=False, error_message=job.error)
+            printer.emit("job_failed", video=video.video_name, profile=job.profile_name, error=job.error)
+
+    started = time.monotonic()
+    scheduler = UploadScheduler(
+        upload_jobs,
+        run_job=run_job,
+        max_workers=workers,
+        on_job_start=on_job_start,
+        on_job_finished=on_job_finished
+    )
+    try:
+        finished = scheduler.run()
+    except KeyboardInterrupt:
+        # Laufende Uploads bleiben im Journal und lassen sich später fortsetzen
+        scheduler.cancel()
+        printer.emit("error", message="Abgebrochen (laufende Uploads sind im Upload-Journal fortsetzbar)")
+        return EXIT_INTERRUPTED
+
+    success = sum(1 for job in finished if job.state == JOB_DONE)
+    failed = len(finished) - success
+    printer.emit(
+        "batch_done",
+        success=success,
+        failed=failed,
+        skipped=skipped,
+        seconds=round(time.monotonic() - started, 1)
+    )
+    return EXIT_OK if failed == 0 else EXIT_UPLOAD_FAILED
+
+
+def run_watch(
+    directories: List[str],
+    profile_names: Optional[List[str]],
+    printer: ProgressPrinter,
+    requirements: str,
+    stable_seconds: float,
+    jobs: Optional[int] = None,
+    include_existing: bool = False,
+    poll_interval: float = 2.0
+) -> int:
+    """
+    Hot-Folder-Modus: Lädt jedes fertige, stabile Companion-Set automatisch hoch.
+
+    Läuft bis Ctrl+C. Fertige Sets werden nacheinander hochgeladen (die Profile
+    eines Sets parallel, wie bei run_batch_upload).
+
+    Returns:
+        Exit-Code
+    """
+    from app.config import FOLDER_WATCH_FORCE_POLLING
+    from app.hot_folder import HotFolder, parse_requirements
+
+    try:
+        required = parse_requirements(requirements)
+    except ValueError as e:
+        printer.emit("error", message=str(e))
+        return EXIT_USAGE
+
+    for directory in directories:
+        if not Path(directory).is_dir():
+            printer.emit("error", message=f"Kein Ordner: {directory}")
+            return EXIT_USAGE
+
+    hot_folder = HotFolder(
+        directories,
+        required,
+        stable_seconds=stable_seconds,
+        include_existing=include_existing,
+        on_pending=lambda video_path, missing: printer.emit(
+            "set_incomplete", video=Path(video_path).name, missing=missing
+        ),
+        use_watchdog=not FOLDER_WATCH_FORCE_POLLING
+    )
+    printer.emit(
+        "watch_start",
+        directories=hot_folder.directories,
+        stable_seconds=stable_seconds,
+        require=sorted(required)
+    )
+
+    hot_folder.start()
+    try:
+        while True:
+            for video_path in hot_folder.poll():
+                printer.emit("set_ready", video=Path(video_path).name, path=video_path)
+                if run_batch_upload([video_path], profile_names, printer, jobs=jobs) == EXIT_INTERRUPTED:
+                    return EXIT_INTERRUPTED
+            time.sleep(poll_interval)
+    except KeyboardInterrupt:
+        printer.emit("error", message="Überwachung beendet")
+        return EXIT_INTERRUPTED
+    finally:
+        hot_folder.stop()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from app.config import HOT_FOLDER_REQUIRE, HOT_FOLDER_STABLE_SECONDS
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli",
+        description="YouTube Upload Tool ohne GUI"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    upload_parser = subparsers.add_parser("upload", help="Videos im Batch hochladen")
+    upload_parser.add_argument("paths", nargs="+", help="Video-Dateien oder Ordner")
+    upload_parser.add_argument(
+        "--profiles",
+        help="Kommagetrennte Profile für alle Videos (Default: default_selected-Profile)"
+    )
+    upload_parser.add_argument("--jobs", "-j", type=int, help="Parallele Uploads (Default: UPLOAD_CONCURRENCY)")
+    upload_parser.add_argument("--recursive", "-r", action="store_true", help="Unterordner durchsuchen")
+    upload_parser.add_argument("--json", action="store_true", help="Fortschritt als JSON-Lines ausgeben")
+    upload_parser.add_argument("--dry-run", action="store_true", help="Nur geplante Uploads anzeigen")
+
+    watch_parser = subparsers.add_parser("watch", help="Ordner überwachen und fertige Renders automatisch hochladen")
+    watch_parser.add_argument("directories", nargs="+", help="Überwachte Ordner")
+    watch_parser.add_argument(
+        "--profiles",
+        help="Kommagetrennte Profile (Default: gespeicherte Auswahl aus der GUI, sonst default_selected)"
+    )
+    watch_parser.add_argument("--jobs", "-j", type=int, help="Parallele Uploads pro Set (Default: UPLOAD_CONCURRENCY)")
+    watch_parser.add_argument(
+        "--require",
+        default=HOT_FOLDER_REQUIRE,
+        help="Zusätzlich zur JSON geforderte Dateien: softsubs, hardsubs, srt, thumbnail (Default: HOT_FOLDER_REQUIRE)"
+    )
+    watch_parser.add_argument(
+        "--stable-seconds",
+        type=float,
+        default=HOT_FOLDER_STABLE_SECONDS,
+        help="Sekunden ohne Größen-/Zeitänderung, bis ein Set als fertig gilt (Default: HOT_FOLDER_STABLE_SECONDS)"
+    )
+    watch_parser.add_argument(
+        "--include-existing",
+        action="store_true",
+        help="Beim Start bereits vorhandene Sets ebenfalls hochladen"
+    )
+    watch_parser.add_argument("--json", action="store_true", help="Fortschritt als JSON-Lines ausgeben")
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    from app.config import check_environment
+    check_environment()
+
+    # Im JSON-Modus gehören nur Ereignisse auf stdout, alle print()-Meldungen nach stderr
+    events_stream = sys.stdout
+    if args.json:
+        sys.stdout = sys.stderr
+    printer = ProgressPrinter(events_stream, as_json=args.json)
+
+    if args.command == "upload":
+        try:
+            video_paths = collect_videos(args.paths, args.recursive)
+        except FileNotFoundError as e:
+            printer.emit("error", message=str(e))
+            return EXIT_USAGE
+
+        profile_names = [name.strip() for name in args.profiles.split(",") if name.strip()] if args.profiles else None
+        return run_batch_upload(
+            video_paths,
+            profile_names,
+            printer,
+            jobs=args.jobs,
+            dry_run=args.dry_run
+        )
+
+    if args.command == "watch":
+        profile_names = [name.strip() for name in args.profiles.split(",") if name.strip()] if args.profiles else None
+        return run_watch(
+            args.directories,
+            profile_names,
+            printer,
+            requirements=args.require,
+            stable_seconds=args.stable_seconds,
+            jobs=args.jobs,
+            include_existing=args.include_existing
+        )
+
+    return EXIT_USAGE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
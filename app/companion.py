@@ -5,17 +5,43 @@ Nutzt ffmpeg/ffprobe für Video-Operationen.
 
 import subprocess
 import shutil
+import threading
 from pathlib import Path
 from typing import Tuple, Optional, List
 
+from app import artifact_cache
+from app.media_info import MediaInfoError, probe_media
+
+# ffmpeg-Optionen fließen in den Cache-Schlüssel ein (Änderung = neue Artefakte)
+THUMBNAIL_FFMPEG_OPTIONS = ("-frames:v", "1", "-q:v", "2")
+
+
+_ffmpeg_check: Optional[Tuple[bool, str]] = None
+_ffmpeg_check_lock = threading.Lock()
+
 
 def check_ffmpeg_available() -> Tuple[bool, str]:
     """
     Prüft ob ffmpeg und ffprobe verfügbar sind.
 
+    Das Ergebnis wird pro Prozess gecacht (GUI-Start, Quick-Upload-Dialog und
+    CLI starten ffmpeg/ffprobe dafür nur beim ersten Aufruf).
+
     Returns:
         (verfügbar: bool, fehlermeldung: str)
     """
+    global _ffmpeg_check
+
+    with _ffmpeg_check_lock:
+        if _ffmpeg_check is None:
+            _ffmpeg_check = _run_ffmpeg_check()
+        return _ffmpeg_check
+
+
+def _run_ffmpeg_check() -> Tuple[bool, str]:
+    if not shutil.which("ffmpeg") or not shutil.which("ffprobe"):
+        return False, "ffmpeg/ffprobe nicht im PATH gefunden"
+
     try:
         result = subprocess.run(
             ["ffmpeg", "-version"],
@@ -54,36 +80,25 @@ def find_subtitle_streams(video_path: str) -> Tuple[bool, List[int], str]:
         (erfolg: bool, stream_indices: List[int], fehlermeldung: str)
     """
     try:
-        result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "error",
-                "-select_streams", "s",
-                "-show_entries", "stream=index",
-                "-of", "csv=p=0",
-                video_path
-            ],
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        return True, list(probe_media(video_path).subtitle_streams), ""
+    except MediaInfoError as e:
+        return False, [], str(e)
 
-        if result.returncode != 0:
-            return False, [], f"ffprobe Fehler: {result.stderr}"
 
-        # Parse Stream-Indices
-        indices = []
-        for line in result.stdout.strip().split('\n'):
-            if line:
-                try:
-                    indices.append(int(line))
-                except ValueError:
-                    continue
+def get_video_duration(video_path: str) -> Optional[float]:
+    """
+    Liest die Dauer eines Videos (aus dem gecachten ffprobe-Lauf).
 
-        return True, indices, ""
+    Args:
+        video_path: Pfad zur Video-Datei
 
-    except Exception as e:
-        return False, [], f"Fehler: {str(e)}"
+    Returns:
+        Dauer in Sekunden oder None (ffprobe fehlt / Datei nicht lesbar)
+    """
+    try:
+        return probe_media(video_path).duration
+    except MediaInfoError:
+        return None
 
 
 def extract_subtitle_stream(
@@ -107,6 +122,10 @@ def extract_subtitle_stream(
     if output_path is None:
         output_path = str(video_path_obj.parent / f"{video_path_obj.stem}.srt")
 
+    cache_key = _subtitle_cache_key(video_path, stream_index, output_path)
+    if artifact_cache.restore(cache_key, Path(output_path).suffix, output_path):
+        return True, output_path, ""
+
     try:
         result = subprocess.run(
             [
@@ -129,6 +148,7 @@ def extract_subtitle_stream(
         if not Path(output_path).exists():
             return False, "", "Ausgabedatei nicht erstellt"
 
+        artifact_cache.store(cache_key, Path(output_path).suffix, output_path)
         return True, output_path, ""
 
     except Exception as e:
@@ -156,6 +176,12 @@ def generate_thumbnail(
     if output_path is None:
         output_path = str(video_path_obj.parent / f"{video_path_obj.stem}_thumb.jpg")
 
+    time_seconds = _thumbnail_time(video_path, time_seconds)
+
+    cache_key = _thumbnail_cache_key(video_path, time_seconds, output_path)
+    if artifact_cache.restore(cache_key, Path(output_path).suffix, output_path):
+        return True, output_path, ""
+
     try:
         result = subprocess.run(
             [
@@ -164,8 +190,7 @@ def generate_thumbnail(
                 "-nostdin",
                 "-ss", str(time_seconds),  # Seek zu Zeit
                 "-i", video_path,
-                "-frames:v", "1",  # Nur 1 Frame
-                "-q:v", "2",  # Qualität (2 = sehr gut)
+                *THUMBNAIL_FFMPEG_OPTIONS,  # 1 Frame, Qualität 2 (sehr gut)
                 output_path
             ],
             capture_output=True,
@@ -180,12 +205,112 @@ def generate_thumbnail(
         if not Path(output_path).exists():
             return False, "", "Thumbnail nicht erstellt"
 
+        artifact_cache.store(cache_key, Path(output_path).suffix, output_path)
         return True, output_path, ""
 
     except Exception as e:
         return False, "", f"Fehler: {str(e)}"
 
 
+def _subtitle_cache_key(video_path: str, stream_index: int, output_path: str) -> Optional[str]:
+    # Ausgabeformat ergibt sich aus der Endung
+    return artifact_cache.artifact_key(video_path, "subtitle", (stream_index, Path(output_path).suffix))
+
+
+def _thumbnail_cache_key(video_path: str, time_seconds: float, output_path: str) -> Optional[str]:
+    return artifact_cache.artifact_key(
+        video_path,
+        "thumbnail",
+        (time_seconds, Path(output_path).suffix) + THUMBNAIL_FFMPEG_OPTIONS
+    )
+
+
+def _thumbnail_time(video_path: str, time_seconds: float) -> float:
+    """Kurze Videos: Zeitpunkt in die Mitte legen, sonst liefert ffmpeg kein Bild."""
+    duration = get_video_duration(video_path)
+    if duration and time_seconds >= duration:
+        return duration / 2
+    return time_seconds
+
+
+def extract_subtitle_and_thumbnail(
+    video_path: str,
+    stream_index: int,
+    time_seconds: int = 3,
+    srt_output_path: Optional[str] = None,
+    thumb_output_path: Optional[str] = None
+) -> Tuple[bool, str, str, str]:
+    """
+    Extrahiert Untertitel-Stream und Thumbnail in einem ffmpeg-Aufruf.
+
+    Der Container wird nur einmal geöffnet und demuxt (zwei Ausgaben),
+    statt je einmal für SRT und Thumbnail.
+
+    Args:
+        video_path: Pfad zur Video-Datei
+        stream_index: Untertitel-Stream-Index (absoluter Index von ffprobe)
+        time_seconds: Zeitpunkt für Screenshot (Standard: 3s)
+        srt_output_path: Optional, Ausgabepfad SRT (default: <video_basename>.srt)
+        thumb_output_path: Optional, Ausgabepfad Thumbnail (default: <video_basename>_thumb.jpg)
+
+    Returns:
+        (erfolg: bool, srt_path: str, thumb_path: str, fehlermeldung: str)
+    """
+    video_path_obj = Path(video_path)
+
+    if srt_output_path is None:
+        srt_output_path = str(video_path_obj.parent / f"{video_path_obj.stem}.srt")
+    if thumb_output_path is None:
+        thumb_output_path = str(video_path_obj.parent / f"{video_path_obj.stem}_thumb.jpg")
+
+    time_seconds = _thumbnail_time(video_path, time_seconds)
+
+    # Schon ein Artefakt im Cache: nur das fehlende einzeln erzeugen
+    srt_key = _subtitle_cache_key(video_path, stream_index, srt_output_path)
+    thumb_key = _thumbnail_cache_key(video_path, time_seconds, thumb_output_path)
+    if (artifact_cache.lookup(srt_key, Path(srt_output_path).suffix)
+            or artifact_cache.lookup(thumb_key, Path(thumb_output_path).suffix)):
+        srt_ok, srt_path, srt_error = extract_subtitle_stream(video_path, stream_index, srt_output_path)
+        thumb_ok, thumb_path, thumb_error = generate_thumbnail(video_path, time_seconds, thumb_output_path)
+        if srt_ok and thumb_ok:
+            return True, srt_path, thumb_path, ""
+        return False, "", "", srt_error or thumb_error
+
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg",
+                "-y",  # Überschreibe existierende Dateien
+                "-nostdin",
+                "-i", video_path,
+                # Ausgabe 1: Untertitel
+                "-map", f"0:{stream_index}",
+                srt_output_path,
+                # Ausgabe 2: Ein Frame (V = ohne eingebettete Cover-Bilder)
+                "-map", "0:V:0",
+                "-ss", str(time_seconds),
+                *THUMBNAIL_FFMPEG_OPTIONS,
+                thumb_output_path
+            ],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+
+        if result.returncode != 0:
+            return False, "", "", f"ffmpeg Fehler: {result.stderr}"
+
+        if not Path(srt_output_path).exists() or not Path(thumb_output_path).exists():
+            return False, "", "", "Ausgabedateien nicht erstellt"
+
+        artifact_cache.store(srt_key, Path(srt_output_path).suffix, srt_output_path)
+        artifact_cache.store(thumb_key, Path(thumb_output_path).suffix, thumb_output_path)
+        return True, srt_output_path, thumb_output_path, ""
+
+    except Exception as e:
+        return False, "", "", f"Fehler: {str(e)}"
+
+
 def get_video_companion_files(video_path: str) -> dict:
     """
     Findet alle Companion-Dateien für ein Video basierend auf neuen Namenskonventionen.
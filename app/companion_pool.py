@@ -0,0 +1,183 @@
+"""
+Companion-Pool: Begrenzter, gemeinsamer Worker-Pool für Companion-Verarbeitung.
+
+Statt pro Video einen eigenen Thread (und damit parallele ffmpeg/ffprobe-Ketten)
+zu starten, laufen alle Aufgaben über COMPANION_WORKERS Worker. Aufgaben tragen
+einen Schlüssel (z.B. Video-Pfad):
+
+- Priorität: kleinere Zahl zuerst (z.B. sichtbare Zeilen vor unsichtbaren)
+- Deduplizierung: ein erneutes submit() für einen wartenden Schlüssel ersetzt
+  die Aufgabe; läuft sie gerade, wird genau ein Folgelauf vorgemerkt
+- Abbruch: cancel() entfernt wartende Aufgaben und Folgeläufe (laufendes
+  ffmpeg läuft zu Ende, der Aufrufer verwirft das Ergebnis)
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Set, Tuple
+
+from app.config import COMPANION_WORKERS
+
+# Prioritäten (kleiner = früher)
+PRIORITY_VISIBLE = 0
+PRIORITY_DEFAULT = 10
+
+
+@dataclass
+class _Task:
+    key: Hashable
+    fn: Callable[[], None]
+    priority: int
+    seq: int
+
+
+class CompanionPool:
+    """Führt Companion-Aufgaben mit höchstens max_workers parallelen Workern aus."""
+
+    def __init__(self, max_workers: int = COMPANION_WORKERS, name: str = "companion"):
+        """
+        Args:
+            max_workers: Anzahl paralleler Worker (mind. 1)
+            name: Präfix für Thread-Namen
+        """
+        self.max_workers = max(1, int(max_workers or 1))
+        self.name = name
+
+        self._cond = threading.Condition()
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._pending: Dict[Hashable, _Task] = {}
+        self._deferred: Dict[Hashable, _Task] = {}  # Folgeläufe für laufende Schlüssel
+        self._running: Set[Hashable] = set()
+        self._seq = itertools.count()
+        self._workers: List[threading.Thread] = []
+        self._idle_workers = 0
+        self._shutdown = False
+
+    def submit(self, key: Hashable, fn: Callable[[], None], priority: int = PRIORITY_DEFAULT) -> bool:
+        """
+        Plant eine Aufgabe ein.
+
+        Args:
+            key: Schlüssel der Aufgabe (z.B. Video-Pfad)
+            fn: Auszuführende Funktion (ohne Argumente, Exceptions werden verschluckt)
+            priority: Kleinere Zahl = früher
+
+        Returns:
+            True wenn neu eingeplant, False wenn mit einer wartenden Aufgabe zusammengelegt
+        """
+        with self._cond:
+            if self._shutdown:
+                return False
+
+            if key in self._running:
+                existing = self._deferred.get(key)
+                if existing is not None:
+                    priority = min(priority, existing.priority)
+                self._deferred[key] = _Task(key, fn, priority, next(self._seq))
+                return existing is None
+
+            existing = self._pending.get(key)
+            if existing is not None:
+                priority = min(priority, existing.priority)
+            self._push(_Task(key, fn, priority, next(self._seq)))
+            self._ensure_worker()
+            self._cond.notify()
+            return existing is None
+
+    def set_priorities(self, priorities: Dict[Hashable, int]):
+        """Ändert die Priorität wartender Aufgaben (z.B. nach dem Scrollen)."""
+        with self._cond:
+            for key, priority in priorities.items():
+                task = self._pending.get(key)
+                if task is not None and task.priority != priority:
+                    self._push(_Task(key, task.fn, priority, next(self._seq)))
+                deferred = self._deferred.get(key)
+                if deferred is not None:
+                    deferred.priority = priority
+
+    def cancel(self, key: Hashable) -> bool:
+        """
+        Entfernt wartende Aufgabe und Folgelauf eines Schlüssels.
+
+        Returns:
+            True wenn etwas entfernt wurde
+        """
+        with self._cond:
+            removed = self._pending.pop(key, None) is not None
+            removed = self._deferred.pop(key, None) is not None or removed
+            return removed
+
+    def cancel_all(self):
+        """Entfernt alle wartenden Aufgaben."""
+        with self._cond:
+            self._pending.clear()
+            self._deferred.clear()
+            self._heap.clear()
+
+    def is_busy(self, key: Hashable) -> bool:
+        """True wenn für den Schlüssel eine Aufgabe wartet oder läuft."""
+        with self._cond:
+            return key in self._pending or key in self._running
+
+    def shutdown(self):
+        """Beendet die Worker nach ihrer aktuellen Aufgabe; wartende Aufgaben verfallen."""
+        with self._cond:
+            self._shutdown = True
+            self._pending.clear()
+            self._deferred.clear()
+            self._heap.clear()
+            self._cond.notify_all()
+
+    def _push(self, task: _Task):
+        # Ältere Heap-Einträge desselben Schlüssels werden beim Entnehmen übersprungen
+        self._pending[task.key] = task
+        heapq.heappush(self._heap, (task.priority, task.seq, task.key))
+
+    def _pop(self) -> Optional[_Task]:
+        while self._heap:
+            _priority, seq, key = heapq.heappop(self._heap)
+            task = self._pending.get(key)
+            if task is not None and task.seq == seq:
+                del self._pending[key]
+                return task
+        return None
+
+    def _ensure_worker(self):
+        if len(self._pending) <= self._idle_workers or len(self._workers) >= self.max_workers:
+            return
+        worker = threading.Thread(
+            target=self._worker,
+            name=f"{self.name}-worker-{len(self._workers)}",
+            daemon=True
+        )
+        self._workers.append(worker)
+        worker.start()
+
+    def _worker(self):
+        while True:
+            with self._cond:
+                task = self._pop()
+                while task is None and not self._shutdown:
+                    self._idle_workers += 1
+                    self._cond.wait()
+                    self._idle_workers -= 1
+                    task = self._pop()
+                if task is None:
+                    return
+                self._running.add(task.key)
+
+            try:
+                task.fn()
+            except Exception as e:
+                print(f"⚠ Companion-Aufgabe fehlgeschlagen ({task.key}): {e}")
+
+            with self._cond:
+                self._running.discard(task.key)
+                follow_up = self._deferred.pop(task.key, None)
+                if follow_up is not None and not self._shutdown:
+                    self._push(follow_up)
+                    self._cond.notify()
@@ -39,6 +39,36 @@ MIN_PREFIX_LEN = 10
 MAX_PREFIX_LEN = 15
 DEFAULT_PREFIX_LEN = 12
 
+# Wie lange ein eingelesener Ordnerinhalt wiederverwendet wird (Sekunden, 0 = nie)
+DIRECTORY_INDEX_MAX_AGE_SECONDS = float(os.getenv("DIRECTORY_INDEX_MAX_AGE_SECONDS", "10"))
+
+# Ordner-Überwachung der Batch-Liste (watchdog/inotify, sonst Polling)
+FOLDER_WATCH_DEBOUNCE_SECONDS = float(os.getenv("FOLDER_WATCH_DEBOUNCE_SECONDS", "1.0"))
+FOLDER_WATCH_POLL_SECONDS = float(os.getenv("FOLDER_WATCH_POLL_SECONDS", "2.0"))
+# Polling erzwingen (z.B. SMB/NFS-Freigaben, auf denen inotify keine Ereignisse liefert)
+FOLDER_WATCH_FORCE_POLLING = os.getenv("FOLDER_WATCH_FORCE_POLLING", "0").lower() in ("1", "true", "yes")
+
+# Hot-Folder (python -m app.cli watch): Set gilt als fertig, wenn alle Dateien so lange unverändert sind
+HOT_FOLDER_STABLE_SECONDS = float(os.getenv("HOT_FOLDER_STABLE_SECONDS", "30"))
+# Zusätzlich zur JSON geforderte Companion-Arten (json, softsubs, hardsubs, srt, thumbnail)
+HOT_FOLDER_REQUIRE = os.getenv("HOT_FOLDER_REQUIRE", "softsubs,hardsubs")
+
+# Parallele Companion-Verarbeitung (ffprobe/ffmpeg) in der GUI; Default: halbe Kernzahl, max. 4
+COMPANION_WORKERS = max(1, int(os.getenv("COMPANION_WORKERS", str(min(4, max(1, (os.cpu_count() or 2) // 2))))))
+
+# Größe des Caches für extrahierte SRT, generierte Thumbnails und ffprobe-Ergebnisse (MB)
+ARTIFACT_CACHE_MAX_MB = float(os.getenv("ARTIFACT_CACHE_MAX_MB", "500"))
+
+# Anzahl Kandidaten-Frames für die automatische Thumbnail-Auswahl
+THUMBNAIL_CANDIDATES = max(1, int(os.getenv("THUMBNAIL_CANDIDATES", "8")))
+
+# Speicherbudget für skalierte Thumbnails der Batch-Tabelle (MB)
+THUMBNAIL_MEMORY_CACHE_MB = float(os.getenv("THUMBNAIL_MEMORY_CACHE_MB", "64"))
+
+# Asset-Manager: parallele Thumbnail-Downloads und Größe des Plattencaches (MB)
+THUMBNAIL_DOWNLOAD_WORKERS = max(1, int(os.getenv("THUMBNAIL_DOWNLOAD_WORKERS", "4")))
+THUMBNAIL_CACHE_MAX_MB = float(os.getenv("THUMBNAIL_CACHE_MAX_MB", "100"))
+
 # Unterstützte Dateiformate
 SUPPORTED_VIDEO_EXTS = [".mp4", ".mov", ".m4v"]
 SUPPORTED_SUB_EXTS = [".srt"]
@@ -110,6 +140,28 @@ if not CLIENT_SECRETS_PATH:
 
 TOKEN_PATH = os.getenv("YOUTUBE_TOKEN_PATH", DEFAULT_TOKEN_PATH)
 
+# ====================
+# Upload-Konfiguration
+# ====================
+# Anzahl paralleler Uploads im Batch-Modus (über .env überschreibbar)
+UPLOAD_CONCURRENCY = max(1, int(os.getenv("UPLOAD_CONCURRENCY", "3")))
+
+# Adaptive Chunk-Größe für Resumable-Uploads (MB, Vielfache von 256 KiB)
+UPLOAD_CHUNK_MIN_MB = max(1, int(os.getenv("UPLOAD_CHUNK_MIN_MB", "1")))
+UPLOAD_CHUNK_MAX_MB = max(UPLOAD_CHUNK_MIN_MB, int(os.getenv("UPLOAD_CHUNK_MAX_MB", "64")))
+# Angestrebte Dauer pro Chunk in Sekunden
+UPLOAD_CHUNK_TARGET_SECONDS = float(os.getenv("UPLOAD_CHUNK_TARGET_SECONDS", "8"))
+
+# Wiederholungen bei vorübergehenden API-/Netzwerkfehlern (Versuche inkl. erstem, max. Wartezeit in s)
+UPLOAD_RETRY_MAX_ATTEMPTS = max(1, int(os.getenv("UPLOAD_RETRY_MAX_ATTEMPTS", "8")))
+UPLOAD_RETRY_MAX_DELAY = float(os.getenv("UPLOAD_RETRY_MAX_DELAY", "64"))
+
+# Bandbreiten-Begrenzung in Mbit/s (0 = unbegrenzt)
+UPLOAD_BANDWIDTH_LIMIT_MBIT = float(os.getenv("UPLOAD_BANDWIDTH_LIMIT_MBIT", "0"))
+UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT = float(os.getenv("UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT", "0"))
+# Zeitfenster für die globale Grenze, z.B. "08:00-18:00=20;18:00-08:00=0"
+UPLOAD_BANDWIDTH_WINDOWS = os.getenv("UPLOAD_BANDWIDTH_WINDOWS", "")
+
 # ====================
 # YouTube Channel Links
 # ====================
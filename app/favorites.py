@@ -173,3 +173,26 @@ def save_profile_preferences(prefs: dict, config_path: Optional[Path] = None) ->
         return True
     except Exception:
         return False
+
+
+def find_profile_preference(prefs: dict, video_path: str) -> Optional[dict]:
+    """
+    Sucht gespeicherte Profil-Auswahl für ein Video.
+
+    Probiert zuerst den exakten Dateinamen (wie die GUI speichert), dann
+    andere Varianten desselben Basis-Videos (*_softsubs, *_hardsubs, Zeitstempel).
+
+    Returns:
+        Dict[profile_name, bool] oder None
+    """
+    from app.matching import _extract_base_name
+
+    video_stem = Path(video_path).stem
+    if video_stem in prefs:
+        return prefs[video_stem]
+
+    base_name = _extract_base_name(video_stem)
+    for stem, selection in prefs.items():
+        if _extract_base_name(stem) == base_name:
+            return selection
+    return None
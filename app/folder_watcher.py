@@ -0,0 +1,220 @@
+"""
+Ordner-Überwachung für die Batch-Liste.
+
+Meldet neue, geänderte und gelöschte Dateien in einer Menge von Ordnern.
+Nutzt watchdog (inotify/FSEvents/ReadDirectoryChangesW), falls installiert,
+sonst einen Polling-Thread mit os.scandir(). Ereignisse werden pro Ordner
+gesammelt und erst nach einer kurzen Ruhephase gemeldet, damit Editoren und
+Renderer, die Dateien in mehreren Schritten schreiben, nur ein Ereignis auslösen.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Callable, Dict, Iterable, Optional, Set, Tuple
+
+from app.config import FOLDER_WATCH_DEBOUNCE_SECONDS, FOLDER_WATCH_POLL_SECONDS
+from app.matching import invalidate_directory_index
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    WATCHDOG_AVAILABLE = False
+
+# Callback: (Ordner, geänderte Dateinamen)
+ChangeCallback = Callable[[str, Set[str]], None]
+
+
+def snapshot_directory(directory: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Liest Größe und mtime aller Dateien eines Ordners (ein os.scandir()).
+
+    Returns:
+        Dict[Dateiname, (Größe, mtime_ns)]; leer wenn der Ordner fehlt
+    """
+    snapshot = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[entry.name] = (stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    continue
+    except OSError:
+        pass
+    return snapshot
+
+
+class _WatchdogHandler(FileSystemEventHandler):
+    """Leitet watchdog-Ereignisse eines Ordners an den FolderWatcher weiter."""
+
+    def __init__(self, watcher: 'FolderWatcher', directory: str):
+        super().__init__()
+        self.watcher = watcher
+        self.directory = directory
+
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        names = {os.path.basename(event.src_path)}
+        dest_path = getattr(event, "dest_path", None)
+        if dest_path:
+            names.add(os.path.basename(dest_path))
+        self.watcher._record(self.directory, names)
+
+
+class FolderWatcher:
+    """
+    Überwacht Ordner und meldet geänderte Dateinamen gebündelt pro Ordner.
+
+    Der Callback läuft in einem Hintergrund-Thread; GUI-Code muss selbst in
+    den Mainloop wechseln (root.after).
+    """
+
+    def __init__(
+        self,
+        on_change: ChangeCallback,
+        debounce_seconds: float = FOLDER_WATCH_DEBOUNCE_SECONDS,
+        poll_seconds: float = FOLDER_WATCH_POLL_SECONDS,
+        use_watchdog: bool = True
+    ):
+        """
+        Args:
+            on_change: Callback (Ordner, Dateinamen) nach der Ruhephase
+            debounce_seconds: Ruhephase, bevor gesammelte Änderungen gemeldet werden
+            poll_seconds: Intervall des Polling-Fallbacks
+            use_watchdog: False erzwingt Polling (z.B. für Netzlaufwerke ohne inotify)
+        """
+        self.on_change = on_change
+        self.debounce_seconds = debounce_seconds
+        self.poll_seconds = poll_seconds
+        self.uses_watchdog = use_watchdog and WATCHDOG_AVAILABLE
+
+        self._lock = threading.Lock()
+        self._directories: Set[str] = set()
+        self._pending: Dict[str, Set[str]] = {}
+        self._timers: Dict[str, threading.Timer] = {}
+        self._snapshots: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        self._watches: Dict[str, object] = {}
+        self._observer = None
+        self._stop_event = threading.Event()
+        self._poll_thread: Optional[threading.Thread] = None
+
+    @property
+    def directories(self) -> Set[str]:
+        with self._lock:
+            return set(self._directories)
+
+    def start(self):
+        """Startet Observer bzw. Polling-Thread."""
+        if self.uses_watchdog:
+            self._observer = Observer()
+            self._observer.daemon = True
+            self._observer.start()
+        else:
+            self._poll_thread = threading.Thread(target=self._poll_loop, name="folder-watch-poll", daemon=True)
+            self._poll_thread.start()
+
+    def stop(self):
+        """Beendet die Überwachung (offene Ruhephasen werden verworfen)."""
+        self._stop_event.set()
+        with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._pending.clear()
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer = None
+
+    def set_directories(self, directories: Iterable[str]):
+        """Gleicht die überwachten Ordner mit der übergebenen Menge ab."""
+        wanted = {os.path.abspath(d) for d in directories if d}
+        with self._lock:
+            added = wanted - self._directories
+            removed = self._directories - wanted
+            self._directories = wanted
+
+        for directory in removed:
+            self._unwatch(directory)
+        for directory in added:
+            self._watch(directory)
+
+    def _watch(self, directory: str):
+        if self._observer is not None:
+            try:
+                watch = self._observer.schedule(_WatchdogHandler(self, directory), directory, recursive=False)
+            except OSError as e:
+                print(f"⚠ Ordner kann nicht überwacht werden ({directory}): {e}")
+                return
+            with self._lock:
+                self._watches[directory] = watch
+        else:
+            snapshot = snapshot_directory(directory)
+            with self._lock:
+                self._snapshots[directory] = snapshot
+
+    def _unwatch(self, directory: str):
+        with self._lock:
+            watch = self._watches.pop(directory, None)
+            self._snapshots.pop(directory, None)
+            self._pending.pop(directory, None)
+            timer = self._timers.pop(directory, None)
+        if timer:
+            timer.cancel()
+        if watch is not None and self._observer is not None:
+            try:
+                self._observer.unschedule(watch)
+            except (KeyError, OSError):
+                pass
+
+    def _poll_loop(self):
+        while not self._stop_event.wait(self.poll_seconds):
+            for directory in self.directories:
+                current = snapshot_directory(directory)
+                with self._lock:
+                    previous = self._snapshots.get(directory)
+                    if previous is None:
+                        continue
+                    self._snapshots[directory] = current
+                changed = {
+                    name for name in set(previous) | set(current)
+                    if previous.get(name) != current.get(name)
+                }
+                if changed:
+                    self._record(directory, changed)
+
+    def _record(self, directory: str, names: Set[str]):
+        """Sammelt Änderungen und startet die Ruhephase des Ordners neu."""
+        with self._lock:
+            if self._stop_event.is_set() or directory not in self._directories:
+                return
+            self._pending.setdefault(directory, set()).update(names)
+            timer = self._timers.pop(directory, None)
+            if timer:
+                timer.cancel()
+            timer = threading.Timer(self.debounce_seconds, self._flush, args=(directory,))
+            timer.daemon = True
+            self._timers[directory] = timer
+            timer.start()
+
+    def _flush(self, directory: str):
+        with self._lock:
+            self._timers.pop(directory, None)
+            names = self._pending.pop(directory, set())
+        if not names:
+            return
+
+        # Companion-Suche soll die neuen Dateien sofort sehen
+        invalidate_directory_index(directory)
+        try:
+            self.on_change(directory, names)
+        except Exception as e:
+            print(f"⚠ Fehler bei Ordner-Änderung ({directory}): {e}")
@@ -4,15 +4,14 @@ Erlaubt Auswahl mehrerer Videos und automatisches Matching.
 """
 
 import os
+import importlib
 import webbrowser
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk as tkttk
 from pathlib import Path
 import threading
-from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
-from datetime import datetime
+from typing import Optional, Dict, Any, List, TYPE_CHECKING
 
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
@@ -27,10 +26,14 @@ from app.config import (
     CHANNEL_PUBLIC_URL,
     CHANNEL_STUDIO_URL,
     YOUTUBE_RED,
-    YOUTUBE_LOGO
+    YOUTUBE_LOGO,
+    UPLOAD_CONCURRENCY,
+    FOLDER_WATCH_FORCE_POLLING
 )
 from app.matching import (
     find_companion_files_multi,
+    get_directory_index,
+    invalidate_directory_index,
     validate_video_file
 )
 from app.profiles import (
@@ -40,11 +43,7 @@ from app.profiles import (
     get_profile,
     ProfileError
 )
-from app.factsheet_schema import load_and_validate_factsheet
 from app.tooltips import create_tooltip
-from app.uploader import upload, UploadError, UploadResult
-from app.auth import AuthError, create_youtube_client
-from app.quick_upload_dialog import QuickUploadDialog
 from app.favorites import (
     load_favorites,
     save_favorites,
@@ -52,24 +51,71 @@ from app.favorites import (
     load_profile_preferences,
     save_profile_preferences
 )
-from app.asset_manager import AssetManagerWindow
 from app.svg_icons import (
     load_youtube_icon,
     load_upload_icon,
     load_folder_icon,
     load_close_icon
 )
-from app.youtube_assets import find_video_by_title
+from app.upload_scheduler import UploadScheduler, UploadJob, JOB_DONE
+from app.companion_pool import CompanionPool, PRIORITY_DEFAULT, PRIORITY_VISIBLE
+from app.virtual_list import VirtualList
+from app.image_cache import ImageCache, file_image_key, image_nbytes
+from app.upload_journal import pending_sessions, remove_session
+from app.batch_upload import (
+    VideoItem,
+    init_profile_selection,
+    load_video_item,
+    process_companions,
+    refresh_companions,
+    profile_skip_reason,
+    upload_video_profile,
+    format_upload_status,
+    write_upload_log
+)
+from app.bandwidth import get_bandwidth_manager
 from PIL import ImageTk
 from app.config import COLORS
 
+if TYPE_CHECKING:
+    from app.uploader import UploadResult
+
 CHANNEL_PUBLIC_URL = "https://www.youtube.com/@SchreibszeneChProfil"
 CHANNEL_STUDIO_URL = "https://studio.youtube.com/channel/UCHBvwrKQfEwEWt4bKF1p0mQ"
+
+# Auswahl für die globale Upload-Bandbreite (Mbit/s, 0 = unbegrenzt, None = .env/Zeitfenster)
+BANDWIDTH_CHOICES = [
+    ("Zeitplan (.env)", None),
+    ("Unbegrenzt", 0),
+    ("5 Mbit/s", 5),
+    ("10 Mbit/s", 10),
+    ("20 Mbit/s", 20),
+    ("50 Mbit/s", 50),
+    ("100 Mbit/s", 100),
+]
+
+# Auswahl für die Grenze pro Upload (Mbit/s, 0 = unbegrenzt, None = .env)
+PER_UPLOAD_BANDWIDTH_CHOICES = [
+    ("Standard (.env)", None),
+    ("Unbegrenzt", 0),
+    ("2 Mbit/s", 2),
+    ("5 Mbit/s", 5),
+    ("10 Mbit/s", 10),
+    ("20 Mbit/s", 20),
+    ("50 Mbit/s", 50),
+]
+
+# Erst nach dem ersten Frame geladen (Google-Client, jsonschema, requests, Zusatzfenster)
+WARMUP_MODULES = [
+    "app.factsheet_schema",
+    "app.auth",
+    "app.uploader",
+    "app.youtube_assets",
+    "app.asset_manager",
+    "app.quick_upload_dialog",
+]
 from app.companion import (
     check_ffmpeg_available,
-    find_subtitle_streams,
-    extract_subtitle_stream,
-    generate_thumbnail,
     get_video_companion_files
 )
 
@@ -133,93 +179,6 @@ def get_profiles_string(video_item: 'VideoItem') -> str:
     return ", ".join(active)
 
 
-def init_profile_selection(profiles: dict, video_item: 'VideoItem') -> Dict[str, bool]:
-    """
-    Initialisiert Profil-Auswahl basierend auf default_selected und Requirements.
-
-    Args:
-        profiles: Dict mit allen Profilen
-        video_item: VideoItem mit Companion-Status
-
-    Returns:
-        Dict[profile_name, is_selected]
-    """
-    selection = {}
-
-    for profile_name, profile_data in profiles.items():
-        # Defaults aus Profil
-        default_selected = profile_data.get('default_selected', False)
-        requires_srt = profile_data.get('requires_srt', False)
-        requires_json = profile_data.get('requires_json', True)
-
-        # Prüfe ob Requirements erfüllt
-        can_select = True
-        if requires_json and not video_item.has_json:
-            can_select = False
-        if requires_srt and not video_item.has_srt:
-            can_select = False
-
-        # Setze Selection (nur wenn Requirements erfüllt UND default_selected)
-        selection[profile_name] = default_selected and can_select
-
-    return selection
-
-
-@dataclass
-class VideoItem:
-    """Repräsentiert ein Video mit zugehörigen Dateien."""
-    video_path: str
-    srt_path: Optional[str] = None
-    json_path: Optional[str] = None
-    factsheet_data: Optional[Dict[str, Any]] = None
-    thumbnail_path: Optional[str] = None
-    status: str = "Bereit"  # Bereit, Läuft, Fertig, Fehler
-    error_msg: str = ""
-
-    # Neue: Spezialisierte Video-Varianten
-    softsubs_path: Optional[str] = None  # Video mit Container-SRT
-    hardsubs_path: Optional[str] = None  # Video mit eingebrannten Untertiteln
-
-    # Companion-Status
-    companion: Dict[str, bool] = None
-
-    # Profil-Auswahl pro Video
-    selected_profiles: Dict[str, bool] = None
-
-    # Notizen (z.B. "SRT auto-extrahiert")
-    notes: str = ""
-
-    def __post_init__(self):
-        """Initialisiert Defaults für mutable Felder."""
-        if self.companion is None:
-            self.companion = {
-                "json": False,
-                "srt_external": False,
-                "srt_container": False,
-                "thumbnail_sample": False,    # sample_*.png vorhanden
-                "thumbnail_generated": False  # Aus Video generiert
-            }
-        if self.selected_profiles is None:
-            self.selected_profiles = {}
-
-    @property
-    def video_name(self) -> str:
-        return Path(self.video_path).name
-
-    @property
-    def has_srt(self) -> bool:
-        return self.srt_path is not None
-
-    @property
-    def has_json(self) -> bool:
-        return self.json_path is not None and self.factsheet_data is not None
-
-    @property
-    def is_ready(self) -> bool:
-        """Video ist bereit wenn JSON vorhanden und mind. 1 Profil aktiv."""
-        return self.has_json and any(self.selected_profiles.values())
-
-
 class BatchUploadApp:
     """GUI für Batch-Upload mehrerer Videos."""
 
@@ -239,7 +198,8 @@ class BatchUploadApp:
         self.favorites: List[dict] = []
         self.ffmpeg_available = False
         self.profile_prefs: dict = {}
-        self.video_rows: List[dict] = []
+        self._video_row_order: List[VideoItem] = []  # Reihenfolge beim letzten Aufbau der Tabelle
+        self.thumbnail_images = ImageCache()  # Skalierte Thumbnails (PhotoImage) für alle Rows
         self.initial_auth_done = False
         self.auth_check_running = False
         self.auth_popup = None
@@ -247,6 +207,12 @@ class BatchUploadApp:
         self.batch_progress = {"current": 0, "total": 0, "success": 0, "failure": 0}
         self.last_directory_selection = str(Path.home())
         self.asset_window = None
+        self._duplicate_index = None  # Titel-Index während eines Batch-Uploads
+        self._resume_offered = False
+        self.folder_watcher = None
+        self._deferred_folder_changes: Dict[str, set] = {}
+        self.companion_pool = CompanionPool()
+        self._priority_update_pending = False
 
         # YouTube-Icon für Buttons
         self.youtube_icon = None
@@ -262,6 +228,10 @@ class BatchUploadApp:
         self._create_widgets()
         self._ensure_initial_auth()
 
+        # Schwere Module erst nach dem ersten Frame im Hintergrund laden
+        self.root.after_idle(self._start_import_warmup)
+        self.root.after_idle(self._start_folder_watcher)
+
         # Close-Handler für sauberes Beenden
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
@@ -436,48 +406,45 @@ class BatchUploadApp:
         )
         list_frame.pack(fill=BOTH, expand=YES, pady=(0, 15))
 
-        # Canvas + Scrollbar für scrollbare Tabelle
-        canvas = tk.Canvas(list_frame, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(list_frame, orient=VERTICAL, command=canvas.yview)
-        self.video_table_frame = ttk.Frame(canvas)
-
-        self.video_table_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        # Virtualisierte Tabelle: Widgets nur für sichtbare Zeilen (+ Puffer)
+        self.video_list = VirtualList(
+            list_frame,
+            create_row=self._create_video_row,
+            estimated_row_height=self.THUMB_DISPLAY_WIDTH + 10,
+            on_scroll=self._on_video_table_scroll
         )
+        self.video_list.pack(fill=BOTH, expand=YES)
 
-        canvas.create_window((0, 0), window=self.video_table_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side=LEFT, fill=BOTH, expand=YES)
-        scrollbar.pack(side=RIGHT, fill=Y)
-
-        # Grid-Konfiguration
-        self.video_table_frame.columnconfigure(0, weight=0, minsize=self.THUMB_DISPLAY_WIDTH + 10)   # Thumbnail
-        self.video_table_frame.columnconfigure(1, weight=3, minsize=300)  # Video
-        self.video_table_frame.columnconfigure(2, weight=2, minsize=200)  # Profile
-        self.video_table_frame.columnconfigure(3, weight=0, minsize=60)   # Reload
+    def _create_video_row(self, parent, row_index: int):
+        """
+        Erstellt die Widgets einer Row in der Video-Tabelle (Callback der VirtualList).
 
-        # Storage für Video-Rows
-        self.video_rows = []  # Liste von dict mit widgets
+        Inhalte (Companion-Status, Notizen, Profile, Thumbnail, Upload-Status)
+        füllt _patch_video_row(); später werden nur geänderte Teile ersetzt.
+        """
+        video = self.videos[row_index]
 
-    def _create_video_row(self, video: VideoItem, row_index: int):
-        """Erstellt eine Row in der Video-Tabelle."""
-        row_num = row_index
+        # Eigener Frame pro Row; feste Spaltenbreiten halten die Spalten untereinander bündig
+        row_frame = ttk.Frame(parent)
+        row_frame.columnconfigure(0, weight=0, minsize=self.THUMB_DISPLAY_WIDTH + 10)   # Thumbnail
+        row_frame.columnconfigure(1, weight=0, minsize=420)  # Video
+        row_frame.columnconfigure(2, weight=1, minsize=200)  # Profile
+        row_frame.columnconfigure(3, weight=0, minsize=60)   # Reload
 
         # Spalte 0: Thumbnail + Delete Overlay
-        thumb_frame = tk.Frame(self.video_table_frame, width=self.THUMB_DISPLAY_WIDTH, height=self.THUMB_DISPLAY_WIDTH)
+        thumb_frame = tk.Frame(row_frame, width=self.THUMB_DISPLAY_WIDTH, height=self.THUMB_DISPLAY_WIDTH)
         thumb_frame.grid_propagate(False)
-        thumb_frame.grid(row=row_num, column=0, padx=5, pady=5, sticky="w")
 
-        thumb_label = ttk.Label(thumb_frame, text="[Thumb]")
+        thumb_label = ttk.Label(thumb_frame, text="[Thumb]", cursor="hand2")
         thumb_label.place(x=0, y=0)
+        if self.ffmpeg_available:
+            thumb_label.bind("<Button-1>", lambda _e: self._open_thumbnail_chooser(video))
+            create_tooltip(thumb_label, "Klicken, um ein anderes Frame als Thumbnail zu wählen")
 
         close_icon_pil = load_close_icon(size=18, fill_color="#888888")
         close_icon_hover_pil = load_close_icon(size=18, fill_color=COLORS["szred"])
         close_icon = ImageTk.PhotoImage(close_icon_pil)
         close_icon_hover = ImageTk.PhotoImage(close_icon_hover_pil)
-        self.ui_icons.setdefault("close", []).extend([close_icon, close_icon_hover])
 
         def on_remove():
             if messagebox.askyesno("Video entfernen", "Diesen Upload aus der Liste entfernen?"):
@@ -489,6 +456,7 @@ class BatchUploadApp:
             command=on_remove,
             style="Toolbutton"
         )
+        remove_btn.image_refs = (close_icon, close_icon_hover)  # Referenzen halten
         remove_btn.place(x=self.THUMB_DISPLAY_WIDTH - 24, y=4)
 
         def enter(_):
@@ -501,8 +469,7 @@ class BatchUploadApp:
         remove_btn.bind("<Leave>", leave)
 
         # Spalte 1: Video + Dateien mit File-Picker-Buttons
-        video_info_frame = ttk.Frame(self.video_table_frame)
-        video_info_frame.grid(row=row_num, column=1, padx=5, pady=5, sticky="w")
+        video_info_frame = ttk.Frame(row_frame)
 
         # Video-Name
         video_name_label = ttk.Label(
@@ -517,49 +484,146 @@ class BatchUploadApp:
         status_frame = ttk.Frame(video_info_frame)
         status_frame.pack(anchor=tk.W, pady=(2, 0))
 
-        status_text = get_companion_status_string(video)
-        status_label = ttk.Label(
-            status_frame,
-            text=status_text,
-            font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE - 1)
+        # Notizen und Upload-Status (nur sichtbar, wenn nicht leer)
+        notes_label = ttk.Label(
+            video_info_frame,
+            font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE - 2),
+            foreground="gray",
+            wraplength=400
+        )
+        upload_status_label = ttk.Label(
+            video_info_frame,
+            font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE - 2),
+            wraplength=400,
+            justify=LEFT
         )
-        status_label.pack(side=LEFT)
 
-        # File-Picker-Buttons für fehlende Dateien
-        if not video.has_json:
-            ttk.Button(
-                status_frame,
-                text="📁",
-                command=lambda v=video: self._pick_json_file(v),
-                bootstyle=WARNING,
-                width=3
-            ).pack(side=LEFT, padx=2)
+        # Spalte 2: Profile mit Checkboxen
+        profile_frame = ttk.Frame(row_frame)
 
-        if not video.has_srt and not video.softsubs_path:
-            ttk.Button(
+        # Spalte 3: Reload-Button
+        reload_btn = ttk.Button(
+            row_frame,
+            text="↻",
+            command=lambda v=video: self._reload_video(v),
+            bootstyle=SECONDARY,
+            width=3
+        )
+
+        row = {
+            "item": video,
+            "thumb_frame": thumb_frame,
+            "thumb": thumb_label,
+            "info_frame": video_info_frame,
+            "video": video_name_label,
+            "status_frame": status_frame,
+            "notes": notes_label,
+            "upload_status": upload_status_label,
+            "profile_frame": profile_frame,
+            "profile_vars": {},
+            "reload_btn": reload_btn,
+            "signatures": {}
+        }
+        thumb_frame.grid(row=0, column=0, padx=5, pady=5, sticky="w")
+        video_info_frame.grid(row=0, column=1, padx=5, pady=5, sticky="w")
+        profile_frame.grid(row=0, column=2, padx=5, pady=5, sticky="w")
+        reload_btn.grid(row=0, column=3, padx=5, pady=5)
+
+        row_frame.video_row = row
+        self._patch_video_row(video, row)
+        return row_frame
+
+    def _video_rows(self) -> List[dict]:
+        """Row-Dicts der aktuell erzeugten (sichtbaren + Puffer) Zeilen."""
+        return [widget.video_row for widget in self.video_list.live_rows().values()]
+
+    def _patch_video_row(self, video: VideoItem, row: dict):
+        """Aktualisiert nur die Teile einer Row, deren Inhalt sich geändert hat."""
+        signatures = row["signatures"]
+
+        # Companion-Status + File-Picker-Buttons
+        status_text = get_companion_status_string(video)
+        needs_json_picker = not video.has_json
+        needs_srt_picker = not video.has_srt and not video.softsubs_path
+        signature = (status_text, needs_json_picker, needs_srt_picker)
+        if signatures.get("companion") != signature:
+            signatures["companion"] = signature
+            status_frame = row["status_frame"]
+            for child in status_frame.winfo_children():
+                child.destroy()
+
+            ttk.Label(
                 status_frame,
-                text="📁",
-                command=lambda v=video: self._pick_srt_file(v),
-                bootstyle=WARNING,
-                width=3
-            ).pack(side=LEFT, padx=2)
+                text=status_text,
+                font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE - 1)
+            ).pack(side=LEFT)
+
+            if needs_json_picker:
+                ttk.Button(
+                    status_frame,
+                    text="📁",
+                    command=lambda v=video: self._pick_json_file(v),
+                    bootstyle=WARNING,
+                    width=3
+                ).pack(side=LEFT, padx=2)
+
+            if needs_srt_picker:
+                ttk.Button(
+                    status_frame,
+                    text="📁",
+                    command=lambda v=video: self._pick_srt_file(v),
+                    bootstyle=WARNING,
+                    width=3
+                ).pack(side=LEFT, padx=2)
 
         # Notizen
-        if video.notes:
-            notes_label = ttk.Label(
-                video_info_frame,
-                text=video.notes,
-                font=(DEFAULT_FONT_FAMILY, DEFAULT_FONT_SIZE - 2),
-                foreground="gray",
-                wraplength=400
-            )
-            notes_label.pack(anchor=tk.W, pady=(2, 0))
+        if signatures.get("notes") != video.notes:
+            signatures["notes"] = video.notes
+            self._set_row_label(row["notes"], video.notes, after=row["status_frame"])
+
+        # Upload-Status (Fortschritt pro Profil)
+        upload_status = "" if video.status == "Bereit" else video.status
+        if signatures.get("upload_status") != upload_status:
+            signatures["upload_status"] = upload_status
+            self._set_row_label(row["upload_status"], upload_status, after=row["status_frame"], last=True)
+
+        # Profile mit Checkboxen
+        signature = self._profile_row_signature(video)
+        if signatures.get("profiles") != signature:
+            signatures["profiles"] = signature
+            self._fill_profile_frame(video, row, signature)
 
-        # Spalte 2: Profile mit Checkboxen
-        profile_frame = ttk.Frame(self.video_table_frame)
-        profile_frame.grid(row=row_num, column=2, padx=5, pady=5, sticky="w")
+        # Thumbnail
+        signature = None
+        if video.thumbnail_path:
+            try:
+                stat = os.stat(video.thumbnail_path)
+                signature = (video.thumbnail_path, stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                signature = None
+        if signatures.get("thumbnail") != signature:
+            signatures["thumbnail"] = signature
+            if signature is None:
+                row["thumb"].config(image="", text="[Thumb]")
+                row["thumb"].image = None
+            else:
+                self.root.after(0, self._load_thumbnail, video)
 
-        profile_widgets = {}
+    def _set_row_label(self, label, text: str, after, last: bool = False):
+        """Zeigt ein Label einer Row mit Text an oder blendet es aus (leerer Text)."""
+        if not text:
+            label.pack_forget()
+            return
+        label.config(text=text)
+        if not label.winfo_manager():
+            if last:
+                label.pack(anchor=tk.W, pady=(2, 0))
+            else:
+                label.pack(anchor=tk.W, pady=(2, 0), after=after)
+
+    def _profile_row_signature(self, video: VideoItem) -> tuple:
+        """(Profil, verfügbar, ausgewählt) je Profil."""
+        signature = []
         for profile_name, profile_data in self.profiles.items():
             requires_srt = profile_data.get('requires_srt', False)
             requires_json = profile_data.get('requires_json', True)
@@ -571,13 +635,24 @@ class BatchUploadApp:
             if requires_srt and not video.has_srt:
                 is_available = False
 
+            signature.append((profile_name, is_available, bool(video.selected_profiles.get(profile_name, False))))
+        return tuple(signature)
+
+    def _fill_profile_frame(self, video: VideoItem, row: dict, signature: tuple):
+        """Baut die Profil-Checkboxen einer Row neu auf."""
+        profile_frame = row["profile_frame"]
+        for child in profile_frame.winfo_children():
+            child.destroy()
+
+        profile_widgets = {}
+        for profile_name, is_available, is_selected in signature:
             # Frame für Profil + Checkbox
             pf = ttk.Frame(profile_frame)
             pf.pack(anchor=tk.W, pady=2)
 
             if is_available:
                 # Verfügbar: fett + Checkbox
-                var = tk.BooleanVar(value=video.selected_profiles.get(profile_name, False))
+                var = tk.BooleanVar(value=is_selected)
                 cb = ttk.Checkbutton(
                     pf,
                     text=profile_name,
@@ -595,24 +670,7 @@ class BatchUploadApp:
                     foreground="gray"
                 ).pack(side=LEFT)
 
-        # Spalte 3: Reload-Button
-        reload_btn = ttk.Button(
-            self.video_table_frame,
-            text="↻",
-            command=lambda v=video: self._reload_video(v),
-            bootstyle=SECONDARY,
-            width=3
-        )
-        reload_btn.grid(row=row_num, column=3, padx=5, pady=5)
-
-        # Speichere Row-Widgets
-        return {
-            "thumb": thumb_label,
-            "video": video_name_label,
-            "profile_frame": profile_frame,
-            "profile_vars": profile_widgets,
-            "reload_btn": reload_btn
-        }
+        row["profile_vars"] = profile_widgets
 
     def _on_profile_check_toggled(self, video: VideoItem, profile_name: str, var: tk.BooleanVar):
         """Callback wenn Profil-Checkbox getoggled wird."""
@@ -640,6 +698,8 @@ class BatchUploadApp:
         )
 
         if json_path:
+            from app.factsheet_schema import load_and_validate_factsheet
+
             # Validiere JSON
             is_valid, data, error_msg = load_and_validate_factsheet(json_path)
             if is_valid:
@@ -674,11 +734,12 @@ class BatchUploadApp:
 
     def _reload_video(self, video: VideoItem):
         """Lädt Companion-Dateien für Video neu mit neuer Logik."""
-        from app.companion import get_video_companion_files
+        from app.factsheet_schema import load_and_validate_factsheet
 
         video_path = video.video_path
 
-        # Neue Companion-Suche
+        # Neue Companion-Suche (Ordner frisch einlesen)
+        invalidate_directory_index(Path(video_path).parent)
         companions = get_video_companion_files(video_path)
 
         # JSON
@@ -720,11 +781,7 @@ class BatchUploadApp:
 
         # Starte Companion-Processing neu (Container-SRT-Extraktion, Thumbnail-Gen)
         if self.ffmpeg_available:
-            threading.Thread(
-                target=self._process_companions_worker,
-                args=(video,),
-                daemon=True
-            ).start()
+            self._submit_companion_job(video)
         else:
             self._update_video_list()
             self._update_upload_button_state()
@@ -754,6 +811,42 @@ class BatchUploadApp:
         )
         self.upload_button.pack(side=LEFT)
 
+        # Bandbreiten-Grenze (global, wirkt sofort auch auf laufende Uploads)
+        ttk.Label(upload_frame, text="Bandbreite:").pack(side=LEFT, padx=(15, 5))
+        self.bandwidth_var = tk.StringVar(value=BANDWIDTH_CHOICES[0][0])
+        bandwidth_combo = ttk.Combobox(
+            upload_frame,
+            textvariable=self.bandwidth_var,
+            values=[label for label, _mbit in BANDWIDTH_CHOICES],
+            state="readonly",
+            width=14
+        )
+        bandwidth_combo.pack(side=LEFT)
+        bandwidth_combo.bind("<<ComboboxSelected>>", self._on_bandwidth_selected)
+        create_tooltip(
+            bandwidth_combo,
+            "Obergrenze für alle parallelen Uploads zusammen.\n"
+            "'Zeitplan' verwendet UPLOAD_BANDWIDTH_LIMIT_MBIT / UPLOAD_BANDWIDTH_WINDOWS aus .env."
+        )
+
+        # Grenze pro Upload (wirkt ebenfalls sofort auf laufende Uploads)
+        ttk.Label(upload_frame, text="pro Upload:").pack(side=LEFT, padx=(10, 5))
+        self.per_upload_bandwidth_var = tk.StringVar(value=PER_UPLOAD_BANDWIDTH_CHOICES[0][0])
+        per_upload_combo = ttk.Combobox(
+            upload_frame,
+            textvariable=self.per_upload_bandwidth_var,
+            values=[label for label, _mbit in PER_UPLOAD_BANDWIDTH_CHOICES],
+            state="readonly",
+            width=14
+        )
+        per_upload_combo.pack(side=LEFT)
+        per_upload_combo.bind("<<ComboboxSelected>>", self._on_per_upload_bandwidth_selected)
+        create_tooltip(
+            per_upload_combo,
+            "Obergrenze für jeden einzelnen Upload.\n"
+            "'Standard' verwendet UPLOAD_BANDWIDTH_PER_UPLOAD_MBIT aus .env."
+        )
+
         # Status
         self.status_label = ttk.Label(
             upload_frame,
@@ -763,6 +856,90 @@ class BatchUploadApp:
         )
         self.status_label.pack(side=LEFT, padx=(15, 0))
 
+    def _on_bandwidth_selected(self, event=None):
+        """Übernimmt die gewählte Bandbreiten-Grenze."""
+        choices = dict(BANDWIDTH_CHOICES)
+        mbit = choices.get(self.bandwidth_var.get())
+        get_bandwidth_manager().set_global_limit(mbit)
+        if mbit is None:
+            current = get_bandwidth_manager().current_global_mbit()
+            text = "unbegrenzt" if not current else f"{current:g} Mbit/s"
+            print(f"✓ Bandbreite nach Zeitplan: aktuell {text}")
+        else:
+            print(f"✓ Bandbreite: {self.bandwidth_var.get()}")
+
+    def _on_per_upload_bandwidth_selected(self, event=None):
+        """Übernimmt die gewählte Grenze pro Upload."""
+        choices = dict(PER_UPLOAD_BANDWIDTH_CHOICES)
+        get_bandwidth_manager().set_per_upload_limit(choices.get(self.per_upload_bandwidth_var.get()))
+        print(f"✓ Bandbreite pro Upload: {self.per_upload_bandwidth_var.get()}")
+
+    def _start_import_warmup(self):
+        """Importiert WARMUP_MODULES im Hintergrund, damit der erste Klick nicht wartet."""
+        def warmup():
+            for module_name in WARMUP_MODULES:
+                try:
+                    importlib.import_module(module_name)
+                except Exception as e:
+                    # Fehler zeigen sich beim ersten echten Import erneut
+                    print(f"⚠ Vorladen von {module_name} fehlgeschlagen: {e}")
+
+        threading.Thread(target=warmup, name="import-warmup", daemon=True).start()
+
+    def _start_folder_watcher(self):
+        """Überwacht die Ordner der Batch-Liste auf geänderte Companion-Dateien."""
+        from app.folder_watcher import FolderWatcher
+
+        self.folder_watcher = FolderWatcher(
+            on_change=lambda directory, names: self.root.after(0, self._on_folder_changed, directory, names),
+            use_watchdog=not FOLDER_WATCH_FORCE_POLLING
+        )
+        self.folder_watcher.start()
+        self._sync_folder_watches()
+
+    def _sync_folder_watches(self):
+        """Gleicht überwachte Ordner mit den Videos der Liste ab."""
+        if self.folder_watcher is None:
+            return
+        self.folder_watcher.set_directories(str(Path(v.video_path).parent) for v in self.videos)
+
+    def _on_folder_changed(self, directory: str, names: set):
+        """Übernimmt geänderte Companion-Dateien eines Ordners (läuft im Mainloop)."""
+        if self.upload_running:
+            # Factsheets nicht während laufender Uploads austauschen
+            self._deferred_folder_changes.setdefault(directory, set()).update(names)
+            return
+
+        changed_videos = []
+        json_errors = []
+        for video in self.videos:
+            if str(Path(video.video_path).parent) != directory:
+                continue
+
+            had_json, had_srt = video.has_json, video.has_srt
+            updated, json_error = refresh_companions(video, names)
+            if json_error:
+                json_errors.append(json_error.splitlines()[0])
+            if not updated:
+                continue
+
+            if (video.has_json, video.has_srt) != (had_json, had_srt):
+                video.selected_profiles = init_profile_selection(self.profiles, video)
+            changed_videos.append(f"{video.video_name} ({', '.join(updated)})")
+
+        if changed_videos:
+            self._set_status_message("↻ Aktualisiert: " + "; ".join(changed_videos), "blue")
+            self._update_video_list()
+            self._update_upload_button_state()
+        if json_errors:
+            self._set_status_message("JSON ungültig: " + "; ".join(json_errors), "red")
+
+    def _apply_deferred_folder_changes(self):
+        """Holt während eines Uploads zurückgestellte Ordner-Änderungen nach."""
+        deferred, self._deferred_folder_changes = self._deferred_folder_changes, {}
+        for directory, names in deferred.items():
+            self._on_folder_changed(directory, names)
+
     def _ensure_initial_auth(self):
         """Stellt sicher, dass OAuth mindestens einmal ausgeführt wird."""
         if self.initial_auth_done or self.auth_check_running:
@@ -790,6 +967,9 @@ class BatchUploadApp:
 
     def _reset_auth_token(self):
         """Löscht gespeicherten OAuth-Token, um neuen Login zu erzwingen."""
+        from app.auth import reset_youtube_client_cache
+
+        reset_youtube_client_cache()
         try:
             token_path = Path(TOKEN_PATH)
             if token_path.exists():
@@ -805,6 +985,8 @@ class BatchUploadApp:
         )
         self.root.after(0, lambda: self.auth_button.config(state=DISABLED))
 
+        from app.auth import AuthError, create_youtube_client
+
         try:
             create_youtube_client(
                 CLIENT_SECRETS_PATH,
@@ -817,6 +999,7 @@ class BatchUploadApp:
                 lambda: self._set_status_message("YouTube-Authentifizierung bereit.", "green")
             )
             self.root.after(0, self._close_auth_popup)
+            self.root.after(0, self._offer_resume_uploads)
         except AuthError as e:
             self.root.after(
                 0,
@@ -831,6 +1014,72 @@ class BatchUploadApp:
             self.auth_check_running = False
             self.root.after(0, lambda: self.auth_button.config(state=NORMAL))
 
+    def _offer_resume_uploads(self):
+        """Bietet einmal pro Start an, unterbrochene Uploads aus dem Upload-Journal fortzusetzen."""
+        if self._resume_offered or self.upload_running:
+            return
+        self._resume_offered = True
+
+        sessions = pending_sessions()
+        if not sessions:
+            return
+
+        lines = []
+        for session in sessions[:10]:
+            size = session.get("size") or 1
+            percent = int(session.get("offset", 0) * 100 / size)
+            lines.append(f"• {Path(session['video_path']).name} ({percent}%)")
+        if len(sessions) > 10:
+            lines.append(f"… und {len(sessions) - 10} weitere")
+
+        answer = messagebox.askyesnocancel(
+            "Unterbrochene Uploads",
+            f"{len(sessions)} unterbrochene(r) Upload(s) gefunden:\n\n"
+            + "\n".join(lines)
+            + "\n\nJa = fortsetzen, Nein = verwerfen, Abbrechen = später entscheiden"
+        )
+        if answer is None:
+            return
+        if answer is False:
+            for session in sessions:
+                remove_session(session["key"])
+            return
+
+        self.upload_running = True
+        self.upload_button.config(state=DISABLED)
+        self._set_status_message("Setze unterbrochene Uploads fort...", "blue")
+        threading.Thread(target=self._resume_uploads_worker, args=(sessions,), daemon=True).start()
+
+    def _resume_uploads_worker(self, sessions: List[Dict[str, Any]]):
+        """Setzt unterbrochene Uploads nacheinander fort (upload() findet die Sitzung im Journal)."""
+        from app.uploader import upload
+
+        success_results = []
+        failure_count = 0
+        total = len(sessions)
+
+        for index, session in enumerate(sessions, start=1):
+            name = Path(session["video_path"]).name
+            self.root.after(
+                0,
+                lambda i=index, n=name: self._set_status_message(f"Setze Upload fort ({i}/{total}): {n}", "blue")
+            )
+            try:
+                result = upload(
+                    video_path=session["video_path"],
+                    srt_path=session.get("srt_path"),
+                    factsheet_data=session.get("factsheet_data") or {},
+                    profile_data=session.get("profile_data") or {}
+                )
+                success_results.append(result)
+                # Falls sich die Datei inzwischen geändert hat, lief ein neuer Upload
+                remove_session(session["key"])
+            except Exception as e:
+                failure_count += 1
+                print(f"✗ Fortsetzen fehlgeschlagen ({name}): {e}")
+
+        self.root.after(0, self._batch_upload_complete, success_results, failure_count, total)
+
     def _set_status_message(self, text: str, color: str = "blue"):
         """Aktualisiert globale Statusanzeige."""
         if hasattr(self, "status_label"):
@@ -901,10 +1150,14 @@ class BatchUploadApp:
             self.asset_window.lift()
             return
 
+        from app.asset_manager import AssetManagerWindow
+
         self.asset_window = AssetManagerWindow(self)
 
     def _open_quick_upload(self):
         """Öffnet Quick Upload Dialog für einzelne Video-Uploads."""
+        from app.quick_upload_dialog import QuickUploadDialog
+
         QuickUploadDialog(self)
 
     def _open_channel(self):
@@ -1044,15 +1297,14 @@ class BatchUploadApp:
             messagebox.showerror("Kein Ordner", f"{directory} ist kein Ordner.")
             return False
 
-        video_candidates = []
-        for ext in SUPPORTED_VIDEO_EXTS:
-            video_candidates.extend(dir_path.glob(f"*{ext}"))
+        index = get_directory_index(dir_path)
+        video_candidates = index.glob_many(f"*{ext}" for ext in SUPPORTED_VIDEO_EXTS)
 
         if not video_candidates:
             messagebox.showwarning("Keine Videos gefunden", f"In {directory} wurden keine Video-Dateien entdeckt.")
             return False
 
-        newest_video = max(video_candidates, key=lambda p: p.stat().st_mtime)
+        newest_video = index.newest(video_candidates)
         return self._add_video_from_path(str(newest_video))
 
     def _add_video_from_path(self, video_path: str) -> bool:
@@ -1065,36 +1317,9 @@ class BatchUploadApp:
             messagebox.showerror("Fehler", f"{Path(video_path).name}:\n{error_msg}")
             return False
 
-        companions = get_video_companion_files(video_path)
-
-        json_path = companions.get("json_file")
-        factsheet_data = None
-        if json_path:
-            is_valid, data, error_msg = load_and_validate_factsheet(json_path)
-            if is_valid:
-                factsheet_data = data
-            else:
-                messagebox.showerror("JSON-Fehler", f"{Path(json_path).name}:\n{error_msg}")
-                json_path = None
-
-        srt_path = companions.get("srt_file")
-        softsubs_path = companions.get("softsubs_file")
-        hardsubs_path = companions.get("hardsubs_file")
-        thumbnail_path = companions.get("thumbnail_file")
-
-        video_item = VideoItem(
-            video_path=video_path,
-            srt_path=srt_path,
-            json_path=json_path,
-            factsheet_data=factsheet_data,
-            softsubs_path=softsubs_path,
-            hardsubs_path=hardsubs_path,
-            thumbnail_path=thumbnail_path
-        )
-
-        video_item.companion["json"] = factsheet_data is not None
-        video_item.companion["srt_external"] = srt_path is not None
-        video_item.companion["thumbnail_sample"] = thumbnail_path is not None
+        video_item, json_error = load_video_item(video_path)
+        if json_error:
+            messagebox.showerror("JSON-Fehler", json_error)
 
         video_basename = Path(video_path).stem
         if video_basename in self.profile_prefs:
@@ -1105,14 +1330,52 @@ class BatchUploadApp:
         self.videos.append(video_item)
 
         if self.ffmpeg_available:
-            threading.Thread(
-                target=self._process_companions_worker,
-                args=(video_item,),
-                daemon=True
-            ).start()
+            self._submit_companion_job(video_item)
 
         return True
 
+    def _submit_companion_job(self, video: VideoItem):
+        """
+        Plant Companion-Processing im gemeinsamen Pool ein.
+
+        Mehrfaches ↻ für dasselbe Video wird zusammengelegt; sichtbare Zeilen
+        werden zuerst verarbeitet.
+        """
+        row_index = next((i for i, v in enumerate(self.videos) if v is video), None)
+        priority = PRIORITY_DEFAULT if row_index is None else self._companion_priority(row_index)
+        self.companion_pool.submit(
+            video.video_path,
+            lambda: self._process_companions_worker(video),
+            priority=priority
+        )
+
+    def _visible_row_range(self) -> range:
+        """Sichtbare Zeilen der Tabelle."""
+        if self.video_list.canvas.winfo_height() <= 1:
+            # Canvas noch nicht gezeichnet: die ersten Zeilen gelten als sichtbar
+            return range(0, 10)
+        return self.video_list.visible_range()
+
+    def _companion_priority(self, row_index: int) -> int:
+        visible = self._visible_row_range()
+        if row_index in visible:
+            return PRIORITY_VISIBLE + row_index - visible.start
+        # Hinter allen sichtbaren Zeilen einreihen, egal wie viele sichtbar sind
+        return PRIORITY_DEFAULT + len(self.videos) + row_index
+
+    def _on_video_table_scroll(self):
+        """Wartende Companion-Aufgaben nach dem Scrollen neu priorisieren."""
+        if not self._priority_update_pending:
+            self._priority_update_pending = True
+            self.root.after(200, self._update_companion_priorities)
+
+    def _update_companion_priorities(self):
+        self._priority_update_pending = False
+        self.companion_pool.set_priorities({
+            video.video_path: self._companion_priority(i)
+            for i, video in enumerate(self.videos)
+        })
+
     def _process_companions_worker(self, video: VideoItem):
         """
         Worker-Thread für Companion-Processing (Container-SRT, Thumbnail).
@@ -1121,62 +1384,23 @@ class BatchUploadApp:
         Args:
             video: VideoItem-Objekt
         """
-        notes = []
+        process_companions(video)
 
-        # 1. Prüfe Container-SRT (nur wenn kein externes SRT vorhanden)
-        if not video.has_srt:
-            # Bevorzuge softsubs-Video für SRT-Extraktion
-            source_video = video.softsubs_path if video.softsubs_path else video.video_path
-
-            success, stream_indices, error = find_subtitle_streams(source_video)
-
-            if success and stream_indices:
-                # Nutze ersten Stream
-                stream_idx = stream_indices[0]
-                success, output_path, error = extract_subtitle_stream(
-                    source_video,
-                    stream_idx
-                )
-
-                if success:
-                    video.srt_path = output_path
-                    video.companion["srt_container"] = True
-                    if video.softsubs_path:
-                        notes.append("SRT aus softsubs-Video extrahiert")
-                    else:
-                        notes.append("SRT aus Container extrahiert")
-
-                    # Update Profil-Selection (jetzt mit SRT)
-                    video.selected_profiles = init_profile_selection(self.profiles, video)
-                else:
-                    notes.append(f"SRT-Extraktion fehlgeschlagen: {error}")
-
-        # 2. Generiere Thumbnail (falls kein sample vorhanden)
-        if not video.companion.get("thumbnail_sample"):
-            # Bevorzuge softsubs-Video für Thumbnail-Generierung
-            source_video = video.softsubs_path if video.softsubs_path else video.video_path
-
-            success, output_path, error = generate_thumbnail(source_video, time_seconds=3)
-
-            if success:
-                video.thumbnail_path = output_path
-                video.companion["thumbnail_generated"] = True
-                notes.append("Thumbnail generiert (t=3s)")
-            else:
-                notes.append(f"Thumbnail-Generierung fehlgeschlagen: {error}")
+        # Video inzwischen entfernt: Ergebnis verwerfen
+        if not any(v is video for v in self.videos):
+            return
 
-        # 3. Update GUI (thread-safe via after())
-        if notes:
-            if video.notes:
-                video.notes += "; " + "; ".join(notes)
-            else:
-                video.notes = "; ".join(notes)
+        # Update Profil-Selection (jetzt mit SRT)
+        if video.companion.get("srt_container"):
+            video.selected_profiles = init_profile_selection(self.profiles, video)
 
+        # Update GUI (thread-safe via after())
         self.root.after(0, self._update_video_list)
         self.root.after(0, self._update_upload_button_state)
 
     def _clear_videos(self):
         """Entfernt alle Videos aus der Liste."""
+        self.companion_pool.cancel_all()
         self.videos.clear()
         self._update_video_list()
         self._update_upload_button_state()
@@ -1188,48 +1412,65 @@ class BatchUploadApp:
             return
 
         self.videos = [v for v in self.videos if v is not video]
+        if not any(v.video_path == video.video_path for v in self.videos):
+            self.companion_pool.cancel(video.video_path)
         self._update_video_list()
         self._update_upload_button_state()
 
     def _update_video_list(self):
-        """Aktualisiert Video-Tabelle."""
-        # Lösche alte Rows (außer Header)
-        for row_widgets in self.video_rows:
-            for widget in row_widgets.values():
-                if hasattr(widget, "destroy"):
-                    widget.destroy()
+        """
+        Aktualisiert Video-Tabelle.
 
-        self.video_rows.clear()
+        Nur sichtbare Rows existieren (VirtualList). Bei gleicher Reihenfolge
+        werden sie gepatcht (geänderte Teile); ändert sich die Liste, werden
+        nur die sichtbaren Rows neu aufgebaut.
+        """
+        order = list(self.videos)
+        if len(order) == len(self._video_row_order) and all(
+            a is b for a, b in zip(order, self._video_row_order)
+        ):
+            for row in self._video_rows():
+                self._patch_video_row(row["item"], row)
+            return
 
-        # Erstelle neue Rows
-        for i, video in enumerate(self.videos):
-            row_widgets = self._create_video_row(video, i)
-            self.video_rows.append(row_widgets)
+        self._video_row_order = order
+        self.video_list.set_count(len(self.videos))
 
-            # Thumbnail laden falls vorhanden
-            if video.thumbnail_path and Path(video.thumbnail_path).exists():
-                self.root.after(0, self._load_thumbnail, video, i)
+        self._sync_folder_watches()
 
-        # Video Count wurde entfernt - keine Anzeige mehr nötig
+    def _refresh_video_row(self, video: VideoItem):
+        """Patcht die Row eines einzelnen Videos (z.B. Upload-Fortschritt)."""
+        for row in self._video_rows():
+            if row["item"] is video:
+                self._patch_video_row(video, row)
+                return
 
-    def _load_thumbnail(self, video: VideoItem, row_index: int):
-        """Lädt Thumbnail-Bild für Video-Row."""
-        try:
-            from PIL import Image, ImageTk
+    def _load_thumbnail(self, video: VideoItem):
+        """Lädt Thumbnail-Bild für die Row eines Videos (skaliert aus dem Speicher-Cache)."""
+        row = next((r for r in self._video_rows() if r["item"] is video), None)
+        if row is None or not video.thumbnail_path:
+            return
 
-            img = Image.open(video.thumbnail_path)
+        try:
             target_width = self.THUMB_DISPLAY_WIDTH
-            if img.width > 0:
-                ratio = target_width / float(img.width)
-                target_height = max(1, int(img.height * ratio))
-                img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
-            photo = ImageTk.PhotoImage(img)
+            cache_key = file_image_key(video.thumbnail_path, target_width)
+            photo = self.thumbnail_images.get(cache_key)
+            if photo is None:
+                from PIL import Image, ImageTk
+
+                with Image.open(video.thumbnail_path) as img:
+                    if img.width > 0:
+                        ratio = target_width / float(img.width)
+                        target_height = max(1, int(img.height * ratio))
+                        img.draft("RGB", (target_width, target_height))  # JPEG: verkleinert dekodieren
+                        img = img.resize((target_width, target_height), Image.Resampling.LANCZOS)
+                    photo = ImageTk.PhotoImage(img)
+                self.thumbnail_images.put(cache_key, photo, image_nbytes(photo.width(), photo.height()))
 
             # Update Label
-            if row_index < len(self.video_rows):
-                thumb_label = self.video_rows[row_index]["thumb"]
-                thumb_label.config(image=photo, text="")
-                thumb_label.image = photo  # Referenz halten
+            thumb_label = row["thumb"]
+            thumb_label.config(image=photo, text="")
+            thumb_label.image = photo  # Referenz halten
 
         except Exception as e:
             print(f"Fehler beim Laden von Thumbnail: {e}")
@@ -1244,6 +1485,118 @@ class BatchUploadApp:
 
         self.upload_button.config(state=NORMAL if can_upload else DISABLED)
 
+    def _open_thumbnail_chooser(self, video: VideoItem):
+        """Zeigt Kandidaten-Frames zur Auswahl des Thumbnails (berechnet sie bei Bedarf)."""
+        if self.upload_running:
+            return
+
+        if video.thumbnail_candidates:
+            from app.thumbnail_picker import candidates_available
+
+            # Kandidaten liegen im Artefakt-Cache und können verdrängt worden sein
+            if candidates_available(video.thumbnail_candidates):
+                self._show_thumbnail_candidates(video)
+                return
+
+        source_video = video.softsubs_path or video.video_path
+
+        def worker():
+            from app.thumbnail_picker import (
+                NUMPY_AVAILABLE,
+                candidate_times,
+                extract_candidates,
+                resolve_candidates,
+                score_candidates
+            )
+            from app.companion import get_video_duration
+
+            if video.thumbnail_candidates:
+                # Verdrängte Frames nachextrahieren (Bewertungen bleiben)
+                candidates, error = resolve_candidates(video.thumbnail_candidates)
+                if candidates:
+                    video.thumbnail_candidates = candidates
+                    self.root.after(0, self._show_thumbnail_candidates, video)
+                    return
+
+            if not NUMPY_AVAILABLE:
+                self.root.after(0, lambda: messagebox.showinfo(
+                    "Thumbnail wählen", "Für die Frame-Auswahl wird NumPy benötigt (./install.sh)."
+                ))
+                return
+
+            duration = get_video_duration(source_video)
+            if duration:
+                candidates, error = extract_candidates(source_video, candidate_times(duration))
+                candidates = score_candidates(candidates)
+            else:
+                candidates, error = [], "Videodauer unbekannt"
+            if not candidates:
+                self.root.after(0, lambda: messagebox.showerror(
+                    "Thumbnail wählen", f"Keine Frames erzeugt:\n{error}"
+                ))
+                return
+
+            video.thumbnail_candidates = candidates
+            self.root.after(0, self._show_thumbnail_candidates, video)
+
+        self.companion_pool.submit(f"{video.video_path}#thumbnails", worker, priority=PRIORITY_VISIBLE)
+
+    def _show_thumbnail_candidates(self, video: VideoItem):
+        """Dialog mit Kandidaten-Leiste; Klick übernimmt das Frame als Thumbnail."""
+        from PIL import Image
+        from app.thumbnail_picker import apply_candidate
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"Thumbnail wählen – {video.video_name}")
+        dialog.transient(self.root)
+
+        strip = ttk.Frame(dialog, padding=10)
+        strip.pack(fill=BOTH, expand=YES)
+
+        best = max(video.thumbnail_candidates, key=lambda c: c.score)
+        if video.companion.get("thumbnail_generated") and video.thumbnail_path:
+            target_path = video.thumbnail_path
+        else:
+            source = Path(video.softsubs_path or video.video_path)
+            target_path = str(source.parent / f"{source.stem}_thumb.jpg")
+
+        def choose(candidate):
+            success, error = apply_candidate(candidate, target_path)
+            if not success:
+                messagebox.showerror("Thumbnail wählen", error, parent=dialog)
+                return
+            video.thumbnail_path = target_path
+            video.companion["thumbnail_generated"] = True
+            video.companion["thumbnail_sample"] = False
+            dialog.destroy()
+            self._update_video_list()
+
+        photos = []
+        for column, candidate in enumerate(video.thumbnail_candidates):
+            try:
+                with Image.open(candidate.image_source()) as img:
+                    img.draft("RGB", (192, 108))
+                    img = img.convert("RGB")
+                    img.thumbnail((192, 108))
+                    photo = ImageTk.PhotoImage(img)
+            except Exception as e:
+                print(f"⚠ Kandidat nicht lesbar: {e}")
+                continue
+            photos.append(photo)
+
+            ttk.Button(
+                strip,
+                image=photo,
+                command=lambda c=candidate: choose(c),
+                bootstyle=SUCCESS if candidate is best else SECONDARY
+            ).grid(row=column // 4 * 2, column=column % 4, padx=4, pady=(4, 0))
+            label = f"{candidate.time_seconds:.0f}s · {candidate.score:.2f}"
+            if candidate is best:
+                label += " ★"
+            ttk.Label(strip, text=label).grid(row=column // 4 * 2 + 1, column=column % 4, pady=(0, 6))
+
+        dialog.photos = photos  # Referenzen halten
+
     def _show_file_selection(self, title, files):
         """Zeigt Auswahl-Dialog für Dateien."""
         # Vereinfachter Dialog
@@ -1324,25 +1677,14 @@ class BatchUploadApp:
                     if not profile_data:
                         continue
 
-                    requires_srt = profile_data.get('requires_srt', False)
-                    requires_json = profile_data.get('requires_json', True)
-
                     # Skip wenn Requirements nicht erfüllt
-                    if requires_json and not video.has_json:
-                        self.root.after(
-                            0,
-                            self._append_video_status,
-                            video,
-                            f"○ {profile_name}: JSON fehlt"
-                        )
-                        continue
-
-                    if requires_srt and not video.has_srt:
+                    skip_reason = profile_skip_reason(video, profile_data)
+                    if skip_reason:
                         self.root.after(
                             0,
                             self._append_video_status,
                             video,
-                            f"○ {profile_name}: SRT fehlt"
+                            f"○ {profile_name}: {skip_reason}"
                         )
                         continue
 
@@ -1356,93 +1698,74 @@ class BatchUploadApp:
 
             self.batch_progress = {"current": 0, "total": total, "success": 0, "failure": 0}
             success_results = []
-            failure_count = 0
+            progress_lock = threading.Lock()
+
+            jobs = [
+                UploadJob(group=video.video_path, profile_name=profile_name, payload=video)
+                for video, profile_name in upload_pairs
+            ]
 
-            # Upload jedes Pairs
-            for i, (video, profile_name) in enumerate(upload_pairs, 1):
-                # Status Update
-                self.root.after(0, self._append_video_status, video, f"↻ {profile_name}: Läuft...")
+            # Titel-Index einmal pro Batch laden (statt Kanal-Abfrage pro Paar)
+            self._duplicate_index = None
+            if any(self.profiles[name].get("prevent_duplicates", True) for _, name in upload_pairs):
+                from app.youtube_assets import load_duplicate_index
 
-                try:
-                    profile_data = get_profile(profile_name, self.profiles)
-                    status_cb, progress_cb = self._make_upload_callbacks(video, profile_name)
-
-                    # Wähle richtiges Video basierend auf Profil
-                    # social_subtitled → hardsubs, andere → softsubs oder Basis-Video
-                    if profile_name == "social_subtitled" and video.hardsubs_path:
-                        upload_video_path = video.hardsubs_path
-                    elif video.softsubs_path:
-                        upload_video_path = video.softsubs_path
+                self._duplicate_index = load_duplicate_index()
+                print(f"✓ Duplikat-Index: {len(self._duplicate_index)} Titel")
+
+            def on_job_start(job: UploadJob):
+                self.root.after(
+                    0,
+                    self._append_video_status,
+                    job.payload,
+                    f"↻ {job.profile_name}: Läuft..."
+                )
+
+            def on_job_finished(job: UploadJob):
+                video = job.payload
+                profile_name = job.profile_name
+
+                with progress_lock:
+                    self.batch_progress["current"] += 1
+                    if job.state == JOB_DONE:
+                        success_results.append(job.result)
+                        self.batch_progress["success"] += 1
                     else:
-                        upload_video_path = video.video_path
-
-                    # Füge Thumbnail zu Factsheet hinzu, falls vorhanden
-                    factsheet_with_thumbnail = video.factsheet_data.copy()
-                    if video.thumbnail_path:
-                        # Überschreibe thumbnail wenn vorhanden (auch wenn bereits als dict mit file:null gesetzt)
-                        existing_thumb = factsheet_with_thumbnail.get('thumbnail')
-                        if existing_thumb is None:
-                            factsheet_with_thumbnail['thumbnail'] = video.thumbnail_path
-                        elif isinstance(existing_thumb, dict) and not existing_thumb.get('file'):
-                            # thumbnail.file ist null/leer → ersetze mit gefundenem Thumbnail
-                            factsheet_with_thumbnail['thumbnail'] = video.thumbnail_path
-                        elif isinstance(existing_thumb, str) and not existing_thumb:
-                            # Leerer String → ersetze
-                            factsheet_with_thumbnail['thumbnail'] = video.thumbnail_path
-
-                    # Prüfe ob Video mit gleichem Titel bereits existiert
-                    title = factsheet_with_thumbnail.get("snippet", {}).get("title", "")
-                    prevent_duplicates = profile_data.get("prevent_duplicates", True)
-                    if title and prevent_duplicates:
-                        try:
-                            existing_video = find_video_by_title(title)
-                            if existing_video:
-                                existing_id = existing_video.get("id", "")[:8]
-                                raise Exception(
-                                    f"Video existiert bereits (ID: {existing_id}...). "
-                                    f"Bitte erst im Asset-Manager löschen, dann neu hochladen."
-                                )
-                        except Exception as e:
-                            if "Video existiert bereits" in str(e):
-                                raise
-                            # Andere Fehler beim Suchen ignorieren
-                            print(f"⚠ Fehler beim Suchen des Videos: {e}")
-
-                    # Upload durchführen
-                    result = upload(
-                        video_path=upload_video_path,
-                        srt_path=video.srt_path,
-                        factsheet_data=factsheet_with_thumbnail,
-                        profile_data=profile_data,
-                        progress_callback=progress_cb,
-                        status_callback=status_cb
-                    )
-                    success_results.append(result)
-                    self.batch_progress["success"] += 1
-                    self._write_upload_log(video, profile_name, success=True, result=result)
+                        self.batch_progress["failure"] += 1
+                    current = self.batch_progress["current"]
 
+                if job.state == JOB_DONE:
+                    write_upload_log(video, profile_name, success=True, result=job.result)
                     self.root.after(
                         0,
                         self._replace_last_video_status,
                         video,
-                        f"● {profile_name}: {result.video_id[:8]}..."
+                        f"● {profile_name}: {job.result.video_id[:8]}...",
+                        profile_name
                     )
-
-                except Exception as e:
-                    failure_count += 1
-                    self.batch_progress["failure"] += 1
-                    error_msg = str(e)
-                    self._write_upload_log(video, profile_name, success=False, error_message=error_msg)
+                else:
+                    write_upload_log(video, profile_name, success=False, error_message=job.error)
                     self.root.after(
                         0,
                         self._replace_last_video_status,
                         video,
-                        f"× {profile_name}: {error_msg[:30]}..."
+                        f"× {profile_name}: {job.error[:30]}...",
+                        profile_name
                     )
 
                 # Gesamtfortschritt
-                self.batch_progress["current"] = i
-                self.root.after(0, self._update_batch_status, i, total)
+                self.root.after(0, self._update_batch_status, current, total)
+
+            scheduler = UploadScheduler(
+                jobs,
+                run_job=self._run_upload_job,
+                max_workers=UPLOAD_CONCURRENCY,
+                on_job_start=on_job_start,
+                on_job_finished=on_job_finished
+            )
+            scheduler.run()
+
+            failure_count = self.batch_progress["failure"]
 
             # Fertig
             self.root.after(0, self._batch_upload_complete, success_results, failure_count, total)
@@ -1450,6 +1773,23 @@ class BatchUploadApp:
         except Exception as e:
             self.root.after(0, self._batch_upload_error, str(e))
 
+    def _run_upload_job(self, job: UploadJob) -> 'UploadResult':
+        """Lädt ein einzelnes (Video, Profil)-Paar hoch (läuft im Scheduler-Worker)."""
+        video = job.payload
+        profile_name = job.profile_name
+
+        profile_data = get_profile(profile_name, self.profiles)
+        status_cb, progress_cb = self._make_upload_callbacks(video, profile_name)
+
+        return upload_video_profile(
+            video,
+            profile_name,
+            profile_data,
+            duplicate_index=self._duplicate_index,
+            progress_callback=progress_cb,
+            status_callback=status_cb
+        )
+
     def _make_upload_callbacks(self, video: VideoItem, profile_name: str):
         """Erstellt Callbacks für Status- und Fortschrittsupdates des Uploads."""
         last_bucket = {"value": -1}
@@ -1464,91 +1804,21 @@ class BatchUploadApp:
                 0,
                 self._replace_last_video_status,
                 video,
-                f"↻ {profile_name}: Upload {percent}%"
+                f"↻ {profile_name}: Upload {percent}%",
+                profile_name
             )
 
         def status_cb(event: str, payload: Dict[str, Any]):
-            message = self._format_upload_status(profile_name, event, payload or {})
+            message = format_upload_status(profile_name, event, payload or {})
             if message:
-                self.root.after(0, self._replace_last_video_status, video, message)
+                self.root.after(0, self._replace_last_video_status, video, message, profile_name)
 
         return status_cb, progress_cb
 
-    def _format_upload_status(self, profile_name: str, event: str, payload: Dict[str, Any]) -> Optional[str]:
-        """Erzeugt lesbaren Status-Text für Upload-Events."""
-        prefix = f"↻ {profile_name}: "
-
-        if event == "auth_start":
-            return prefix + "Authentifiziere..."
-        if event == "auth_success":
-            return prefix + "Authentifizierung OK"
-        if event == "metadata_ready":
-            status = payload.get("status") or "n/a"
-            return prefix + f"Metadaten bereit ({status})"
-        if event == "upload_start":
-            filename = payload.get('filename', '')
-            return prefix + f"Lade Video hoch: {filename}"
-        if event == "upload_success":
-            video_id = payload.get('video_id', 'n/a')
-            return prefix + f"Video-Upload erfolgreich! (ID: {video_id[:8]}...)"
-        if event == "captions_start":
-            filename = payload.get('filename', '')
-            return prefix + f"Lade Untertitel hoch: {filename}"
-        if event == "captions_success":
-            lang = payload.get("language", "de")
-            return prefix + f"Untertitel-Upload erfolgreich ({lang})"
-        if event == "captions_error":
-            message = payload.get("message", "Fehler")
-            return prefix + f"Untertitel-Fehler: {message[:40]}..."
-        if event == "thumbnail_start":
-            filename = payload.get('filename', '')
-            return prefix + f"Lade Thumbnail hoch: {filename}"
-        if event == "thumbnail_success":
-            return prefix + "Thumbnail-Upload erfolgreich"
-        if event == "thumbnail_error":
-            message = payload.get("message", "Fehler")
-            return prefix + f"Thumbnail-Fehler: {message[:40]}..."
-
-        return None
-
-    def _write_upload_log(self, video: VideoItem, profile_name: str, success: bool, result: UploadResult = None, error_message: str = ""):
-        """Schreibt Upload-Ergebnis in Log-Datei im Video-Verzeichnis."""
-        try:
-            log_dir = Path(video.video_path).parent
-            log_dir.mkdir(parents=True, exist_ok=True)
-            log_file = log_dir / "yt_upload.log"
-
-            timestamp = datetime.now().isoformat(timespec="seconds")
-            video_name = Path(video.video_path).name
-
-            if success and result:
-                lines = [
-                    f"[{timestamp}] {video_name} [{profile_name}]",
-                    "STATUS: SUCCESS",
-                    f"WATCH: {result.watch_url}",
-                    f"EMBED: {result.embed_url}",
-                    f"VIDEO_ID: {result.video_id}",
-                    ""
-                ]
-            else:
-                error_preview = (error_message or "Unbekannter Fehler").strip()
-                lines = [
-                    f"[{timestamp}] {video_name} [{profile_name}]",
-                    "STATUS: ERROR",
-                    f"MESSAGE: {error_preview}",
-                    ""
-                ]
-
-            with log_file.open("a", encoding="utf-8") as f:
-                f.write("\n".join(lines))
-
-        except Exception as log_error:
-            print(f"⚠ Konnte Upload-Log nicht schreiben ({video.video_name}): {log_error}")
-
     def _update_video_status(self, video, status):
         """Aktualisiert Status eines Videos."""
         video.status = status
-        self._update_video_list()
+        self._refresh_video_row(video)
 
     def _append_video_status(self, video, new_status):
         """Fügt neuen Status zu Video-Status hinzu (Multi-Line)."""
@@ -1556,17 +1826,28 @@ class BatchUploadApp:
             video.status = new_status
         else:
             video.status += f"\n{new_status}"
-        self._update_video_list()
+        self._refresh_video_row(video)
+
+    def _replace_last_video_status(self, video, new_status, profile_name: Optional[str] = None):
+        """
+        Ersetzt letzte laufende Zeile des Video-Status (z.B. "Läuft..." → "● Fertig").
 
-    def _replace_last_video_status(self, video, new_status):
-        """Ersetzt letzte Zeile des Video-Status (z.B. "Läuft..." → "● Fertig")."""
+        Bei parallelen Uploads wird über profile_name die Zeile des jeweiligen
+        Profils gesucht, damit sich gleichzeitige Profile nicht überschreiben.
+        """
         lines = video.status.split("\n")
-        if lines and lines[-1].startswith("↻"):  # "Läuft..." Marker
-            lines[-1] = new_status
-            video.status = "\n".join(lines)
+        marker = f"↻ {profile_name}:" if profile_name else "↻"  # "Läuft..." Marker
+        for idx in range(len(lines) - 1, -1, -1):
+            if lines[idx].startswith(marker):
+                lines[idx] = new_status
+                video.status = "\n".join(lines)
+                break
         else:
-            video.status = new_status
-        self._update_video_list()
+            if profile_name and video.status != "Bereit":
+                video.status += f"\n{new_status}"
+            else:
+                video.status = new_status
+        self._refresh_video_row(video)
 
     def _update_batch_status(self, current, total):
         """Aktualisiert Batch-Upload-Status."""
@@ -1588,6 +1869,7 @@ class BatchUploadApp:
         color = "green" if failure_count == 0 else "orange"
         self.status_label.config(text=summary, foreground=color)
         self._update_upload_button_state()
+        self.root.after(0, self._apply_deferred_folder_changes)
         if success_results:
             details = [summary, ""]
             for res in success_results:
@@ -1601,11 +1883,15 @@ class BatchUploadApp:
         self.upload_running = False
         self.status_label.config(text="Fehler beim Batch-Upload", foreground="red")
         self._update_upload_button_state()
+        self.root.after(0, self._apply_deferred_folder_changes)
         messagebox.showerror("Fehler", error_msg)
 
     def _on_close(self):
         """Beendet Anwendung ordnungsgemäß."""
         import sys
+        if self.folder_watcher is not None:
+            self.folder_watcher.stop()
+        self.companion_pool.shutdown()
         self.root.quit()
         self.root.destroy()
         sys.exit(0)
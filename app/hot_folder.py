@@ -0,0 +1,212 @@
+"""
+Hot-Folder: Erkennt fertig gerenderte Companion-Sets in überwachten Ordnern.
+
+Ein Set (Basis-Video mit Varianten, *_yt_profile.json, ggf. SRT/Thumbnail,
+siehe docs/FILE_NAMING_CONVENTIONS.md) gilt als fertig, wenn alle geforderten
+Dateien vorhanden sind und sich Größe und mtime aller Dateien für
+HOT_FOLDER_STABLE_SECONDS nicht mehr geändert haben. Jedes fertige Set wird
+genau einmal gemeldet; ändert es sich später erneut, wird es wieder gemeldet.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config import HOT_FOLDER_STABLE_SECONDS
+from app.batch_upload import find_videos_in_directory
+from app.companion import get_video_companion_files
+from app.folder_watcher import FolderWatcher, snapshot_directory
+from app.matching import _extract_base_name
+
+# Companion-Arten, die für ein vollständiges Set gefordert werden können
+REQUIREMENT_KEYS = {
+    "json": "json_file",
+    "softsubs": "softsubs_file",
+    "hardsubs": "hardsubs_file",
+    "srt": "srt_file",
+    "thumbnail": "thumbnail_file",
+}
+
+# Immer Teil der Signatur; SRT/Thumbnail nur, wenn gefordert (sonst erzeugt
+# process_companions() nach dem Upload neue Dateien und das Set gälte als geändert)
+SIGNATURE_KINDS = {"json", "softsubs", "hardsubs"}
+
+Signature = Tuple[Tuple[str, Optional[int], Optional[int]], ...]
+
+
+@dataclass
+class _SetState:
+    """Zuletzt gesehener Zustand eines Sets."""
+    signature: Signature
+    stable_since: float
+
+
+def parse_requirements(value: str) -> Set[str]:
+    """
+    Parst eine kommagetrennte Liste geforderter Companion-Arten ("json" ist immer dabei).
+
+    Raises:
+        ValueError: Bei unbekannten Arten
+    """
+    requirements = {"json"}
+    for item in (value or "").split(","):
+        item = item.strip().lower()
+        if not item:
+            continue
+        if item not in REQUIREMENT_KEYS:
+            raise ValueError(
+                f"Unbekannte Companion-Art '{item}' (erlaubt: {', '.join(sorted(REQUIREMENT_KEYS))})"
+            )
+        requirements.add(item)
+    return requirements
+
+
+class HotFolder:
+    """
+    Meldet fertige, stabile Companion-Sets in einer Menge von Ordnern.
+
+    Der FolderWatcher markiert geänderte Ordner; poll() prüft nur diese
+    (sowie Ordner mit noch nicht stabilen Sets) und liefert fertige Videos.
+    """
+
+    def __init__(
+        self,
+        directories: Iterable[str],
+        requirements: Set[str],
+        stable_seconds: float = HOT_FOLDER_STABLE_SECONDS,
+        include_existing: bool = False,
+        on_pending: Optional[Callable[[str, List[str]], None]] = None,
+        use_watchdog: bool = True
+    ):
+        """
+        Args:
+            directories: Überwachte Ordner
+            requirements: Geforderte Companion-Arten (siehe REQUIREMENT_KEYS)
+            stable_seconds: Wie lange ein Set unverändert sein muss
+            include_existing: Beim Start bereits vorhandene Sets ebenfalls melden
+            on_pending: Optionaler Callback (Video, fehlende Arten) für neu erkannte, unvollständige Sets
+            use_watchdog: False erzwingt Polling im FolderWatcher
+        """
+        self.directories = sorted({os.path.abspath(d) for d in directories})
+        self.requirements = set(requirements) | {"json"}
+        self.stable_seconds = stable_seconds
+        self.on_pending = on_pending
+
+        self._lock = threading.Lock()
+        self._dirty: Set[str] = set(self.directories)
+        self._states: Dict[str, _SetState] = {}
+        self._handled: Dict[str, Signature] = {}
+        self._reported_missing: Dict[str, Tuple[str, ...]] = {}
+
+        self._watcher = FolderWatcher(on_change=self._mark_dirty, use_watchdog=use_watchdog)
+
+        if not include_existing:
+            # Bereits vorhandene Sets gelten als erledigt
+            for directory in self.directories:
+                for set_key, _video_path, signature, missing in self._scan(directory):
+                    if not missing:
+                        self._handled[set_key] = signature
+            self._dirty.clear()
+
+    def start(self):
+        """Startet die Ordner-Überwachung."""
+        self._watcher.start()
+        self._watcher.set_directories(self.directories)
+
+    def stop(self):
+        """Beendet die Ordner-Überwachung."""
+        self._watcher.stop()
+
+    def poll(self) -> List[str]:
+        """
+        Prüft geänderte Ordner und liefert neu fertig gewordene Videos.
+
+        Returns:
+            Video-Pfade (je ein Eintrag pro Basis-Video)
+        """
+        with self._lock:
+            directories, self._dirty = self._dirty, set()
+
+        ready = []
+        still_pending = set()
+        now = time.monotonic()
+
+        for directory in directories:
+            for set_key, video_path, signature, missing in self._scan(directory):
+                if missing:
+                    self._states.pop(set_key, None)
+                    if self.on_pending and self._reported_missing.get(set_key) != missing:
+                        self.on_pending(video_path, list(missing))
+                    self._reported_missing[set_key] = missing
+                    continue
+                self._reported_missing.pop(set_key, None)
+
+                if self._handled.get(set_key) == signature:
+                    continue
+
+                state = self._states.get(set_key)
+                if state is None or state.signature != signature:
+                    self._states[set_key] = _SetState(signature, now)
+                    still_pending.add(directory)
+                elif now - state.stable_since >= self.stable_seconds:
+                    self._handled[set_key] = signature
+                    del self._states[set_key]
+                    ready.append(video_path)
+                else:
+                    still_pending.add(directory)
+
+        with self._lock:
+            # Ordner mit wachsenden Dateien weiter prüfen, auch ohne neue Ereignisse
+            self._dirty |= still_pending
+
+        return ready
+
+    def _mark_dirty(self, directory: str, _names: Set[str]):
+        with self._lock:
+            self._dirty.add(directory)
+
+    def _scan(self, directory: str) -> List[Tuple[str, str, Signature, Tuple[str, ...]]]:
+        """
+        Ermittelt für jedes Basis-Video des Ordners Signatur und fehlende Arten.
+
+        Returns:
+            Liste von (Set-Schlüssel, Video-Pfad, Signatur, fehlende Arten).
+            Der Schlüssel ist Ordner + Basis-Name, da das gewählte Video
+            wechseln kann, während Varianten entstehen.
+        """
+        snapshot = snapshot_directory(directory)
+        results = []
+
+        for video_path in find_videos_in_directory(directory):
+            base_name = _extract_base_name(Path(video_path).stem)
+            companions = get_video_companion_files(video_path)
+
+            # Die Pipeline schreibt <basis>_yt_profile.json; eine fremde JSON
+            # im selben Ordner (Fallback der Companion-Suche) zählt nicht
+            json_file = companions.get("json_file")
+            if json_file and not Path(json_file).name.startswith(base_name):
+                companions["json_file"] = None
+
+            missing = tuple(
+                kind for kind in sorted(self.requirements)
+                if not companions.get(REQUIREMENT_KEYS[kind])
+            )
+
+            files = {Path(video_path).name}
+            for kind in SIGNATURE_KINDS | self.requirements:
+                path = companions.get(REQUIREMENT_KEYS[kind])
+                if path:
+                    files.add(Path(path).name)
+            signature = tuple(
+                (name,) + snapshot.get(name, (None, None))
+                for name in sorted(files)
+            )
+            set_key = os.path.join(directory, base_name)
+            results.append((set_key, video_path, signature, missing))
+
+        return results
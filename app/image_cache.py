@@ -0,0 +1,92 @@
+"""
+Bild-Cache: Dekodierte und skalierte Bilder im Speicher, begrenzt nach Bytes.
+
+Die Batch-Tabelle zeigt dieselben Thumbnails bei jedem Neuaufbau sichtbarer
+Rows erneut an. Statt jedes Mal die Datei zu öffnen und mit LANCZOS zu
+skalieren, wird das fertige PhotoImage nach (Pfad, mtime, Größe, Zielbreite)
+gemerkt. Geänderte Dateien erhalten automatisch einen neuen Schlüssel.
+
+Jeder Eintrag zählt mit seiner Pixelgröße (Breite × Höhe × 4 Bytes); wird
+THUMBNAIL_MEMORY_CACHE_MB überschritten, fallen die am längsten nicht
+benutzten Einträge heraus.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from app.config import THUMBNAIL_MEMORY_CACHE_MB
+
+
+def file_image_key(path: str, width: int) -> Optional[Tuple[str, int, int, int]]:
+    """
+    Schlüssel für ein skaliertes Bild aus einer Datei.
+
+    Returns:
+        (absoluter Pfad, mtime_ns, Größe, Zielbreite) oder None, wenn die Datei fehlt
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return os.path.abspath(path), stat.st_mtime_ns, stat.st_size, width
+
+
+def image_nbytes(width: int, height: int) -> int:
+    """Speicherbedarf eines dekodierten RGBA-Bildes."""
+    return max(1, width) * max(1, height) * 4
+
+
+class ImageCache:
+    """LRU-Cache für dekodierte Bilder mit Byte-Budget."""
+
+    def __init__(self, max_mb: float = THUMBNAIL_MEMORY_CACHE_MB):
+        """
+        Args:
+            max_mb: Speicherbudget in MB (0 = Cache aus)
+        """
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Optional[Hashable]) -> Optional[Any]:
+        """Liefert ein gecachtes Bild und markiert es als benutzt."""
+        if key is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: Optional[Hashable], image: Any, nbytes: int):
+        """Legt ein Bild ab; Bilder größer als das Budget werden nicht gecacht."""
+        if key is None or nbytes > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._total_bytes -= old[1]
+            self._entries[key] = (image, nbytes)
+            self._total_bytes += nbytes
+            while self._total_bytes > self.max_bytes and self._entries:
+                _key, (_image, size) = self._entries.popitem(last=False)
+                self._total_bytes -= size
+
+    def clear(self):
+        """Leert den Cache."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
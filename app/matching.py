@@ -4,10 +4,14 @@ Implementiert präzises Matching mit Auswahl-Option bei Mehrdeutigkeiten.
 """
 
 import os
+import threading
+import time
+from fnmatch import fnmatchcase
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Iterable, Optional, Tuple, List
 from app.config import (
     DEFAULT_PREFIX_LEN,
+    DIRECTORY_INDEX_MAX_AGE_SECONDS,
     SUPPORTED_SUB_EXTS,
     SUPPORTED_INFO_EXTS,
     SUPPORTED_THUMB_EXTS
@@ -19,6 +23,108 @@ class FileMatchingError(Exception):
     pass
 
 
+class DirectoryIndex:
+    """
+    Inhalt eines Ordners aus einem einzigen os.scandir()-Durchlauf.
+
+    Beantwortet alle Glob-Abfragen der Companion-Suche im Speicher und hält
+    die mtimes aus dem Scan, damit pro Datei kein weiterer stat() nötig ist
+    (wichtig auf SMB/NFS-Freigaben).
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.scanned_at = time.monotonic()
+        self.dir_mtime_ns = _dir_mtime_ns(self.directory)
+        self._mtimes: Dict[str, float] = {}
+
+        try:
+            with os.scandir(self.directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file():
+                            self._mtimes[entry.name] = entry.stat().st_mtime
+                    except OSError:
+                        # Datei zwischen Scan und stat() verschwunden
+                        continue
+        except OSError:
+            pass
+
+    def glob(self, pattern: str) -> List[Path]:
+        """Dateien, deren Name auf das Glob-Muster passt (wie Path.glob, ohne Unterordner)."""
+        return [self.directory / name for name in self._mtimes if fnmatchcase(name, pattern)]
+
+    def glob_many(self, patterns: Iterable[str]) -> List[Path]:
+        """Wie glob() für mehrere Muster, jede Datei höchstens einmal."""
+        matches: Dict[str, Path] = {}
+        for pattern in patterns:
+            for path in self.glob(pattern):
+                matches.setdefault(path.name, path)
+        return list(matches.values())
+
+    def mtime(self, path: Path) -> float:
+        """mtime aus dem Scan (0.0 für unbekannte Dateien)."""
+        return self._mtimes.get(Path(path).name, 0.0)
+
+    def newest(self, paths: Iterable[Path]) -> Optional[Path]:
+        """Neueste Datei nach mtime oder None."""
+        paths = list(paths)
+        if not paths:
+            return None
+        return max(paths, key=self.mtime)
+
+    def is_fresh(self) -> bool:
+        """True, solange Höchstalter nicht überschritten und Ordner unverändert ist."""
+        if time.monotonic() - self.scanned_at > DIRECTORY_INDEX_MAX_AGE_SECONDS:
+            return False
+        return _dir_mtime_ns(self.directory) == self.dir_mtime_ns
+
+
+def _dir_mtime_ns(directory: Path) -> Optional[int]:
+    try:
+        return os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+
+
+_index_cache: Dict[str, DirectoryIndex] = {}
+_index_lock = threading.Lock()
+
+
+def get_directory_index(directory) -> DirectoryIndex:
+    """
+    Liefert den (gecachten) Index eines Ordners.
+
+    Alle Videos desselben Ordners teilen sich einen Index. Er wird neu
+    eingelesen, wenn sich die mtime des Ordners ändert (Datei angelegt,
+    gelöscht, umbenannt) oder DIRECTORY_INDEX_MAX_AGE_SECONDS abgelaufen ist.
+    """
+    key = os.path.abspath(directory)
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is not None and index.is_fresh():
+            return index
+
+    index = DirectoryIndex(Path(key))
+    with _index_lock:
+        _index_cache[key] = index
+    return index
+
+
+def invalidate_directory_index(directory=None):
+    """
+    Verwirft gecachte Ordner-Indizes.
+
+    Args:
+        directory: Nur diesen Ordner verwerfen (None = alle)
+    """
+    with _index_lock:
+        if directory is None:
+            _index_cache.clear()
+        else:
+            _index_cache.pop(os.path.abspath(directory), None)
+
+
 def get_file_prefix(file_path: str, prefix_len: int = DEFAULT_PREFIX_LEN) -> str:
     """
     Extrahiert Präfix aus Dateinamen (ohne Extension).
@@ -49,15 +155,11 @@ def find_matching_file(video_path: str, extensions: list[str], prefix_len: int =
     Raises:
         FileMatchingError: Bei Mehrfachtreffern oder Datei-Fehlern
     """
-    video_dir = Path(video_path).parent
+    index = get_directory_index(Path(video_path).parent)
     video_prefix = get_file_prefix(video_path, prefix_len)
 
     # Suche alle Dateien mit passenden Extensions
-    matches = []
-    for ext in extensions:
-        pattern = f"{video_prefix}*{ext}"
-        found_files = list(video_dir.glob(pattern))
-        matches.extend(found_files)
+    matches = index.glob_many(f"{video_prefix}*{ext}" for ext in extensions)
 
     if len(matches) == 0:
         return None
@@ -85,17 +187,13 @@ def find_all_matching_files(video_path: str, extensions: list[str], prefix_len:
     Returns:
         Liste mit Pfaden zu allen gefundenen Dateien (kann leer sein)
     """
-    video_dir = Path(video_path).parent
+    index = get_directory_index(Path(video_path).parent)
     video_prefix = get_file_prefix(video_path, prefix_len)
 
     # Suche alle Dateien mit passenden Extensions
-    matches = []
-    for ext in extensions:
-        pattern = f"{video_prefix}*{ext}"
-        found_files = list(video_dir.glob(pattern))
-        matches.extend(found_files)
+    matches = index.glob_many(f"{video_prefix}*{ext}" for ext in extensions)
 
-    matches.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+    matches.sort(key=index.mtime, reverse=True)
     return [str(m) for m in matches]
 
 
@@ -198,7 +296,7 @@ def find_specialized_video_files(video_path: str) -> dict:
     Returns:
         dict mit Keys: softsubs_file, hardsubs_file (jeweils str oder None)
     """
-    video_dir = Path(video_path).parent
+    index = get_directory_index(Path(video_path).parent)
     video_stem = Path(video_path).stem
 
     # Extrahiere Basis-Namen
@@ -206,13 +304,8 @@ def find_specialized_video_files(video_path: str) -> dict:
 
     # Suche nach spezialisierten Varianten
     def _find_newest(patterns):
-        candidates = []
-        for pattern in patterns:
-            candidates.extend(video_dir.glob(pattern))
-        if not candidates:
-            return None
-        newest = max(candidates, key=lambda p: p.stat().st_mtime)
-        return str(newest)
+        newest = index.newest(index.glob_many(patterns))
+        return str(newest) if newest else None
 
     return {
         "softsubs_file": _find_newest([
@@ -236,16 +329,16 @@ def find_yt_profile_json(video_path: str) -> Optional[str]:
     Returns:
         Pfad zur JSON-Datei oder None
     """
-    video_dir = Path(video_path).parent
-    # Suche nach Dateien, die nur auf *_yt_profile.json enden (Suffix reicht)
-    pattern = "*_yt_profile.json"
-    matches = list(video_dir.glob(pattern))
+    index = get_directory_index(Path(video_path).parent)
+    base_name = _extract_base_name(Path(video_path).stem)
 
-    if matches:
-        newest = max(matches, key=lambda p: p.stat().st_mtime)
-        return str(newest)
+    # Bevorzugt <basename>*_yt_profile.json (mehrere Sets im selben Ordner),
+    # sonst jede Datei, die auf *_yt_profile.json endet (Suffix reicht)
+    newest = index.newest(index.glob(f"{base_name}*_yt_profile.json"))
+    if newest is None:
+        newest = index.newest(index.glob("*_yt_profile.json"))
 
-    return None
+    return str(newest) if newest else None
 
 
 def find_sample_thumbnail(video_path: str) -> Optional[str]:
@@ -262,36 +355,27 @@ def find_sample_thumbnail(video_path: str) -> Optional[str]:
     Returns:
         Pfad zum Thumbnail oder None
     """
-    video_dir = Path(video_path).parent
+    index = get_directory_index(Path(video_path).parent)
     video_stem = Path(video_path).stem
 
     # Extrahiere Basis-Namen
     base_name = _extract_base_name(video_stem)
 
-    candidate_files = []
-
     # Pattern 1: <basename>*_thumbnail.<ext>
-    for ext in SUPPORTED_THUMB_EXTS:
-        candidate_files.extend(video_dir.glob(f"{base_name}*_thumbnail{ext}"))
-
     # Pattern 2: <basename>*_thumb.<ext> (z.B. *_softsubs_thumb.jpg)
-    for ext in SUPPORTED_THUMB_EXTS:
-        candidate_files.extend(video_dir.glob(f"{base_name}*_thumb{ext}"))
+    candidate_files = index.glob_many(
+        [f"{base_name}*_thumbnail{ext}" for ext in SUPPORTED_THUMB_EXTS]
+        + [f"{base_name}*_thumb{ext}" for ext in SUPPORTED_THUMB_EXTS]
+    )
 
-    if candidate_files:
-        newest = max(candidate_files, key=lambda p: p.stat().st_mtime)
+    newest = index.newest(candidate_files)
+    if newest:
         return str(newest)
 
     # Pattern 3: sample_*.<ext> (Fallback)
-    fallback_candidates = []
-    for ext in SUPPORTED_THUMB_EXTS:
-        fallback_candidates.extend(video_dir.glob(f"sample_*{ext}"))
-
-    if fallback_candidates:
-        newest = max(fallback_candidates, key=lambda p: p.stat().st_mtime)
-        return str(newest)
+    newest = index.newest(index.glob_many(f"sample_*{ext}" for ext in SUPPORTED_THUMB_EXTS))
 
-    return None
+    return str(newest) if newest else None
 
 
 def validate_video_file(video_path: str) -> Tuple[bool, str]:
@@ -0,0 +1,173 @@
+"""
+Media-Info: Ein ffprobe-Aufruf pro Video, gecacht nach Pfad + mtime + Größe.
+
+Liefert Streams, Dauer, Auflösung und Codecs für alle Verbraucher
+(Container-SRT-Suche, Upload-Ledger, Thumbnail-Zeitpunkt) aus einem einzigen
+Prozessstart. Ändert sich die Datei, wird automatisch neu geprobt. Das
+ffprobe-JSON landet zusätzlich im Artefakt-Cache (gilt auch nach Neustart).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from app import artifact_cache
+
+# Maximale Anzahl gecachter Einträge (älteste fliegen zuerst raus)
+MEDIA_INFO_CACHE_SIZE = 256
+
+FFPROBE_TIMEOUT_SECONDS = 20
+FFPROBE_OPTIONS = ("-show_streams", "-show_format", "-of", "json")
+
+
+class MediaInfoError(Exception):
+    """ffprobe fehlgeschlagen oder Ausgabe nicht lesbar."""
+    pass
+
+
+@dataclass
+class MediaInfo:
+    """Ergebnis eines ffprobe-Laufs (-show_streams -show_format)."""
+    path: str
+    duration: Optional[float] = None
+    width: Optional[int] = None
+    height: Optional[int] = None
+    video_codec: Optional[str] = None
+    audio_codec: Optional[str] = None
+    subtitle_streams: List[int] = field(default_factory=list)  # Absolute Stream-Indizes
+    streams: List[Dict[str, Any]] = field(default_factory=list)
+    format: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def has_subtitles(self) -> bool:
+        return bool(self.subtitle_streams)
+
+    @classmethod
+    def from_ffprobe(cls, path: str, data: Dict[str, Any]) -> 'MediaInfo':
+        """Baut MediaInfo aus der JSON-Ausgabe von ffprobe."""
+        streams = data.get("streams") or []
+        fmt = data.get("format") or {}
+
+        info = cls(path=path, streams=streams, format=fmt)
+        info.duration = _to_float(fmt.get("duration"))
+
+        for stream in streams:
+            codec_type = stream.get("codec_type")
+            if codec_type == "video" and info.video_codec is None:
+                # Cover-Art (attached_pic) zählt nicht als Videospur
+                if (stream.get("disposition") or {}).get("attached_pic"):
+                    continue
+                info.video_codec = stream.get("codec_name")
+                info.width = stream.get("width")
+                info.height = stream.get("height")
+                if info.duration is None:
+                    info.duration = _to_float(stream.get("duration"))
+            elif codec_type == "audio" and info.audio_codec is None:
+                info.audio_codec = stream.get("codec_name")
+            elif codec_type == "subtitle" and "index" in stream:
+                info.subtitle_streams.append(int(stream["index"]))
+
+        return info
+
+
+def _to_float(value) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+_cache: "OrderedDict[Tuple[str, int, int], MediaInfo]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _cache_key(video_path: str) -> Tuple[str, int, int]:
+    stat = os.stat(video_path)
+    return os.path.abspath(video_path), stat.st_mtime_ns, stat.st_size
+
+
+def probe_media(video_path: str) -> MediaInfo:
+    """
+    Liefert MediaInfo für eine Datei (gecacht nach Pfad + mtime + Größe).
+
+    Args:
+        video_path: Pfad zur Video-Datei
+
+    Returns:
+        MediaInfo
+
+    Raises:
+        MediaInfoError: Datei fehlt, ffprobe nicht verfügbar oder fehlgeschlagen
+    """
+    try:
+        key = _cache_key(video_path)
+    except OSError as e:
+        raise MediaInfoError(f"Datei nicht lesbar: {e}")
+
+    with _cache_lock:
+        info = _cache.get(key)
+        if info is not None:
+            _cache.move_to_end(key)
+            return info
+
+    # Über Neustarts hinweg: ffprobe-JSON aus dem Artefakt-Cache
+    disk_key = artifact_cache.artifact_key(video_path, "probe", FFPROBE_OPTIONS)
+    data = _load_cached_probe(disk_key)
+    if data is None:
+        data = _run_ffprobe(video_path)
+        artifact_cache.store_bytes(disk_key, ".json", json.dumps(data).encode("utf-8"))
+
+    info = MediaInfo.from_ffprobe(video_path, data)
+
+    with _cache_lock:
+        _cache[key] = info
+        _cache.move_to_end(key)
+        while len(_cache) > MEDIA_INFO_CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return info
+
+
+def _load_cached_probe(disk_key: Optional[str]) -> Optional[Dict[str, Any]]:
+    cached = artifact_cache.lookup(disk_key, ".json")
+    if cached is None:
+        return None
+    try:
+        with cached.open("r", encoding="utf-8") as infile:
+            return json.load(infile)
+    except (OSError, ValueError):
+        return None
+
+
+def _run_ffprobe(video_path: str) -> Dict[str, Any]:
+    try:
+        result = subprocess.run(
+            ["ffprobe", "-v", "error", *FFPROBE_OPTIONS, video_path],
+            capture_output=True,
+            text=True,
+            timeout=FFPROBE_TIMEOUT_SECONDS
+        )
+    except FileNotFoundError:
+        raise MediaInfoError("ffprobe nicht im PATH gefunden")
+    except subprocess.TimeoutExpired:
+        raise MediaInfoError(f"ffprobe Timeout nach {FFPROBE_TIMEOUT_SECONDS}s")
+
+    if result.returncode != 0:
+        raise MediaInfoError(f"ffprobe Fehler: {result.stderr}")
+
+    try:
+        return json.loads(result.stdout or "{}")
+    except json.JSONDecodeError as e:
+        raise MediaInfoError(f"ffprobe-Ausgabe nicht lesbar: {e}")
+
+
+def clear_media_info_cache():
+    """Verwirft alle gecachten MediaInfo-Einträge."""
+    with _cache_lock:
+        _cache.clear()
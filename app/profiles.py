@@ -85,6 +85,15 @@ def validate_profile(profile_name: str, profile_data: Dict[str, Any]) -> None:
         if not isinstance(profile_data["snippet"], dict):
             raise ProfileError(f"Profil '{profile_name}': 'snippet' muss Dictionary sein.")
 
+    # Optionale Upload-Einstellungen (z.B. chunk_max_mb)
+    if "upload" in profile_data:
+        upload_settings = profile_data["upload"]
+        if not isinstance(upload_settings, dict):
+            raise ProfileError(f"Profil '{profile_name}': 'upload' muss Dictionary sein.")
+        for key, value in upload_settings.items():
+            if not isinstance(value, (int, float)) or value <= 0:
+                raise ProfileError(f"Profil '{profile_name}': 'upload.{key}' muss eine positive Zahl sein.")
+
 
 def get_profile(profile_name: str, profiles: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -18,6 +18,7 @@ from ttkbootstrap.constants import *
 from app.config import SUPPORTED_VIDEO_EXTS
 from app.matching import validate_video_file
 from app.companion import get_video_companion_files, generate_thumbnail, check_ffmpeg_available
+from app.thumbnail_picker import select_thumbnail
 from app.uploader import upload, UploadError
 from app.auth import create_youtube_client, AuthError
 
@@ -347,10 +348,13 @@ class QuickUploadDialog(tk.Toplevel):
             # Generiere Thumbnail wenn gewünscht und nicht gefunden
             if self.generate_thumb_var.get() and not thumbnail_path and self.ffmpeg_available:
                 try:
-                    success, thumb_path, error = generate_thumbnail(
-                        video_path,
-                        time_seconds=0  # Erstes Frame
-                    )
+                    # Bestes von mehreren Frames; ohne NumPy erstes Frame
+                    success, thumb_path, _candidates, error = select_thumbnail(video_path)
+                    if not success:
+                        success, thumb_path, error = generate_thumbnail(
+                            video_path,
+                            time_seconds=0  # Erstes Frame
+                        )
                     if success:
                         thumbnail_path = thumb_path
                 except Exception as e:
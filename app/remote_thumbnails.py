@@ -0,0 +1,258 @@
+"""
+Thumbnail-Cache für den Asset-Manager: YouTube-Thumbnails auf der Platte, bedingt revalidiert.
+
+Heruntergeladene Bilder liegen in .config/thumbnail_cache/ (Schlüssel: Hash der
+URL) zusammen mit ETag/Last-Modified. Beim erneuten Öffnen des Asset-Managers
+kommen sie direkt von der Platte; erst nach REVALIDATE_AFTER_SECONDS (oder nach
+"Aktualisieren") wird per If-None-Match/If-Modified-Since nachgefragt, ein
+unverändertes Bild kostet dann nur ein 304 ohne Body.
+
+Downloads laufen über einen begrenzten Pool (THUMBNAIL_DOWNLOAD_WORKERS) und
+eine gemeinsame requests.Session (Keep-Alive, Connection-Pool) statt über einen
+Thread und eine neue Verbindung pro Thumbnail.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional
+
+from app.companion_pool import CompanionPool, PRIORITY_DEFAULT
+from app.config import THUMBNAIL_CACHE_MAX_MB, THUMBNAIL_DOWNLOAD_WORKERS
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+CACHE_DIR = REPO_ROOT / ".config/thumbnail_cache"
+
+# Gecachte Bilder werden so lange ohne Rückfrage verwendet
+REVALIDATE_AFTER_SECONDS = 6 * 3600
+
+REQUEST_TIMEOUT = 10
+
+
+def _url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+class RemoteThumbnailCache:
+    """Lädt Thumbnails über einen Worker-Pool und eine gemeinsame Session, mit Plattencache."""
+
+    def __init__(self, max_workers: int = THUMBNAIL_DOWNLOAD_WORKERS, cache_dir: Path = CACHE_DIR):
+        """
+        Args:
+            max_workers: Anzahl paralleler Downloads
+            cache_dir: Verzeichnis für Bilder und Metadaten
+        """
+        self.cache_dir = cache_dir
+        self.max_workers = max(1, max_workers)
+        self._pool = CompanionPool(self.max_workers, name="thumbnail")
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._meta: Dict[str, dict] = {}
+        self._meta_lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Öffentliche API
+    # ------------------------------------------------------------------
+
+    def cached_path(self, url: str) -> Optional[Path]:
+        """Pfad des gecachten Bildes oder None."""
+        path = self._image_path(_url_key(url))
+        return path if path.exists() else None
+
+    def needs_revalidation(self, url: str, valid_after: float = 0.0) -> bool:
+        """
+        True wenn das Bild fehlt oder zu alt ist.
+
+        Args:
+            valid_after: Zeitstempel; früher geprüfte Bilder gelten als veraltet (z.B. "Aktualisieren")
+        """
+        meta = self._load_meta(_url_key(url))
+        if meta is None or self.cached_path(url) is None:
+            return True
+        checked = meta.get("checked", 0.0)
+        return checked < valid_after or time.time() - checked > REVALIDATE_AFTER_SECONDS
+
+    def fetch(
+        self,
+        url: str,
+        on_done: Callable[[Optional[Path], bool], None],
+        valid_after: float = 0.0,
+        key: Optional[Hashable] = None,
+        priority: int = PRIORITY_DEFAULT
+    ):
+        """
+        Liefert ein Thumbnail im Worker-Thread an on_done(pfad, geändert).
+
+        Gecachte Bilder kommen sofort ohne Netzwerk von der Platte (geändert=False).
+        Sind sie veraltet, wird danach bedingt nachgefragt; nur ein neues Bild (200)
+        führt zu einem zweiten Aufruf mit geändert=True. Ohne gecachtes Bild kommt
+        genau ein Aufruf, bei Fehlern mit pfad=None.
+
+        Args:
+            url: Thumbnail-URL
+            on_done: Callback (läuft im Worker-Thread)
+            valid_after: Siehe needs_revalidation()
+            key: Schlüssel für den Pool (default: URL; ein neuer Auftrag ersetzt einen wartenden)
+            priority: Kleinere Zahl = früher
+        """
+        def job():
+            stale = self.cached_path(url) if self.needs_revalidation(url, valid_after) else None
+            if stale is not None:
+                on_done(stale, False)  # Sofort anzeigen, dann nachfragen
+            path, changed = self._fetch(url, valid_after)
+            if stale is None or changed:
+                on_done(path, changed)
+
+        self._pool.submit(key if key is not None else url, job, priority=priority)
+
+    def shutdown(self):
+        """Beendet den Pool, begrenzt den Plattencache und schließt die Session."""
+        self._pool.shutdown()
+        self._evict()
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def clear(self):
+        """Löscht alle gecachten Thumbnails."""
+        with self._meta_lock:
+            self._meta.clear()
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _image_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.img"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def _get_session(self):
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_workers)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._session = session
+            return self._session
+
+    def _load_meta(self, key: str) -> Optional[dict]:
+        with self._meta_lock:
+            if key in self._meta:
+                return self._meta[key]
+        try:
+            meta = json.loads(self._meta_path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            meta = None
+        with self._meta_lock:
+            self._meta[key] = meta
+        return meta
+
+    def _save_meta(self, key: str, meta: dict):
+        with self._meta_lock:
+            self._meta[key] = meta
+        path = self._meta_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + f".{threading.get_ident()}.tmp")
+            tmp_path.write_text(json.dumps(meta), encoding="utf-8")
+            tmp_path.replace(path)
+        except OSError as e:
+            print(f"⚠ Thumbnail-Cache: Speichern fehlgeschlagen: {e}")
+
+    def _fetch(self, url: str, valid_after: float):
+        key = _url_key(url)
+        image_path = self._image_path(key)
+        meta = self._load_meta(key) or {}
+        cached = image_path.exists()
+
+        if cached and not self.needs_revalidation(url, valid_after):
+            try:
+                os.utime(image_path)  # LRU: Zugriffszeitpunkt über mtime
+            except OSError:
+                pass
+            return image_path, False
+
+        headers = {}
+        if cached and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if cached and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = self._get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+            if response.status_code == 304 and cached:
+                self._save_meta(key, dict(meta, url=url, checked=time.time()))
+                return image_path, False
+            response.raise_for_status()
+        except Exception as e:
+            print(f"⚠ Thumbnail konnte nicht geladen werden ({url}): {e}")
+            return (image_path if cached else None), False
+
+        try:
+            image_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = image_path.with_name(image_path.name + f".{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(response.content)
+            tmp_path.replace(image_path)
+        except OSError as e:
+            print(f"⚠ Thumbnail-Cache: Speichern fehlgeschlagen: {e}")
+            return None, False
+
+        self._save_meta(key, {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked": time.time(),
+        })
+        return image_path, True
+
+    def _evict(self):
+        """Löscht die ältesten Bilder, bis der Cache unter THUMBNAIL_CACHE_MAX_MB liegt."""
+        max_bytes = int(THUMBNAIL_CACHE_MAX_MB * 1024 * 1024)
+        entries = []
+        total = 0
+        try:
+            for bucket in os.scandir(self.cache_dir):
+                if not bucket.is_dir():
+                    continue
+                for entry in os.scandir(bucket.path):
+                    if not entry.name.endswith(".img"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            return
+
+        if total <= max_bytes:
+            return
+
+        entries.sort()
+        for _mtime, size, path in entries:
+            key = Path(path).stem
+            for stale in (path, str(self._meta_path(key))):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+            with self._meta_lock:
+                self._meta.pop(key, None)
+            total -= size
+            if total <= max_bytes:
+                break
@@ -0,0 +1,193 @@
+"""
+Zentrale Retry-Policy für YouTube-API-Aufrufe.
+
+Klassifiziert HttpErrors und Netzwerkfehler, wartet mit exponentiellem Backoff
+und Jitter und beachtet den Retry-After-Header.
+"""
+
+from __future__ import annotations
+
+import http.client
+import json
+import random
+import socket
+import ssl
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, Tuple, TypeVar
+
+from googleapiclient.errors import HttpError
+
+from app.config import UPLOAD_RETRY_MAX_ATTEMPTS, UPLOAD_RETRY_MAX_DELAY
+
+T = TypeVar("T")
+
+# Serverseitige, vorübergehende Fehler
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+# Fehlergründe der YouTube API, die nach kurzer Wartezeit meist verschwinden
+RETRYABLE_REASONS = {
+    "rateLimitExceeded",
+    "userRateLimitExceeded",
+    "backendError",
+    "internalError",
+}
+
+# Tageskontingent erschöpft: erst nach Reset sinnvoll, daher nur mit Retry-After
+QUOTA_REASONS = {"quotaExceeded", "dailyLimitExceeded"}
+
+RETRYABLE_EXCEPTIONS: Tuple[type, ...] = (
+    ConnectionError,
+    TimeoutError,
+    socket.timeout,
+    socket.gaierror,
+    ssl.SSLError,
+    http.client.HTTPException,
+)
+
+
+@dataclass
+class RetryEvent:
+    """Information über einen bevorstehenden Wiederholungsversuch."""
+    attempt: int        # Nummer des fehlgeschlagenen Versuchs (1-basiert)
+    max_attempts: int
+    delay: float        # Wartezeit in Sekunden
+    reason: str
+
+
+@dataclass
+class RetryPolicy:
+    """Exponentieller Backoff mit Full Jitter."""
+    max_attempts: int = UPLOAD_RETRY_MAX_ATTEMPTS
+    base_delay: float = 1.0
+    max_delay: float = UPLOAD_RETRY_MAX_DELAY
+
+    def delay_for(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Wartezeit vor dem nächsten Versuch.
+
+        Args:
+            attempt: Anzahl bisher fehlgeschlagener Versuche (1-basiert)
+            retry_after: Vom Server vorgegebene Mindestwartezeit
+
+        Returns:
+            Sekunden (Retry-After hat Vorrang, wird nicht gekappt)
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, ceiling)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+
+
+DEFAULT_POLICY = RetryPolicy()
+
+
+def _error_reasons(error: HttpError) -> set:
+    """Liest die 'reason'-Felder aus der JSON-Fehlerantwort."""
+    try:
+        data = json.loads(error.content.decode("utf-8"))
+        return {item.get("reason", "") for item in data["error"].get("errors", [])}
+    except Exception:
+        return set()
+
+
+def _retry_after_seconds(error: HttpError) -> Optional[float]:
+    """Wertet den Retry-After-Header aus (Sekunden oder HTTP-Datum)."""
+    resp = getattr(error, "resp", None)
+    value = resp.get("retry-after") if resp is not None else None
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except Exception:
+        return None
+
+
+def classify_error(error: BaseException) -> Tuple[bool, Optional[float], str]:
+    """
+    Entscheidet, ob ein Fehler wiederholt werden soll.
+
+    Returns:
+        (wiederholbar, retry_after in Sekunden oder None, kurzer Grund)
+    """
+    if isinstance(error, HttpError):
+        status = error.resp.status
+        reasons = _error_reasons(error)
+        retry_after = _retry_after_seconds(error)
+        reason = ", ".join(sorted(r for r in reasons if r)) or f"HTTP {status}"
+
+        if reasons & QUOTA_REASONS:
+            return retry_after is not None, retry_after, reason
+        if status in RETRYABLE_STATUS or reasons & RETRYABLE_REASONS:
+            return True, retry_after, reason
+        return False, None, reason
+
+    if isinstance(error, RETRYABLE_EXCEPTIONS):
+        return True, None, type(error).__name__
+
+    try:
+        import httplib2
+        if isinstance(error, httplib2.HttpLib2Error):
+            return True, None, type(error).__name__
+    except ImportError:
+        pass
+
+    return False, None, type(error).__name__
+
+
+def call_with_retry(
+    func: Callable[[], T],
+    policy: Optional[RetryPolicy] = None,
+    on_retry: Optional[Callable[[RetryEvent], None]] = None,
+    sleep: Callable[[float], None] = time.sleep
+) -> T:
+    """
+    Führt func() aus und wiederholt vorübergehende Fehler.
+
+    Args:
+        func: Aufruf ohne Argumente (z.B. request.execute)
+        policy: RetryPolicy (Default: DEFAULT_POLICY)
+        on_retry: Optionaler Callback vor jeder Wartezeit
+        sleep: Warte-Funktion (austauschbar für Tests)
+
+    Returns:
+        Rückgabewert von func()
+
+    Raises:
+        Den letzten Fehler, wenn er nicht wiederholbar ist oder alle Versuche verbraucht sind
+    """
+    policy = policy or DEFAULT_POLICY
+    attempt = 0
+
+    while True:
+        try:
+            return func()
+        except Exception as e:
+            attempt += 1
+            retryable, retry_after, reason = classify_error(e)
+            if not retryable or attempt >= policy.max_attempts:
+                raise
+
+            delay = policy.delay_for(attempt, retry_after)
+            print(f"⚠ {reason} – Wiederholung {attempt}/{policy.max_attempts - 1} in {delay:.1f}s")
+            if on_retry:
+                on_retry(RetryEvent(
+                    attempt=attempt,
+                    max_attempts=policy.max_attempts,
+                    delay=delay,
+                    reason=reason
+                ))
+            sleep(delay)
+
+
+def execute_with_retry(request, on_retry: Optional[Callable[[RetryEvent], None]] = None):
+    """Kurzform für call_with_retry(request.execute)."""
+    return call_with_retry(request.execute, on_retry=on_retry)
@@ -1,15 +1,51 @@
 """
 Lädt SVG-Icons und konvertiert sie für tkinter.
+
+Gerasterte Icons werden pro (Icon, Größe, Farben) im Speicher gemerkt;
+mit cairosvg gerenderte SVGs zusätzlich im Artefakt-Cache auf der Platte.
+Die Loader liefern Kopien, Aufrufer dürfen sie also verändern.
 """
 
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from PIL import Image, ImageDraw
 from io import BytesIO
 import xml.etree.ElementTree as ET
 import re
 
+# Anzahl gemerkter Icon-Rasterungen
+ICON_CACHE_SIZE = 256
+
+_icon_cache: "OrderedDict[tuple, Image.Image]" = OrderedDict()
+_icon_cache_lock = threading.Lock()
+
+
+def _cached_icon(key: tuple, render) -> Image.Image:
+    """Liefert die gemerkte Rasterung zu key (render() nur beim ersten Mal)."""
+    with _icon_cache_lock:
+        img = _icon_cache.get(key)
+        if img is not None:
+            _icon_cache.move_to_end(key)
+            return img
+
+    img = render()
+    img.load()
+
+    with _icon_cache_lock:
+        _icon_cache[key] = img
+        while len(_icon_cache) > ICON_CACHE_SIZE:
+            _icon_cache.popitem(last=False)
+    return img
 
-def svg_to_pil(svg_path, size=16, fill_color="white", bg_color=None):
+
+def clear_icon_cache():
+    """Verwirft alle gemerkten Icon-Rasterungen im Speicher."""
+    with _icon_cache_lock:
+        _icon_cache.clear()
+
+
+def svg_to_pil(svg_path, size=16, fill_color="white", bg_color=None, persist=True):
     """
     Konvertiert SVG zu PIL Image (vereinfachte Methode ohne cairosvg).
 
@@ -18,14 +54,34 @@ def svg_to_pil(svg_path, size=16, fill_color="white", bg_color=None):
         size: Zielgröße in Pixeln
         fill_color: Farbe für SVG-Pfade
         bg_color: Optionaler Hintergrund (None = transparent)
+        persist: cairosvg-Ergebnis im Artefakt-Cache ablegen bzw. von dort laden
 
     Returns:
         PIL Image
     """
+    key = ("svg", str(svg_path), size, fill_color, bg_color)
+    return _cached_icon(key, lambda: _render_svg(svg_path, size, fill_color, bg_color, persist)).copy()
+
+
+def _render_svg(svg_path, size, fill_color, bg_color, persist):
     try:
         # Versuche mit cairosvg (falls installiert)
         import cairosvg
 
+        disk_key = None
+        if persist:
+            from app import artifact_cache
+
+            disk_key = artifact_cache.artifact_key(str(svg_path), "icon", (size, fill_color, bg_color))
+            cached = artifact_cache.lookup(disk_key, ".png")
+            if cached is not None:
+                try:
+                    with Image.open(cached) as img:
+                        img.load()
+                        return img.copy()
+                except OSError:
+                    pass
+
         # Lese SVG und ersetze fill-Farbe
         with open(svg_path, 'r') as f:
             svg_content = f.read()
@@ -49,6 +105,11 @@ def svg_to_pil(svg_path, size=16, fill_color="white", bg_color=None):
             background.paste(img, (0, 0), img)
             img = background
 
+        if disk_key is not None:
+            buffer = BytesIO()
+            img.save(buffer, format="PNG")
+            artifact_cache.store_bytes(disk_key, ".png", buffer.getvalue())
+
         return img
 
     except ImportError:
@@ -117,13 +178,24 @@ def load_youtube_icon(size=16, bg_color=None):
     return svg_to_pil(svg_path, size, fill_color='white', bg_color=bg_color)
 
 
-def load_upload_icon(size=24, fill_color='#ffffff'):
+def load_upload_icon(size=24, fill_color='#ffffff', bg_color=None):
     """
-    Simples Material-Style Upload-Icon (ohne Hintergrund).
+    Simples Material-Style Upload-Icon.
+
+    Args:
+        bg_color: Optionaler Kreis als Hintergrund (None = transparent)
     """
+    key = ("upload", size, fill_color, bg_color)
+    return _cached_icon(key, lambda: _draw_upload_icon(size, fill_color, bg_color)).copy()
+
+
+def _draw_upload_icon(size, fill_color, bg_color):
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
+    if bg_color:
+        draw.ellipse([0, 0, size - 1, size - 1], fill=bg_color)
+
     cx, cy = size // 2, size // 2
     arrow_h = size // 2
 
@@ -147,6 +219,11 @@ def load_folder_icon(size=24, fill_color='#ffffff', stroke_color=None):
     """
     Material-Style Folder (flach, kein Hintergrund-Kreis).
     """
+    key = ("folder", size, fill_color, stroke_color)
+    return _cached_icon(key, lambda: _draw_folder_icon(size, fill_color, stroke_color)).copy()
+
+
+def _draw_folder_icon(size, fill_color, stroke_color):
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
 
@@ -177,9 +254,94 @@ def load_folder_icon(size=24, fill_color='#ffffff', stroke_color=None):
 
 def load_close_icon(size=18, fill_color="#888888"):
     """Einfaches X (Material nah)."""
+    key = ("close", size, fill_color)
+    return _cached_icon(key, lambda: _draw_close_icon(size, fill_color)).copy()
+
+
+def _draw_close_icon(size, fill_color):
     img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
     draw = ImageDraw.Draw(img)
     pad = size // 4
     draw.line([pad, pad, size - pad, size - pad], fill=fill_color, width=2)
     draw.line([size - pad, pad, pad, size - pad], fill=fill_color, width=2)
     return img
+
+
+def load_link_icon(size=28, bg_color='#0eb1d2', fill_color=(255, 255, 255, 255)):
+    """Material Design Link-Icon (Kettenglied) auf farbigem Kreis."""
+    key = ("link", size, bg_color, fill_color)
+    return _cached_icon(key, lambda: _draw_link_icon(size, bg_color, fill_color)).copy()
+
+
+def _draw_link_icon(size, bg_color, link_color):
+    icon = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(icon)
+
+    # Kreis als Hintergrund
+    draw.ellipse([0, 0, size, size], fill=bg_color)
+
+    margin = size // 5
+    thickness = 2
+
+    # Material Design Link: Zwei abgerundete Kettenglied-Formen
+    # Linkes Glied (schräg links-oben)
+    left_x1 = margin
+    left_y1 = margin + 2
+    left_x2 = size // 2 - 1
+    left_y2 = margin + 2 + thickness
+    draw.rectangle([left_x1, left_y1, left_x2, left_y2], fill=link_color)
+
+    # Rechtes Glied (schräg rechts-unten)
+    right_x1 = size // 2 + 1
+    right_y1 = size - margin - thickness - 2
+    right_x2 = size - margin
+    right_y2 = size - margin - 2
+    draw.rectangle([right_x1, right_y1, right_x2, right_y2], fill=link_color)
+
+    # Verbindungslinien vertikal
+    draw.rectangle([margin, left_y1, margin + thickness, size // 2], fill=link_color)
+    draw.rectangle([size - margin - thickness, size // 2, size - margin, right_y2], fill=link_color)
+
+    return icon
+
+
+def overlay_layer(width, height, placements):
+    """
+    Vorkomponierte, transparente Ebene mit Icons für Bilder einer Größe.
+
+    Args:
+        width, height: Größe des Zielbildes
+        placements: Tupel aus (Icon-Name, Icon-Größe, Ecke) mit Icon-Name "link"
+                    oder "upload" (Standardfarben) und Ecke "top-right"/"bottom-right"
+
+    Returns:
+        RGBA-Bild (gemerkt, nicht verändern)
+    """
+    key = ("overlay", width, height, tuple(placements))
+    return _cached_icon(key, lambda: _compose_overlay(width, height, placements))
+
+
+def _compose_overlay(width, height, placements, padding=4):
+    layer = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    loaders = {
+        "link": lambda size: load_link_icon(size),
+        "upload": lambda size: load_upload_icon(size, bg_color='#f7b33b'),
+    }
+    for name, size, corner in placements:
+        icon = loaders[name](size)
+        x = width - size - padding
+        y = padding if corner == "top-right" else height - size - padding
+        layer.alpha_composite(icon, (x, y))
+    return layer
+
+
+def apply_overlay(img, overlay):
+    """
+    Legt eine Overlay-Ebene auf ein Bild (ein Paste, Ergebnis RGB).
+
+    Statt RGBA-Konvertierung, Einzel-Paste pro Icon und Rückkonvertierung
+    wird nur einmal mit dem Alphakanal der Ebene als Maske kopiert.
+    """
+    result = img.convert('RGB') if img.mode != 'RGB' else img.copy()
+    result.paste(overlay, (0, 0), overlay)
+    return result
@@ -0,0 +1,329 @@
+"""
+Thumbnail-Auswahl: Mehrere Kandidaten-Frames in einem ffmpeg-Aufruf, bewertet per NumPy.
+
+Statt eines festen Frames bei t=3s (oft schwarz oder mitten in einer Blende)
+werden THUMBNAIL_CANDIDATES Zeitpunkte über das Video verteilt. ffmpeg springt
+pro Zeitpunkt direkt zum vorherigen Keyframe (-noaccurate_seek, -skip_frame
+nokey) und dekodiert nur diesen; das Video wird weder ganz gelesen noch ganz
+dekodiert. Die Kandidaten werden verkleinert und vektorisiert bewertet
+(Helligkeit, Kontrast, Schärfe, Farbigkeit, ohne Gesichtserkennung).
+
+Kandidaten liegen im Artefakt-Cache; erneutes Auswählen startet kein ffmpeg.
+Da der Cache Einträge verdrängen kann, werden Pfade vor der Verwendung neu
+aufgelöst (resolve_candidates()) und fehlende Frames nachextrahiert. Ist der
+Cache nicht beschreibbar, bleiben die Frames im Speicher (keine Reste in /tmp).
+Ohne NumPy (optional) bleibt es bei generate_thumbnail().
+"""
+
+from __future__ import annotations
+
+import io
+import subprocess
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO, List, Optional, Tuple, Union
+
+from app import artifact_cache
+from app.config import THUMBNAIL_CANDIDATES
+from app.companion import THUMBNAIL_FFMPEG_OPTIONS, get_video_duration
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Bewertungsgröße (16:9, verzerrt bei anderen Formaten, für Vergleich egal)
+SCORE_SIZE = (160, 90)
+
+# Anfang/Ende auslassen (Einblendung, Abspann)
+SAMPLE_MARGIN = 0.05
+
+# Gewichte der Teilbewertungen (Summe 1)
+SCORE_WEIGHTS = {
+    "brightness": 0.25,
+    "contrast": 0.30,
+    "sharpness": 0.30,
+    "colorfulness": 0.15,
+}
+
+# Mittlere Helligkeit darunter/darüber gilt als Schwarz-/Weißbild
+BLACK_LEVEL = 0.08
+WHITE_LEVEL = 0.95
+
+
+@dataclass
+class ThumbnailCandidate:
+    """Ein Kandidaten-Frame mit Bewertung (0..1, höher = besser)."""
+    path: str
+    time_seconds: float
+    source_path: str = ""  # Video, aus dem das Frame stammt (zum Nachextrahieren)
+    score: float = 0.0
+    brightness: float = 0.0
+    contrast: float = 0.0
+    sharpness: float = 0.0
+    colorfulness: float = 0.0
+    data: Optional[bytes] = field(default=None, repr=False)  # JPEG im Speicher, wenn der Cache nicht beschreibbar ist
+
+    def image_source(self) -> Union[str, BinaryIO]:
+        """Quelle für Image.open(): Speicher-Kopie oder Datei."""
+        return io.BytesIO(self.data) if self.data is not None else self.path
+
+    def read_bytes(self) -> bytes:
+        return self.data if self.data is not None else Path(self.path).read_bytes()
+
+
+def candidate_times(duration: float, count: int = THUMBNAIL_CANDIDATES) -> List[float]:
+    """Verteilt count Zeitpunkte gleichmäßig, ohne Anfang und Ende."""
+    count = max(1, count)
+    span = duration * (1 - 2 * SAMPLE_MARGIN)
+    return [
+        round(duration * SAMPLE_MARGIN + span * (i + 0.5) / count, 2)
+        for i in range(count)
+    ]
+
+
+def _candidate_key(video_path: str, time_seconds: float) -> Optional[str]:
+    return artifact_cache.artifact_key(
+        video_path,
+        "thumbnail-candidate",
+        (time_seconds, ".jpg", "keyframe") + THUMBNAIL_FFMPEG_OPTIONS
+    )
+
+
+def extract_candidates(video_path: str, times: List[float]) -> Tuple[List[ThumbnailCandidate], str]:
+    """
+    Extrahiert je einen Keyframe pro Zeitpunkt in einem ffmpeg-Aufruf.
+
+    Bereits gecachte Kandidaten werden nicht neu erzeugt.
+
+    Returns:
+        (kandidaten: List[ThumbnailCandidate], fehlermeldung: str)
+    """
+    candidates: List[Optional[ThumbnailCandidate]] = []
+    missing = []
+    for time_seconds in times:
+        cached = artifact_cache.lookup(_candidate_key(video_path, time_seconds), ".jpg")
+        if cached is not None:
+            candidates.append(ThumbnailCandidate(str(cached), time_seconds, video_path))
+        else:
+            candidates.append(None)
+            missing.append(len(candidates) - 1)
+
+    if not missing:
+        return candidates, ""
+
+    with tempfile.TemporaryDirectory(prefix="yt-thumbs-") as tmp_dir:
+        command = ["ffmpeg", "-y", "-nostdin", "-v", "error"]
+        for i in missing:
+            command += [
+                "-skip_frame", "nokey",  # Nur Keyframes dekodieren
+                "-noaccurate_seek",      # Direkt beim Keyframe vor dem Zeitpunkt starten
+                "-ss", str(times[i]),
+                "-t", "5",               # Eingabe danach nicht weiterlesen
+                "-i", video_path,
+            ]
+        for input_index, i in enumerate(missing):
+            command += [
+                "-map", f"{input_index}:V:0",
+                *THUMBNAIL_FFMPEG_OPTIONS,
+                str(Path(tmp_dir) / f"candidate_{i:02d}.jpg")
+            ]
+
+        try:
+            result = subprocess.run(command, capture_output=True, text=True, timeout=60)
+        except Exception as e:
+            return [c for c in candidates if c is not None], f"Fehler: {str(e)}"
+
+        error = "" if result.returncode == 0 else f"ffmpeg Fehler: {result.stderr}"
+
+        for i in missing:
+            produced = Path(tmp_dir) / f"candidate_{i:02d}.jpg"
+            if not produced.exists() or produced.stat().st_size == 0:
+                continue
+            key = _candidate_key(video_path, times[i])
+            artifact_cache.store(key, ".jpg", str(produced))
+            cached = artifact_cache.lookup(key, ".jpg")
+            if cached is None:
+                # Cache nicht beschreibbar: Frame im Speicher halten statt Dateien in /tmp zu hinterlassen
+                candidates[i] = ThumbnailCandidate("", times[i], video_path, data=produced.read_bytes())
+            else:
+                candidates[i] = ThumbnailCandidate(str(cached), times[i], video_path)
+
+    return [c for c in candidates if c is not None], error
+
+
+def _refresh_path(candidate: ThumbnailCandidate) -> bool:
+    """Prüft den Pfad eines Kandidaten, sucht ihn notfalls erneut im Cache (ohne ffmpeg)."""
+    if candidate.data is not None or (candidate.path and Path(candidate.path).exists()):
+        return True
+    if not candidate.source_path:
+        return False
+    cached = artifact_cache.lookup(_candidate_key(candidate.source_path, candidate.time_seconds), ".jpg")
+    if cached is None:
+        return False
+    candidate.path = str(cached)
+    return True
+
+
+def candidates_available(candidates: List[ThumbnailCandidate]) -> bool:
+    """True wenn alle Kandidaten-Dateien noch vorhanden sind (aktualisiert Pfade, startet kein ffmpeg)."""
+    return all([_refresh_path(candidate) for candidate in candidates])
+
+
+def resolve_candidates(candidates: List[ThumbnailCandidate]) -> Tuple[List[ThumbnailCandidate], str]:
+    """
+    Stellt sicher, dass alle Kandidaten-Dateien existieren.
+
+    Aus dem Artefakt-Cache verdrängte Frames werden in einem ffmpeg-Aufruf
+    nachextrahiert; Bewertungen bleiben erhalten.
+
+    Returns:
+        (verfügbare Kandidaten, fehlermeldung)
+    """
+    missing = [c for c in candidates if not _refresh_path(c)]
+    error = ""
+    by_source: dict = {}
+    for candidate in missing:
+        if candidate.source_path:
+            by_source.setdefault(candidate.source_path, []).append(candidate)
+
+    for source_path, group in by_source.items():
+        extracted, error = extract_candidates(source_path, [c.time_seconds for c in group])
+        by_time = {c.time_seconds: c for c in extracted}
+        for candidate in group:
+            if candidate.time_seconds in by_time:
+                candidate.path = by_time[candidate.time_seconds].path
+                candidate.data = by_time[candidate.time_seconds].data
+
+    return [c for c in candidates if c.data is not None or (c.path and Path(c.path).exists())], error
+
+
+def score_candidates(candidates: List[ThumbnailCandidate]) -> List[ThumbnailCandidate]:
+    """
+    Bewertet Kandidaten vektorisiert über verkleinerte Frames (setzt score & Teilwerte).
+
+    Returns:
+        Dieselben Kandidaten (unlesbare Bilder entfernt)
+    """
+    from PIL import Image
+
+    frames = []
+    readable = []
+    for candidate in candidates:
+        try:
+            with Image.open(candidate.image_source()) as img:
+                img.draft("RGB", SCORE_SIZE)  # JPEG: schon beim Dekodieren verkleinern
+                frames.append(np.asarray(img.convert("RGB").resize(SCORE_SIZE), dtype=np.float32))
+            readable.append(candidate)
+        except Exception as e:
+            print(f"⚠ Thumbnail-Kandidat nicht lesbar ({candidate.path}): {e}")
+
+    if not frames:
+        return []
+
+    stack = np.stack(frames) / 255.0  # (K, H, W, 3)
+    r, g, b = stack[..., 0], stack[..., 1], stack[..., 2]
+    gray = 0.299 * r + 0.587 * g + 0.114 * b
+
+    brightness = gray.mean(axis=(1, 2))
+    contrast = gray.std(axis=(1, 2))
+
+    # Varianz des Laplace-Filters als Schärfemaß
+    laplacian = (
+        4 * gray[:, 1:-1, 1:-1]
+        - gray[:, :-2, 1:-1] - gray[:, 2:, 1:-1]
+        - gray[:, 1:-1, :-2] - gray[:, 1:-1, 2:]
+    )
+    sharpness = laplacian.var(axis=(1, 2))
+
+    # Farbigkeit nach Hasler & Süsstrunk
+    rg = r - g
+    yb = 0.5 * (r + g) - b
+    colorfulness = (
+        np.sqrt(rg.std(axis=(1, 2)) ** 2 + yb.std(axis=(1, 2)) ** 2)
+        + 0.3 * np.sqrt(rg.mean(axis=(1, 2)) ** 2 + yb.mean(axis=(1, 2)) ** 2)
+    )
+
+    parts = {
+        "brightness": np.clip(1 - np.abs(brightness - 0.5) * 2, 0, 1),
+        "contrast": np.clip(contrast / 0.25, 0, 1),
+        "sharpness": sharpness / sharpness.max() if sharpness.max() > 0 else sharpness,
+        "colorfulness": np.clip(colorfulness / 0.4, 0, 1),
+    }
+    score = sum(SCORE_WEIGHTS[name] * values for name, values in parts.items())
+
+    # Schwarz-/Weißbilder (Blenden) nur wählen, wenn nichts anderes da ist
+    score = np.where((brightness < BLACK_LEVEL) | (brightness > WHITE_LEVEL), score * 0.1, score)
+
+    for i, candidate in enumerate(readable):
+        candidate.score = float(score[i])
+        candidate.brightness = float(brightness[i])
+        candidate.contrast = float(contrast[i])
+        candidate.sharpness = float(parts["sharpness"][i])
+        candidate.colorfulness = float(colorfulness[i])
+
+    return readable
+
+
+def select_thumbnail(
+    video_path: str,
+    output_path: Optional[str] = None,
+    count: int = THUMBNAIL_CANDIDATES
+) -> Tuple[bool, str, List[ThumbnailCandidate], str]:
+    """
+    Wählt den besten von count Kandidaten-Frames und speichert ihn als Thumbnail.
+
+    Args:
+        video_path: Pfad zur Video-Datei
+        output_path: Optional, Ausgabepfad (default: <video_basename>_thumb.jpg)
+        count: Anzahl Kandidaten
+
+    Returns:
+        (erfolg: bool, output_path: str, kandidaten: List[ThumbnailCandidate] (nach Zeit), fehlermeldung: str)
+    """
+    if not NUMPY_AVAILABLE:
+        return False, "", [], "NumPy nicht installiert"
+
+    video_path_obj = Path(video_path)
+    if output_path is None:
+        output_path = str(video_path_obj.parent / f"{video_path_obj.stem}_thumb.jpg")
+
+    duration = get_video_duration(video_path)
+    if not duration:
+        return False, "", [], "Videodauer unbekannt"
+
+    candidates, error = extract_candidates(video_path, candidate_times(duration, count))
+    candidates = score_candidates(candidates)
+    if not candidates:
+        return False, "", [], error or "Keine Kandidaten-Frames erzeugt"
+
+    best = max(candidates, key=lambda c: c.score)
+    success, error = apply_candidate(best, output_path)
+    if not success:
+        return False, "", candidates, error
+
+    return True, output_path, candidates, ""
+
+
+def apply_candidate(candidate: ThumbnailCandidate, output_path: str) -> Tuple[bool, str]:
+    """
+    Übernimmt einen Kandidaten als Thumbnail (z.B. nach Auswahl in der GUI).
+
+    Returns:
+        (erfolg: bool, fehlermeldung: str)
+    """
+    available, error = resolve_candidates([candidate])
+    if not available:
+        return False, f"Kandidaten-Frame nicht mehr verfügbar: {error or candidate.path}"
+
+    try:
+        output = Path(output_path)
+        tmp_path = output.with_name(output.name + ".tmp")
+        tmp_path.write_bytes(candidate.read_bytes())
+        tmp_path.replace(output)
+        return True, ""
+    except OSError as e:
+        return False, f"Thumbnail konnte nicht gespeichert werden: {e}"
@@ -0,0 +1,133 @@
+"""
+Upload-Journal: Persistente Resumable-Upload-Sitzungen.
+
+Speichert Sitzungs-URI, bestätigten Byte-Offset und Datei-Identität laufender
+Uploads in .config/upload_journal.json. Nach einem Absturz oder Neustart setzt
+upload() dieselbe Datei für dasselbe Profil an der Stelle fort, die der Server
+bereits bestätigt hat.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+JOURNAL_FILE = REPO_ROOT / ".config/upload_journal.json"
+
+# YouTube hält Resumable-Sitzungen etwa eine Woche offen
+SESSION_MAX_AGE = timedelta(days=6)
+
+_journal_lock = threading.Lock()
+
+
+def session_key(fingerprint_key: str, privacy_status: Optional[str]) -> str:
+    """Schlüssel einer Sitzung: Datei-Identität + Ziel-Profil (Privacy-Status)."""
+    return f"{fingerprint_key}|{privacy_status or ''}"
+
+
+def load_journal() -> Dict[str, Any]:
+    if not JOURNAL_FILE.exists():
+        return {}
+    try:
+        with JOURNAL_FILE.open("r", encoding="utf-8") as infile:
+            return json.load(infile)
+    except Exception:
+        return {}
+
+
+def save_journal(journal: Dict[str, Any]) -> None:
+    JOURNAL_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = JOURNAL_FILE.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as outfile:
+        json.dump(journal, outfile, indent=2, ensure_ascii=False)
+    tmp_path.replace(JOURNAL_FILE)
+
+
+def _is_expired(session: Dict[str, Any]) -> bool:
+    try:
+        created = datetime.fromisoformat(session.get("created_at", ""))
+    except ValueError:
+        return True
+    return datetime.now() - created > SESSION_MAX_AGE
+
+
+def get_session(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Liefert eine offene Sitzung (abgelaufene werden verworfen).
+
+    Returns:
+        Sitzungs-Dict (resumable_uri, offset, size, video_path, ...) oder None
+    """
+    with _journal_lock:
+        journal = load_journal()
+        session = journal.get(key)
+        if session and _is_expired(session):
+            del journal[key]
+            save_journal(journal)
+            return None
+        return session
+
+
+def start_session(key: str, resumable_uri: str, size: int, upload_args: Dict[str, Any]) -> None:
+    """
+    Legt eine Sitzung an, sobald YouTube die Resumable-URI vergeben hat.
+
+    Args:
+        key: session_key()
+        resumable_uri: Sitzungs-URI des Uploads
+        size: Dateigröße in Bytes
+        upload_args: Argumente von upload() (video_path, srt_path, factsheet_data, profile_data),
+                     damit unterbrochene Uploads beim nächsten Start fortgesetzt werden können
+    """
+    with _journal_lock:
+        journal = load_journal()
+        journal[key] = {
+            "resumable_uri": resumable_uri,
+            "offset": 0,
+            "size": size,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "updated_at": datetime.now().isoformat(timespec="seconds"),
+            **upload_args
+        }
+        save_journal(journal)
+
+
+def update_offset(key: str, offset: int) -> None:
+    """Speichert den zuletzt bestätigten Byte-Offset."""
+    with _journal_lock:
+        journal = load_journal()
+        session = journal.get(key)
+        if not session:
+            return
+        session["offset"] = offset
+        session["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        save_journal(journal)
+
+
+def remove_session(key: str) -> None:
+    """Entfernt eine Sitzung (Upload abgeschlossen oder Sitzung ungültig)."""
+    with _journal_lock:
+        journal = load_journal()
+        if journal.pop(key, None) is not None:
+            save_journal(journal)
+
+
+def pending_sessions() -> List[Dict[str, Any]]:
+    """
+    Alle unterbrochenen Uploads, die sich noch fortsetzen lassen (inkl. "key").
+
+    Abgelaufene Sitzungen und Sitzungen, deren Datei fehlt, werden verworfen.
+    """
+    with _journal_lock:
+        journal = load_journal()
+        valid = {
+            key: session for key, session in journal.items()
+            if not _is_expired(session) and Path(session.get("video_path", "")).exists()
+        }
+        if len(valid) != len(journal):
+            save_journal(valid)
+        return [{**session, "key": key} for key, session in valid.items()]
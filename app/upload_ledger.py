@@ -0,0 +1,219 @@
+"""
+Upload-Ledger: Inhalts-Fingerprints aller hochgeladenen Dateien.
+
+Erkennt erneut eingereihte oder umbenannte Dateien, bevor sie ein zweites Mal
+hochgeladen werden. Gespeichert neben source_map.json in .config/upload_ledger.json.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+from app.companion import get_video_duration
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+LEDGER_FILE = REPO_ROOT / ".config/upload_ledger.json"
+
+# Bytes am Anfang und Ende der Datei für den Schnell-Fingerprint
+SAMPLE_BYTES = 1024 * 1024
+
+_ledger_lock = threading.Lock()
+
+
+@dataclass
+class FileFingerprint:
+    """Schneller Fingerprint einer Datei (ohne sie vollständig zu lesen)."""
+    size: int
+    sample_sha256: str  # SHA-256 über Größe, erstes und letztes MiB
+    duration: Optional[float] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.size}:{self.sample_sha256}"
+
+
+def quick_fingerprint(file_path: str) -> FileFingerprint:
+    """
+    Berechnet den Schnell-Fingerprint (Größe + Hash von Anfang/Ende + Dauer).
+
+    Liest höchstens 2 MiB, dauert also auch bei mehreren GB nur Millisekunden.
+
+    Args:
+        file_path: Pfad zur Datei
+
+    Returns:
+        FileFingerprint
+    """
+    size = os.path.getsize(file_path)
+    digest = hashlib.sha256(str(size).encode("ascii"))
+
+    with open(file_path, "rb") as infile:
+        digest.update(infile.read(SAMPLE_BYTES))
+        if size > 2 * SAMPLE_BYTES:
+            infile.seek(-SAMPLE_BYTES, os.SEEK_END)
+            digest.update(infile.read(SAMPLE_BYTES))
+        elif size > SAMPLE_BYTES:
+            digest.update(infile.read())
+
+    return FileFingerprint(
+        size=size,
+        sample_sha256=digest.hexdigest(),
+        duration=get_video_duration(file_path)
+    )
+
+
+class HashingReader:
+    """
+    Datei-Wrapper, der beim Lesen für den Upload den SHA-256 mitberechnet.
+
+    Die Bytes werden nur einmal von der Platte gelesen. Springt der Upload zurück
+    (Wiederholung eines Chunks), werden bereits gehashte Bytes übersprungen; Lücken
+    (z.B. bei einem fortgesetzten Upload) werden in hexdigest() nachgelesen.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._file = open(file_path, "rb")
+        self._hash = hashlib.sha256()
+        self._hashed_upto = 0
+
+    def read(self, size: int = -1) -> bytes:
+        position = self._file.tell()
+        data = self._file.read(size)
+        end = position + len(data)
+        if position <= self._hashed_upto < end:
+            self._hash.update(data[self._hashed_upto - position:])
+            self._hashed_upto = end
+        return data
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self._file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._file.tell()
+
+    def close(self):
+        self._file.close()
+
+    def hexdigest(self) -> str:
+        """SHA-256 der gesamten Datei (liest nicht übertragene Bereiche nach)."""
+        size = os.path.getsize(self.file_path)
+        if self._hashed_upto < size:
+            with open(self.file_path, "rb") as infile:
+                infile.seek(self._hashed_upto)
+                for block in iter(lambda: infile.read(SAMPLE_BYTES), b""):
+                    self._hash.update(block)
+            self._hashed_upto = size
+        return self._hash.hexdigest()
+
+
+def load_ledger() -> Dict[str, Any]:
+    if not LEDGER_FILE.exists():
+        return {}
+    try:
+        with LEDGER_FILE.open("r", encoding="utf-8") as infile:
+            return json.load(infile)
+    except Exception as e:
+        # Nicht stillschweigend leeren: der nächste Eintrag würde sonst die ganze Historie überschreiben
+        backup_path = LEDGER_FILE.with_name(
+            f"{LEDGER_FILE.name}.corrupt-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+        )
+        try:
+            LEDGER_FILE.replace(backup_path)  # Beiseitelegen, damit nur einmal gewarnt wird
+            print(f"⚠ Upload-Ledger nicht lesbar ({e}), verschoben nach: {backup_path}")
+        except OSError as backup_error:
+            print(f"⚠ Upload-Ledger nicht lesbar ({e}), Sicherung fehlgeschlagen: {backup_error}")
+        return {}
+
+
+def save_ledger(ledger: Dict[str, Any]) -> None:
+    LEDGER_FILE.parent.mkdir(parents=True, exist_ok=True)
+    # Atomar ersetzen; GUI, CLI und watch können als getrennte Prozesse schreiben
+    tmp_path = LEDGER_FILE.with_name(f"{LEDGER_FILE.name}.{os.getpid()}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as outfile:
+        json.dump(ledger, outfile, indent=2)
+    tmp_path.replace(LEDGER_FILE)
+
+
+def find_upload(fingerprint: FileFingerprint, privacy_status: Optional[str]) -> Optional[Dict[str, Any]]:
+    """
+    Sucht einen früheren Upload derselben Datei mit gleichem Privacy-Status (= Profil).
+
+    Args:
+        fingerprint: Schnell-Fingerprint der Datei
+        privacy_status: privacyStatus des Ziel-Profils
+
+    Returns:
+        Upload-Eintrag (video_id, title, file, ...) oder None
+    """
+    with _ledger_lock:
+        entry = load_ledger().get(fingerprint.key)
+
+    if not entry:
+        return None
+
+    # Dauer als zusätzliche Absicherung, falls beide bekannt sind
+    stored_duration = entry.get("duration")
+    if stored_duration and fingerprint.duration and abs(stored_duration - fingerprint.duration) > 1.0:
+        return None
+
+    for upload in reversed(entry.get("uploads", [])):
+        if upload.get("privacy_status") == privacy_status:
+            return upload
+    return None
+
+
+def record_upload(
+    fingerprint: FileFingerprint,
+    sha256: Optional[str],
+    video_id: str,
+    privacy_status: Optional[str],
+    title: str,
+    file_path: str
+) -> None:
+    """Trägt einen erfolgreichen Upload ins Ledger ein."""
+    if not video_id:
+        return
+    with _ledger_lock:
+        ledger = load_ledger()
+        entry = ledger.setdefault(fingerprint.key, {"size": fingerprint.size, "uploads": []})
+        if fingerprint.duration:
+            entry["duration"] = fingerprint.duration
+        if sha256:
+            entry["sha256"] = sha256
+        entry["uploads"].append({
+            "video_id": video_id,
+            "privacy_status": privacy_status,
+            "title": title,
+            "file": str(file_path),
+            "uploaded_at": datetime.now().isoformat(timespec="seconds")
+        })
+        save_ledger(ledger)
+
+
+def forget_videos(video_ids: Iterable[str]) -> None:
+    """Entfernt Uploads gelöschter Videos, damit die Datei erneut hochgeladen werden darf."""
+    removed = set(video_ids)
+    if not removed:
+        return
+    with _ledger_lock:
+        ledger = load_ledger()
+        changed = False
+        for key in list(ledger.keys()):
+            uploads = ledger[key].get("uploads", [])
+            kept = [upload for upload in uploads if upload.get("video_id") not in removed]
+            if len(kept) != len(uploads):
+                changed = True
+                if kept:
+                    ledger[key]["uploads"] = kept
+                else:
+                    del ledger[key]
+        if changed:
+            save_ledger(ledger)
@@ -0,0 +1,209 @@
+"""
+Upload-Scheduler für parallele Batch-Uploads.
+Verteilt (Video, Profil)-Paare fair auf einen Worker-Pool mit konfigurierbarer Größe.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Hashable, List, Optional
+
+from app.config import UPLOAD_CONCURRENCY
+
+
+# Job-Zustände
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+@dataclass
+class UploadJob:
+    """Ein (Video, Profil)-Paar mit eigenem Zustand."""
+    group: Hashable  # Schlüssel für faire Verteilung (z.B. Video-Pfad)
+    profile_name: str
+    payload: Any = None  # Beliebige Zusatzdaten (z.B. VideoItem)
+    state: str = JOB_PENDING
+    result: Any = None
+    error: str = ""
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @property
+    def is_finished(self) -> bool:
+        return self.state in (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Laufzeit in Sekunden (None solange nicht fertig)."""
+        if self.started_at is None or self.finished_at is None:
+            return None
+        return self.finished_at - self.started_at
+
+
+def fair_order(jobs: List[UploadJob]) -> List[UploadJob]:
+    """
+    Sortiert Jobs reihum über die Gruppen (Round-Robin).
+
+    Aus [A1, A2, A3, B1, B2] wird [A1, B1, A2, B2, A3]: Jedes Video bekommt
+    zuerst ein Profil hochgeladen, bevor ein Video ein zweites bekommt.
+
+    Args:
+        jobs: Jobs in Eingabereihenfolge
+
+    Returns:
+        Neue Liste in fairer Reihenfolge
+    """
+    groups: "OrderedDict[Hashable, Deque[UploadJob]]" = OrderedDict()
+    for job in jobs:
+        groups.setdefault(job.group, deque()).append(job)
+
+    ordered: List[UploadJob] = []
+    while groups:
+        for key in list(groups.keys()):
+            queue = groups[key]
+            ordered.append(queue.popleft())
+            if not queue:
+                del groups[key]
+
+    return ordered
+
+
+class UploadScheduler:
+    """
+    Führt Upload-Jobs mit N parallelen Workern aus.
+
+    Die Jobs werden fair über die Videos verteilt. Ein Worker bevorzugt Jobs,
+    deren Video gerade nicht von einem anderen Worker hochgeladen wird, damit
+    die Bandbreite auf verschiedene Dateien verteilt wird.
+    """
+
+    def __init__(
+        self,
+        jobs: List[UploadJob],
+        run_job: Callable[[UploadJob], Any],
+        max_workers: int = UPLOAD_CONCURRENCY,
+        on_job_start: Optional[Callable[[UploadJob], None]] = None,
+        on_job_finished: Optional[Callable[[UploadJob], None]] = None
+    ):
+        """
+        Args:
+            jobs: Liste der Upload-Jobs
+            run_job: Führt einen Job aus, gibt Ergebnis zurück oder wirft Exception
+            max_workers: Anzahl paralleler Uploads (mind. 1)
+            on_job_start: Optionaler Callback beim Start eines Jobs (Worker-Thread)
+            on_job_finished: Optionaler Callback nach Ende eines Jobs (Worker-Thread)
+        """
+        self.jobs = fair_order(jobs)
+        self.run_job = run_job
+        self.max_workers = max(1, int(max_workers or 1))
+        self.on_job_start = on_job_start
+        self.on_job_finished = on_job_finished
+
+        self._pending: Deque[UploadJob] = deque(self.jobs)
+        self._running_groups: Dict[Hashable, int] = {}
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    def run(self) -> List[UploadJob]:
+        """
+        Startet die Worker und blockiert, bis alle Jobs beendet sind.
+
+        Returns:
+            Alle Jobs (in fairer Reihenfolge) mit finalem Zustand
+        """
+        worker_count = min(self.max_workers, len(self.jobs))
+        workers = [
+            threading.Thread(target=self._worker, name=f"upload-worker-{i}", daemon=True)
+            for i in range(worker_count)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        return self.jobs
+
+    def cancel(self):
+        """Bricht alle noch nicht gestarteten Jobs ab (laufende Uploads laufen zu Ende)."""
+        with self._lock:
+            self._cancelled = True
+            while self._pending:
+                job = self._pending.popleft()
+                job.state = JOB_CANCELLED
+                job.finished_at = time.time()
+
+    def counts(self) -> Dict[str, int]:
+        """Anzahl Jobs pro Zustand."""
+        with self._lock:
+            result = {
+                JOB_PENDING: 0,
+                JOB_RUNNING: 0,
+                JOB_DONE: 0,
+                JOB_FAILED: 0,
+                JOB_CANCELLED: 0
+            }
+            for job in self.jobs:
+                result[job.state] += 1
+            return result
+
+    def _next_job(self) -> Optional[UploadJob]:
+        """Holt nächsten Job; bevorzugt Videos, die gerade nicht hochgeladen werden."""
+        with self._lock:
+            if self._cancelled or not self._pending:
+                return None
+
+            chosen = None
+            for job in self._pending:
+                if not self._running_groups.get(job.group):
+                    chosen = job
+                    break
+            if chosen is None:
+                chosen = self._pending[0]
+
+            self._pending.remove(chosen)
+            self._running_groups[chosen.group] = self._running_groups.get(chosen.group, 0) + 1
+            chosen.state = JOB_RUNNING
+            chosen.started_at = time.time()
+            return chosen
+
+    def _release(self, job: UploadJob):
+        with self._lock:
+            remaining = self._running_groups.get(job.group, 1) - 1
+            if remaining > 0:
+                self._running_groups[job.group] = remaining
+            else:
+                self._running_groups.pop(job.group, None)
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+
+            if self.on_job_start:
+                try:
+                    self.on_job_start(job)
+                except Exception as e:
+                    print(f"⚠ Fehler im Start-Callback: {e}")
+
+            try:
+                job.result = self.run_job(job)
+                job.state = JOB_DONE
+            except Exception as e:
+                job.error = str(e)
+                job.state = JOB_FAILED
+            finally:
+                job.finished_at = time.time()
+                self._release(job)
+
+            if self.on_job_finished:
+                try:
+                    self.on_job_finished(job)
+                except Exception as e:
+                    print(f"⚠ Fehler im Ende-Callback: {e}")
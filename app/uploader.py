@@ -4,8 +4,10 @@ Implementiert Video-, Untertitel- und Thumbnail-Upload zu YouTube.
 """
 
 import os
+import mimetypes
 import subprocess
 import tempfile
+import time
 from typing import Dict, Any, Tuple, Optional, Callable, List
 from pathlib import Path
 
@@ -15,6 +17,15 @@ from googleapiclient.errors import HttpError
 from app.auth import create_youtube_client, AuthError
 from app.config import CLIENT_SECRETS_PATH, TOKEN_PATH
 from app.source_map import update_source_folder
+from app.channel_inventory import get_channel_inventory
+from app.upload_ledger import HashingReader, quick_fingerprint, find_upload, record_upload, forget_videos
+from app.upload_journal import session_key, get_session, start_session, update_offset, remove_session
+from app.chunking import AdaptiveChunkSizer, AdaptiveMediaUpload
+from app.retry import RetryEvent, call_with_retry, execute_with_retry
+from app.bandwidth import get_bandwidth_manager
+
+# Mindestabstand zwischen zwei Offset-Einträgen im Upload-Journal (Sekunden)
+JOURNAL_SAVE_INTERVAL = 10.0
 
 
 def extract_srt_from_video(video_path: str) -> Optional[str]:
@@ -243,17 +254,40 @@ def upload(
     )
 
     # ===========================
-    # 3. Video hochladen
+    # 3. Inhalts-Duplikat prüfen (Upload-Ledger)
+    # ===========================
+    privacy_status = body['status'].get('privacyStatus')
+    try:
+        fingerprint = quick_fingerprint(video_path)
+    except OSError:
+        fingerprint = None  # Fehlende Datei wird beim Upload gemeldet
+
+    if fingerprint and profile_data.get('prevent_duplicates', True):
+        previous = find_upload(fingerprint, privacy_status)
+        if previous and _uploaded_video_exists(previous['video_id']):
+            raise UploadError(
+                f"Diese Datei wurde bereits hochgeladen (ID: {previous['video_id']}, "
+                f"Titel: {previous.get('title', '')}).\n"
+                f"Bitte erst im Asset-Manager löschen, dann neu hochladen."
+            )
+
+    # ===========================
+    # 4. Video hochladen
     # ===========================
+    reader = None
     try:
         emit("upload_start", filename=Path(video_path).name)
         print(f"📤 Lade Video hoch: {Path(video_path).name}")
 
-        # Media-Upload vorbereiten
-        media = MediaFileUpload(
-            video_path,
-            chunksize=1024*1024,  # 1 MB chunks
-            resumable=True
+        # Media-Upload vorbereiten; der Reader hasht die Bytes beim Senden mit
+        # Chunk-Größe passt sich dem gemessenen Durchsatz an (siehe app/chunking.py),
+        # die Sendegeschwindigkeit begrenzt der BandwidthManager
+        reader = HashingReader(video_path)
+        sizer = AdaptiveChunkSizer.for_profile(profile_data)
+        media = AdaptiveMediaUpload(
+            get_bandwidth_manager().wrap(reader),
+            mimetype=mimetypes.guess_type(video_path)[0] or 'application/octet-stream',
+            sizer=sizer
         )
 
         # Upload-Request erstellen
@@ -263,24 +297,97 @@ def upload(
             media_body=media
         )
 
+        # Unterbrochene Sitzung derselben Datei für dieses Profil fortsetzen
+        journal_key = session_key(fingerprint.key, privacy_status) if fingerprint else None
+        session = get_session(journal_key) if journal_key else None
+        if session and not _resume_request(request, session['resumable_uri']):
+            print("⚠ Fortsetzen wird von dieser googleapiclient-Version nicht unterstützt, starte Upload neu")
+            remove_session(journal_key)
+            session = None
+        if session:
+            emit("upload_resume", offset=session.get('offset', 0), total=media.size())
+            print(f"🔄 Setze unterbrochenen Upload fort (ca. {session.get('offset', 0) // (1024 * 1024)} MB bereits übertragen)")
+
+        # Vorübergehende Fehler (5xx, Rate-Limits, Verbindungsabbrüche) werden wiederholt;
+        # der nächste next_chunk() fragt dann den bestätigten Offset ab
+        retry_count = 0
+
+        def on_retry(event: RetryEvent):
+            nonlocal retry_count
+            retry_count += 1
+            sizer.record_failure()
+            emit(
+                "retry",
+                attempt=event.attempt,
+                max_attempts=event.max_attempts,
+                delay=event.delay,
+                reason=event.reason,
+                total_retries=retry_count
+            )
+
         # Upload durchführen
         response = None
         last_progress = 0
+        resume_checked = session is None
+        journal_started = session is not None
+        last_journal_save = time.monotonic()
 
         while response is None:
-            status, response = request.next_chunk()
+            chunk_start = time.monotonic()
+            progress_before = request.resumable_progress
+            try:
+                status, response = call_with_retry(request.next_chunk, on_retry=on_retry)
+            except HttpError as e:
+                if not resume_checked and e.resp.status in (400, 404, 410):
+                    # Sitzung abgelaufen oder unbekannt → neuer Upload
+                    print("⚠ Upload-Sitzung nicht mehr gültig, starte Upload neu")
+                    remove_session(journal_key)
+                    resume_checked = True
+                    journal_started = False
+                    request = youtube.videos().insert(
+                        part='snippet,status',
+                        body=body,
+                        media_body=media
+                    )
+                    continue
+                raise
+
+            # Beim Fortsetzen springt der Offset ohne Übertragung → nicht messen
+            if resume_checked:
+                sizer.record_success(request.resumable_progress - progress_before, time.monotonic() - chunk_start)
+            resume_checked = True
+
+            if journal_key and not journal_started and request.resumable_uri:
+                journal_started = _start_journal_session(
+                    journal_key,
+                    request.resumable_uri,
+                    media.size(),
+                    video_path,
+                    srt_path,
+                    factsheet_data,
+                    profile_data
+                )
+
             if status:
                 progress = status.progress()
                 if progress_callback:
                     progress_callback(progress)
 
+                now = time.monotonic()
+                if journal_started and now - last_journal_save >= JOURNAL_SAVE_INTERVAL:
+                    update_offset(journal_key, status.resumable_progress)
+                    last_journal_save = now
+
                 # Zeige Fortschritt nur alle 10%
                 if int(progress * 10) > int(last_progress * 10):
                     print(f"   Fortschritt: {int(progress * 100)}%")
                     last_progress = progress
 
+        if journal_key:
+            remove_session(journal_key)
+
         video_id = response['id']
-        emit("upload_success", video_id=video_id)
+        emit("upload_success", video_id=video_id, retries=retry_count)
         print(f"✓ Video hochgeladen! ID: {video_id}")
 
     except HttpError as e:
@@ -290,9 +397,12 @@ def upload(
         raise UploadError(f"Video-Datei nicht gefunden: {video_path}")
     except Exception as e:
         raise UploadError(f"Unerwarteter Fehler beim Video-Upload: {str(e)}")
+    finally:
+        if reader is not None:
+            reader.close()
 
     # ===========================
-    # 4. Untertitel hochladen (falls Profil requires_srt=true)
+    # 5. Untertitel hochladen (falls Profil requires_srt=true)
     # ===========================
     # Hardsubs-Profile (requires_srt=false) brauchen keine separate SRT-Datei
     requires_srt = profile_data.get('requires_srt', True)
@@ -315,11 +425,11 @@ def upload(
 
             media = MediaFileUpload(srt_path, mimetype='application/x-subrip')
 
-            youtube.captions().insert(
+            execute_with_retry(youtube.captions().insert(
                 part='snippet',
                 body=caption_body,
                 media_body=media
-            ).execute()
+            ), on_retry=on_retry)
 
             emit("captions_success", language=language)
             print(f"✓ Untertitel hochgeladen (Sprache: {language})")
@@ -332,7 +442,7 @@ def upload(
             print(f"⚠ Warnung: Unerwarteter Fehler bei Untertiteln: {e}")
 
     # ===========================
-    # 5. Thumbnail hochladen (falls vorhanden)
+    # 6. Thumbnail hochladen (falls vorhanden)
     # ===========================
     thumbnail_config = factsheet_data.get('thumbnail')
     thumbnail_path = None
@@ -371,10 +481,10 @@ def upload(
 
                 media = MediaFileUpload(str(upload_thumb_path), mimetype='image/jpeg')
 
-                youtube.thumbnails().set(
+                execute_with_retry(youtube.thumbnails().set(
                     videoId=video_id,
                     media_body=media
-                ).execute()
+                ), on_retry=on_retry)
 
                 emit("thumbnail_success")
                 print("✓ Thumbnail hochgeladen")
@@ -402,10 +512,81 @@ def upload(
         update_source_folder(video_id, str(Path(video_path).parent))
     except Exception:
         pass
+    try:
+        get_channel_inventory().add_uploaded(response)
+    except Exception:
+        pass
+    if fingerprint:
+        try:
+            record_upload(
+                fingerprint,
+                reader.hexdigest(),
+                video_id,
+                privacy_status,
+                resolved_title,
+                video_path
+            )
+        except Exception as e:
+            print(f"⚠ Upload-Ledger konnte nicht aktualisiert werden: {e}")
 
     return result
 
 
+def _resume_request(request, resumable_uri: str) -> bool:
+    """
+    Hängt einen Upload-Request an eine bestehende Resumable-Sitzung an.
+
+    Nutzt das private HttpRequest._in_error_state von googleapiclient (geprüft mit
+    google-api-python-client 2.201.0): der erste next_chunk() fragt dann den vom
+    Server bestätigten Offset ab, statt von vorn zu beginnen.
+
+    Returns:
+        False, wenn die Bibliothek das Attribut nicht (mehr) hat → neuer Upload
+    """
+    if not hasattr(request, "_in_error_state"):
+        return False
+    request.resumable_uri = resumable_uri
+    request._in_error_state = True
+    return True
+
+
+def _start_journal_session(
+    key: str,
+    resumable_uri: str,
+    size: int,
+    video_path: str,
+    srt_path: Optional[str],
+    factsheet_data: Dict[str, Any],
+    profile_data: Dict[str, Any]
+) -> bool:
+    """Legt den Journal-Eintrag für eine neue Resumable-Sitzung an (Fehler sind nicht fatal)."""
+    try:
+        start_session(key, resumable_uri, size, {
+            "video_path": str(video_path),
+            "srt_path": str(srt_path) if srt_path else None,
+            "factsheet_data": factsheet_data,
+            "profile_data": profile_data
+        })
+        return True
+    except Exception as e:
+        print(f"⚠ Upload-Journal konnte nicht geschrieben werden: {e}")
+        return False
+
+
+def _uploaded_video_exists(video_id: str) -> bool:
+    """
+    Prüft anhand des Kanal-Inventars, ob ein früher hochgeladenes Video noch existiert.
+
+    Ohne Inventar wird angenommen, dass es existiert. Veraltete Ledger-Einträge
+    (Video inzwischen gelöscht) werden entfernt.
+    """
+    inventory = get_channel_inventory()
+    if not inventory.has_cache() or inventory.get_video(video_id):
+        return True
+    forget_videos([video_id])
+    return False
+
+
 def validate_upload_prerequisites() -> Tuple[bool, str]:
     """
     Prüft, ob alle Voraussetzungen für Upload erfüllt sind.
@@ -0,0 +1,206 @@
+"""
+Virtualisierte Liste für Tk: Widgets nur für sichtbare Zeilen (plus Puffer).
+
+Für Listen mit 1.000+ Einträgen (Batch-Tabelle, Asset-Manager). Zeilen werden
+über create_row(parent, index) erzeugt und als Canvas-Fenster platziert.
+Gemessene Zeilenhöhen werden gemerkt; noch nie angezeigte Zeilen zählen mit
+der geschätzten Höhe. Zeilen außerhalb des Sichtbereichs werden zerstört,
+außer sie sind angeheftet (pin(), z.B. aufgeklappte Details mit Eingaben).
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import tkinter as tk
+from typing import Callable, Dict, List, Optional, Set
+
+import ttkbootstrap as ttk
+from ttkbootstrap.constants import *
+
+
+class VirtualList(tk.Frame):
+    """Scrollbare Liste, die nur Widgets für den sichtbaren Bereich erzeugt."""
+
+    def __init__(
+        self,
+        master,
+        create_row: Callable[[tk.Widget, int], tk.Widget],
+        estimated_row_height: int = 100,
+        buffer_rows: int = 4,
+        on_scroll: Optional[Callable[[], None]] = None,
+        bg: Optional[str] = None,
+        **kwargs
+    ):
+        """
+        Args:
+            master: Eltern-Widget
+            create_row: Erzeugt das Widget für Zeile index (Parent ist der Canvas)
+            estimated_row_height: Höhe noch nie gemessener Zeilen (Pixel)
+            buffer_rows: Zusätzliche Zeilen ober-/unterhalb des Sichtbereichs
+            on_scroll: Optionaler Callback nach Scrollen/Neuaufbau
+            bg: Hintergrundfarbe des Canvas
+        """
+        super().__init__(master, **kwargs)
+        self.create_row = create_row
+        self.estimated_row_height = estimated_row_height
+        self.buffer_rows = buffer_rows
+        self.on_scroll = on_scroll
+
+        self.canvas = tk.Canvas(self, highlightthickness=0)
+        if bg:
+            self.canvas.configure(bg=bg)
+        self.scrollbar = ttk.Scrollbar(self, orient=VERTICAL, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_yscroll)
+        self.canvas.pack(side=LEFT, fill=BOTH, expand=YES)
+        self.scrollbar.pack(side=RIGHT, fill=Y)
+
+        self._count = 0
+        self._heights: List[Optional[int]] = []
+        self._offsets: List[int] = [0]
+        self._rows: Dict[int, tk.Widget] = {}
+        self._windows: Dict[int, int] = {}
+        self._pinned: Set[int] = set()
+        self._render_pending = False
+        self._measure_pending = False
+
+        self.canvas.bind("<Configure>", self._on_canvas_configure)
+
+    # ------------------------------------------------------------------
+    # Öffentliche API
+    # ------------------------------------------------------------------
+
+    def set_count(self, count: int):
+        """Setzt die Anzahl der Einträge und baut sichtbare Zeilen neu auf."""
+        self.clear_rows()
+        self._count = max(0, count)
+        self._heights = [None] * self._count
+        self._pinned = set()
+        self._recompute_offsets()
+        self._render()
+
+    def refresh(self):
+        """Baut die sichtbaren Zeilen neu auf (Inhalte geändert, Anzahl gleich)."""
+        self.clear_rows()
+        self._render()
+
+    def clear_rows(self):
+        """Zerstört alle erzeugten Zeilen-Widgets."""
+        for index in list(self._rows):
+            self._release(index)
+
+    def row_widget(self, index: int) -> Optional[tk.Widget]:
+        """Widget der Zeile, falls gerade erzeugt."""
+        return self._rows.get(index)
+
+    def live_rows(self) -> Dict[int, tk.Widget]:
+        """Alle erzeugten Zeilen (Index -> Widget)."""
+        return dict(self._rows)
+
+    def pin(self, index: int, pinned: bool = True):
+        """Angeheftete Zeilen bleiben auch außerhalb des Sichtbereichs erhalten."""
+        if pinned:
+            self._pinned.add(index)
+        else:
+            self._pinned.discard(index)
+            self._schedule_render()
+
+    def visible_range(self) -> range:
+        """Indizes der (mindestens teilweise) sichtbaren Zeilen."""
+        if not self._count:
+            return range(0)
+        top = self.canvas.canvasy(0)
+        height = max(1, self.canvas.winfo_height())
+        first = max(0, bisect.bisect_right(self._offsets, top) - 1)
+        last = min(self._count, bisect.bisect_left(self._offsets, top + height))
+        return range(first, max(first + 1, last))
+
+    # ------------------------------------------------------------------
+    # Intern
+    # ------------------------------------------------------------------
+
+    def _row_height(self, index: int) -> int:
+        height = self._heights[index]
+        return self.estimated_row_height if height is None else height
+
+    def _recompute_offsets(self):
+        self._offsets = [0] + list(itertools.accumulate(
+            self._row_height(i) for i in range(self._count)
+        ))
+        self.canvas.configure(scrollregion=(0, 0, self.canvas.winfo_width(), self._offsets[-1]))
+
+    def _on_yscroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _on_canvas_configure(self, event):
+        for window in self._windows.values():
+            self.canvas.itemconfigure(window, width=event.width)
+        self.canvas.configure(scrollregion=(0, 0, event.width, self._offsets[-1]))
+        self._schedule_render()
+
+    def _schedule_render(self):
+        if not self._render_pending:
+            self._render_pending = True
+            self.after_idle(self._render)
+
+    def _render(self):
+        self._render_pending = False
+        visible = self.visible_range()
+        wanted = set(range(
+            max(0, visible.start - self.buffer_rows),
+            min(self._count, visible.stop + self.buffer_rows)
+        ))
+
+        for index in list(self._rows):
+            if index not in wanted and index not in self._pinned:
+                self._release(index)
+
+        width = self.canvas.winfo_width()
+        created = False
+        for index in sorted(wanted - set(self._rows)):
+            row = self.create_row(self.canvas, index)
+            self._rows[index] = row
+            self._windows[index] = self.canvas.create_window(
+                0, self._offsets[index], window=row, anchor="nw", width=width
+            )
+            # Höhenänderungen (z.B. aufgeklappte Details) neu vermessen
+            row.bind("<Configure>", lambda _e: self._schedule_measure(), add="+")
+            created = True
+
+        if created:
+            self._schedule_measure()
+        if self.on_scroll:
+            self.on_scroll()
+
+    def _release(self, index: int):
+        window = self._windows.pop(index, None)
+        if window is not None:
+            self.canvas.delete(window)
+        row = self._rows.pop(index, None)
+        if row is not None:
+            row.destroy()
+
+    def _schedule_measure(self):
+        if not self._measure_pending:
+            self._measure_pending = True
+            self.after_idle(self._measure)
+
+    def _measure(self):
+        """Übernimmt die tatsächlichen Höhen erzeugter Zeilen und verschiebt die Fenster."""
+        self._measure_pending = False
+        changed = False
+        for index, row in self._rows.items():
+            height = row.winfo_reqheight()
+            if height > 1 and self._heights[index] != height:
+                self._heights[index] = height
+                changed = True
+
+        if not changed:
+            return
+
+        self._recompute_offsets()
+        for index, window in self._windows.items():
+            self.canvas.coords(window, 0, self._offsets[index])
+        # Geänderte Höhen können weitere Zeilen sichtbar machen
+        self._schedule_render()
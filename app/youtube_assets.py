@@ -4,72 +4,84 @@ Hilfsfunktionen zum Abruf vorhandener YouTube-Uploads.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any, Optional, Tuple
 
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
 from pathlib import Path
 
 from app.auth import create_youtube_client, AuthError
+from app.channel_inventory import DuplicateIndex, get_channel_inventory
 from app.config import CLIENT_SECRETS_PATH, TOKEN_PATH
 from app.uploader import UploadError
+from app.upload_ledger import forget_videos
+from app.chunking import AdaptiveChunkSizer, AdaptiveMediaUpload
+from app.bandwidth import get_bandwidth_manager
+from app.retry import DEFAULT_POLICY, call_with_retry, classify_error, execute_with_retry
 
 
-def fetch_uploaded_videos(max_results: int = 25) -> List[Dict[str, Any]]:
-    """
-    Ruft die zuletzt hochgeladenen Videos des authentifizierten Kanals ab.
+# Maximale Anzahl Einzel-Requests pro Batch-HTTP-Request (Google-Empfehlung: 50)
+BATCH_MAX_REQUESTS = 50
 
-    Args:
-        max_results: Anzahl der zurückzugebenden Videos (max. 50 pro API-Call)
 
-    Returns:
-        Liste von Dicts mit Snippet-, Status- und Statistikdaten
-    """
+@dataclass
+class BatchItemResult:
+    """Ergebnis eines Einzel-Requests innerhalb eines Batch-HTTP-Requests."""
+    video_id: str
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _youtube_client():
+    """Holt den gecachten YouTube-Client (Auth-Fehler werden zu UploadError)."""
     try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
+        return create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
     except AuthError as e:
         raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
 
-    try:
-        channels_response = youtube.channels().list(
-            part="contentDetails",
-            mine=True
-        ).execute()
 
-        items = channels_response.get("items", [])
-        if not items:
-            return []
+def fetch_uploaded_videos(
+    max_results: Optional[int] = None,
+    refresh_existing: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Ruft die hochgeladenen Videos des authentifizierten Kanals ab.
 
-        uploads_playlist = items[0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    Synchronisiert das lokale Kanal-Inventar (alle Seiten der Uploads-Playlist);
+    bereits bekannte, unveränderte Videos werden nicht erneut übertragen.
 
-        playlist_items = youtube.playlistItems().list(
-            part="contentDetails",
-            playlistId=uploads_playlist,
-            maxResults=min(max_results, 50)
-        ).execute()
+    Args:
+        max_results: Anzahl der zurückzugebenden Videos (None = alle)
+        refresh_existing: False = nur neue und lokal geänderte Videos nachladen
 
-        video_ids = [
-            entry["contentDetails"]["videoId"]
-            for entry in playlist_items.get("items", [])
-        ]
+    Returns:
+        Liste von Dicts mit Snippet-, Status- und Statistikdaten (neueste zuerst)
+    """
+    youtube = _youtube_client()
+    inventory = get_channel_inventory()
 
-        if not video_ids:
-            return []
+    try:
+        inventory.sync(youtube, refresh_existing=refresh_existing)
+    except HttpError as e:
+        raise UploadError(f"YouTube API-Fehler beim Laden der Videos:\n{e}")
 
-        videos_response = youtube.videos().list(
-            part="snippet,statistics,status,contentDetails",
-            id=",".join(video_ids)
-        ).execute()
+    return inventory.cached_videos(max_results)
 
-        videos = videos_response.get("items", [])
-        # Re-sort to match playlist order
-        id_order = {vid_id: idx for idx, vid_id in enumerate(video_ids)}
-        videos.sort(key=lambda v: id_order.get(v["id"], 0))
 
-        return videos
+def cached_uploaded_videos(max_results: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Liefert die Videos aus dem lokalen Kanal-Inventar ohne API-Aufruf.
 
-    except HttpError as e:
-        raise UploadError(f"YouTube API-Fehler beim Laden der Videos:\n{e}")
+    Returns:
+        Gecachte Videos (leer, falls noch nie synchronisiert wurde)
+    """
+    return get_channel_inventory().cached_videos(max_results)
 
 
 def update_video_metadata(
@@ -83,11 +95,30 @@ def update_video_metadata(
     """
     Aktualisiert Metadaten eines bestehenden YouTube-Videos.
     """
+    youtube = _youtube_client()
+
+    body = _build_metadata_body(video_id, title, description, privacy_status, tags, publish_at)
+
     try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
-    except AuthError as e:
-        raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
+        response = execute_with_retry(youtube.videos().update(
+            part="snippet,status",
+            body=body
+        ))
+        get_channel_inventory().invalidate([video_id])
+        return response
+    except HttpError as e:
+        raise UploadError(f"YouTube API-Fehler beim Aktualisieren:\n{e}")
 
+
+def _build_metadata_body(
+    video_id: str,
+    title: str,
+    description: str,
+    privacy_status: str,
+    tags: List[str],
+    publish_at: Optional[str] = None
+) -> Dict[str, Any]:
+    """Erstellt den Request-Body für videos().update(part="snippet,status")."""
     body: Dict[str, Any] = {
         "id": video_id,
         "snippet": {
@@ -106,14 +137,7 @@ def update_video_metadata(
     if publish_at:
         body["status"]["publishAt"] = publish_at
 
-    try:
-        response = youtube.videos().update(
-            part="snippet,status",
-            body=body
-        ).execute()
-        return response
-    except HttpError as e:
-        raise UploadError(f"YouTube API-Fehler beim Aktualisieren:\n{e}")
+    return body
 
 
 def update_video_status_flags(
@@ -132,12 +156,24 @@ def update_video_status_flags(
     Returns:
         API-Response mit aktualisierten Video-Informationen
     """
+    youtube = _youtube_client()
+
+    body = _build_status_flags_body(video_id, made_for_kids, embeddable)
+
     try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
-    except AuthError as e:
-        raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
+        response = execute_with_retry(youtube.videos().update(
+            part="status",
+            body=body
+        ))
+        get_channel_inventory().invalidate([video_id])
+        return response
+    except HttpError as e:
+        raise UploadError(f"YouTube API-Fehler beim Aktualisieren:\n{e}")
 
-    body: Dict[str, Any] = {
+
+def _build_status_flags_body(video_id: str, made_for_kids: bool, embeddable: bool) -> Dict[str, Any]:
+    """Erstellt den Request-Body für videos().update(part="status")."""
+    return {
         "id": video_id,
         "status": {
             "selfDeclaredMadeForKids": made_for_kids,
@@ -145,32 +181,178 @@ def update_video_status_flags(
         }
     }
 
-    try:
-        response = youtube.videos().update(
-            part="status",
-            body=body
-        ).execute()
-        return response
-    except HttpError as e:
-        raise UploadError(f"YouTube API-Fehler beim Aktualisieren:\n{e}")
+
+def _execute_batch(youtube, requests: List[Tuple[str, Any]]) -> List[BatchItemResult]:
+    """
+    Führt viele API-Requests über den Batch-Endpunkt aus.
+
+    Pro BATCH_MAX_REQUESTS Einzel-Requests wird genau ein HTTP-Roundtrip benötigt.
+    Einzel-Requests mit vorübergehenden Fehlern (z.B. rateLimitExceeded) werden
+    gemäß Retry-Policy in einem weiteren Batch wiederholt.
+
+    Args:
+        youtube: YouTube API Resource
+        requests: Liste von (video_id, HttpRequest)
+
+    Returns:
+        BatchItemResult pro Eingabe-Request (gleiche Reihenfolge)
+    """
+    results: Dict[str, BatchItemResult] = {}
+
+    for start in range(0, len(requests), BATCH_MAX_REQUESTS):
+        pending = [str(idx) for idx in range(start, min(start + BATCH_MAX_REQUESTS, len(requests)))]
+        attempt = 0
+
+        while pending:
+            retry_ids: List[str] = []
+            retry_after: Optional[float] = None
+
+            def callback(request_id, response, exception):
+                nonlocal retry_after
+                video_id = requests[int(request_id)][0]
+                if exception is None:
+                    results[request_id] = BatchItemResult(video_id=video_id, response=response or {})
+                    return
+                results[request_id] = BatchItemResult(video_id=video_id, error=str(exception))
+                retryable, item_retry_after, _reason = classify_error(exception)
+                if retryable:
+                    retry_ids.append(request_id)
+                    if item_retry_after is not None:
+                        retry_after = max(retry_after or 0.0, item_retry_after)
+
+            batch = youtube.new_batch_http_request(callback=callback)
+            for request_id in pending:
+                batch.add(requests[int(request_id)][1], request_id=request_id)
+
+            try:
+                call_with_retry(batch.execute)
+            except HttpError as e:
+                # Gesamter Batch fehlgeschlagen → alle offenen Einträge als Fehler markieren
+                for request_id in pending:
+                    if request_id not in results or not results[request_id].ok:
+                        results[request_id] = BatchItemResult(
+                            video_id=requests[int(request_id)][0],
+                            error=f"Batch-Fehler: {e}"
+                        )
+                break
+
+            attempt += 1
+            if not retry_ids or attempt >= DEFAULT_POLICY.max_attempts:
+                break
+            delay = DEFAULT_POLICY.delay_for(attempt, retry_after)
+            print(f"⚠ {len(retry_ids)} Batch-Einträge – Wiederholung {attempt} in {delay:.1f}s")
+            time.sleep(delay)
+            pending = retry_ids
+
+    return [
+        results.get(str(idx)) or BatchItemResult(video_id=video_id, error="Keine Antwort im Batch")
+        for idx, (video_id, _request) in enumerate(requests)
+    ]
+
+
+def update_videos_metadata_batch(updates: List[Dict[str, Any]]) -> List[BatchItemResult]:
+    """
+    Aktualisiert Metadaten mehrerer Videos mit einem Batch-Request.
+
+    Args:
+        updates: Liste von Dicts mit den Argumenten von update_video_metadata()
+                 (video_id, title, description, privacy_status, tags, publish_at)
+
+    Returns:
+        BatchItemResult pro Video
+    """
+    if not updates:
+        return []
+
+    youtube = _youtube_client()
+    requests = [
+        (
+            update["video_id"],
+            youtube.videos().update(
+                part="snippet,status",
+                body=_build_metadata_body(
+                    update["video_id"],
+                    update.get("title", ""),
+                    update.get("description", ""),
+                    update.get("privacy_status", "unlisted"),
+                    update.get("tags") or [],
+                    update.get("publish_at")
+                )
+            )
+        )
+        for update in updates
+    ]
+    results = _execute_batch(youtube, requests)
+    get_channel_inventory().invalidate(r.video_id for r in results if r.ok)
+    return results
+
+
+def update_videos_status_flags_batch(
+    video_ids: List[str],
+    made_for_kids: bool,
+    embeddable: bool
+) -> List[BatchItemResult]:
+    """
+    Setzt ForKids und Embeddable Flags für mehrere Videos mit einem Batch-Request.
+
+    Returns:
+        BatchItemResult pro Video
+    """
+    if not video_ids:
+        return []
+
+    youtube = _youtube_client()
+    requests = [
+        (
+            video_id,
+            youtube.videos().update(
+                part="status",
+                body=_build_status_flags_body(video_id, made_for_kids, embeddable)
+            )
+        )
+        for video_id in video_ids
+    ]
+    results = _execute_batch(youtube, requests)
+    get_channel_inventory().invalidate(r.video_id for r in results if r.ok)
+    return results
+
+
+def delete_videos_batch(video_ids: List[str]) -> List[BatchItemResult]:
+    """
+    Löscht mehrere Videos permanent mit einem Batch-Request.
+
+    Returns:
+        BatchItemResult pro Video
+    """
+    if not video_ids:
+        return []
+
+    youtube = _youtube_client()
+    requests = [
+        (video_id, youtube.videos().delete(id=video_id))
+        for video_id in video_ids
+    ]
+    results = _execute_batch(youtube, requests)
+    deleted = [r.video_id for r in results if r.ok]
+    get_channel_inventory().remove(deleted)
+    forget_videos(deleted)
+    return results
 
 
 def upload_video_thumbnail(video_id: str, thumbnail_path: str) -> Dict[str, Any]:
     """
     Lädt ein benutzerdefiniertes Thumbnail für ein bestehendes Video hoch.
     """
-    try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
-    except AuthError as e:
-        raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
+    youtube = _youtube_client()
 
     media = MediaFileUpload(thumbnail_path, mimetype="image/jpeg")
 
     try:
-        response = youtube.thumbnails().set(
+        response = execute_with_retry(youtube.thumbnails().set(
             videoId=video_id,
             media_body=media
-        ).execute()
+        ))
+        get_channel_inventory().invalidate([video_id])
         return response
     except HttpError as e:
         raise UploadError(f"YouTube API-Fehler beim Thumbnail-Upload:\n{e}")
@@ -189,17 +371,15 @@ def replace_video_file(video_id: str, video_path: str, progress_callback=None) -
     Returns:
         API-Response mit aktualisierten Video-Informationen
     """
-    try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
-    except AuthError as e:
-        raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
+    youtube = _youtube_client()
 
-    # Erstelle MediaFileUpload mit resumable upload
-    media = MediaFileUpload(
-        video_path,
+    # Resumable upload mit adaptiver Chunk-Größe
+    sizer = AdaptiveChunkSizer()
+    video_file = open(video_path, "rb")
+    media = AdaptiveMediaUpload(
+        get_bandwidth_manager().wrap(video_file),
         mimetype="video/*",
-        resumable=True,
-        chunksize=1024 * 1024  # 1MB chunks
+        sizer=sizer
     )
 
     try:
@@ -212,14 +392,23 @@ def replace_video_file(video_id: str, video_path: str, progress_callback=None) -
 
         response = None
         while response is None:
-            status, response = request.next_chunk()
+            chunk_start = time.monotonic()
+            progress_before = request.resumable_progress
+            status, response = call_with_retry(
+                request.next_chunk,
+                on_retry=lambda event: sizer.record_failure()
+            )
+            sizer.record_success(request.resumable_progress - progress_before, time.monotonic() - chunk_start)
             if status and progress_callback:
                 progress_callback(status.resumable_progress, status.total_size)
 
+        get_channel_inventory().invalidate([video_id])
         return response
 
     except HttpError as e:
         raise UploadError(f"YouTube API-Fehler beim Video-Ersatz:\n{e}")
+    finally:
+        video_file.close()
 
 
 def delete_video(video_id: str) -> None:
@@ -232,44 +421,52 @@ def delete_video(video_id: str) -> None:
     Raises:
         UploadError: Bei Authentifizierungs- oder API-Fehlern
     """
-    try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
-    except AuthError as e:
-        raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
+    youtube = _youtube_client()
 
     try:
-        youtube.videos().delete(id=video_id).execute()
+        execute_with_retry(youtube.videos().delete(id=video_id))
+        get_channel_inventory().remove([video_id])
+        forget_videos([video_id])
     except HttpError as e:
         raise UploadError(f"YouTube API-Fehler beim Löschen:\n{e}")
 
 
-def find_video_by_title(title: str, max_results: int = 50) -> Optional[Dict[str, Any]]:
+def load_duplicate_index() -> DuplicateIndex:
     """
-    Sucht ein Video anhand des exakten Titels.
+    Baut den Titel-Index für die Duplikat-Prüfung (einmal pro Batch).
 
-    Args:
-        title: Exakter Video-Titel
-        max_results: Maximale Anzahl Videos zum Durchsuchen
+    Synchronisiert vorher neue Uploads ins Kanal-Inventar. Schlägt der Sync fehl,
+    wird mit dem lokalen Inventar weitergearbeitet.
 
     Returns:
-        Video-Dict falls gefunden, sonst None
+        DuplicateIndex über alle bekannten Videos des Kanals
     """
     try:
-        youtube = create_youtube_client(CLIENT_SECRETS_PATH, TOKEN_PATH)
-    except AuthError as e:
-        raise UploadError(f"Authentifizierung fehlgeschlagen:\n{e}")
+        videos = fetch_uploaded_videos(refresh_existing=False)
+    except Exception as e:
+        # Auch Netzwerk-/Token-Fehler (Timeout, ServerNotFound, TransportError) dürfen den Batch nicht abbrechen
+        print(f"⚠ Kanal-Inventar konnte nicht synchronisiert werden, verwende Cache: {e}")
+        videos = cached_uploaded_videos()
+    return DuplicateIndex(videos)
 
-    try:
-        # Hole alle eigenen Videos
-        videos = fetch_uploaded_videos(max_results=max_results)
 
-        # Suche nach exaktem Titel-Match
-        for video in videos:
-            video_title = video.get("snippet", {}).get("title", "")
-            if video_title == title:
-                return video
+def find_video_by_title(title: str) -> Optional[Dict[str, Any]]:
+    """
+    Sucht ein Video anhand des exakten Titels im gesamten Kanal-Inventar.
+
+    Für viele Abfragen hintereinander load_duplicate_index() verwenden.
 
-        return None
+    Args:
+        title: Exakter Video-Titel
+
+    Returns:
+        Video-Dict falls gefunden, sonst None
+    """
+    try:
+        video_id = load_duplicate_index().find(title)
+        if not video_id:
+            return None
+        return get_channel_inventory().get_video(video_id)
 
     except Exception as e:
         raise UploadError(f"Fehler beim Suchen des Videos:\n{e}")
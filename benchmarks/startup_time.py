@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Startzeit-Benchmark für die Batch-GUI.
+
+Misst in frischen Python-Prozessen, wie lange `import app.gui_batch` dauert
+(alles, was vor dem ersten Frame geladen wird), und prüft, dass die schweren
+Module erst nach dem Start nachgeladen werden.
+
+Aufruf (im yt-upload-Environment, aus dem Projekt-Root):
+    python benchmarks/startup_time.py
+    python benchmarks/startup_time.py --runs 10 --module app.cli
+
+Exit-Code 1, wenn ein verzögertes Modul schon beim Start importiert wird.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Dürfen beim Start nicht geladen sein (siehe WARMUP_MODULES in app/gui_batch.py)
+DEFERRED_MODULES = [
+    "googleapiclient",
+    "google_auth_oauthlib",
+    "jsonschema",
+    "requests",
+    "app.auth",
+    "app.uploader",
+    "app.youtube_assets",
+    "app.asset_manager",
+    "app.quick_upload_dialog",
+    "app.factsheet_schema",
+    "app.thumbnail_picker",
+    "numpy",
+]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": sorted(sys.modules)}}))
+"""
+
+
+def measure_once(module: str) -> dict:
+    """Importiert das Modul in einem frischen Prozess und liefert Zeit + geladene Module."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Startzeit-Benchmark (Import bis zum ersten Frame)")
+    parser.add_argument("--runs", type=int, default=5, help="Anzahl Messungen (Default: 5)")
+    parser.add_argument("--module", default="app.gui_batch", help="Zu messendes Modul (Default: app.gui_batch)")
+    args = parser.parse_args()
+
+    # Erster Lauf wärmt Dateisystem-Cache und .pyc-Dateien an
+    measure_once(args.module)
+
+    timings = []
+    loaded = set()
+    for _ in range(max(1, args.runs)):
+        sample = measure_once(args.module)
+        timings.append(sample["seconds"])
+        loaded = set(sample["modules"])
+
+    print(f"Import {args.module}: Median {statistics.median(timings) * 1000:.0f} ms "
+          f"(min {min(timings) * 1000:.0f} ms, max {max(timings) * 1000:.0f} ms, {len(timings)} Läufe)")
+
+    eager = [name for name in DEFERRED_MODULES if name in loaded]
+    if eager:
+        print("✗ Beim Start geladen, sollte verzögert sein: " + ", ".join(eager))
+        return 1
+
+    print("✓ Google-Client, jsonschema, requests und Zusatzfenster werden erst nach dem Start geladen")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
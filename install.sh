@@ -38,12 +38,15 @@ install_python_deps() {
         pydantic
         jsonschema
         python-dotenv
-        google-api-python-client
+        # >= 2.0: Upload-Fortsetzung nutzt HttpRequest._in_error_state (geprüft mit 2.201.0, siehe app/uploader.py)
+        "google-api-python-client>=2.0"
         google-auth
         google-auth-oauthlib
         google-auth-httplib2
         pyyaml
         requests
+        watchdog
+        numpy
     )
     conda run -n "$ENV_NAME" pip install --upgrade "${packages[@]}"
 }